@@ -1,4 +1,8 @@
 from chilo_sls.apigateway.exception import ApiException
+from chilo_sls.apigateway.request import Request
+from chilo_sls.apigateway.response import Response
+from chilo_sls.common.json_helper import JsonHelper
+from chilo_sls.common.logger.log_sampler import LogSampler
 
 
 class ConfigValidator:
@@ -10,7 +14,10 @@ class ConfigValidator:
         ConfigValidator._validate_openapi_flags(kwargs)
         ConfigValidator._validate_cache(kwargs)
         ConfigValidator._validate_verbose(kwargs)
+        ConfigValidator._validate_log_buffer(kwargs)
+        ConfigValidator._validate_json_backend(kwargs)
         ConfigValidator._validate_hooks(kwargs)
+        ConfigValidator._validate_timeout(kwargs)
 
     @staticmethod
     def _validate_base_and_handlers(kwargs):
@@ -46,6 +53,50 @@ class ConfigValidator:
     def _validate_verbose(kwargs):
         if kwargs.get('verbose') and not isinstance(kwargs.get('verbose'), bool):
             raise ApiException(code=500, message='verbose should be a boolean')
+        sampling_error = LogSampler.validate(prefix='verbose_', **kwargs)
+        if sampling_error:
+            raise ApiException(code=500, message=sampling_error)
+        ConfigValidator._validate_log_fields(kwargs, 'log_request_fields', Request.LOG_FIELDS)
+        ConfigValidator._validate_log_fields(kwargs, 'log_response_fields', Response.LOG_FIELDS)
+        log_body_size = kwargs.get('log_body_size')
+        if log_body_size is not None and (not isinstance(log_body_size, int) or isinstance(log_body_size, bool) or log_body_size < 0):
+            raise ApiException(code=500, message='log_body_size should be a non-negative int (characters) or None (no truncation)')
+
+    @staticmethod
+    def _validate_log_fields(kwargs, key, available_fields):
+        fields = kwargs.get(key)
+        if fields is not None and (not isinstance(fields, (list, tuple)) or not set(fields) <= set(available_fields)):
+            raise ApiException(code=500, message=f'{key} should be a list of the following values: {", ".join(available_fields)}')
+
+    @staticmethod
+    def _validate_log_buffer(kwargs):
+        if kwargs.get('buffer_logs') and not isinstance(kwargs.get('buffer_logs'), bool):
+            raise ApiException(code=500, message='buffer_logs should be a boolean')
+        log_buffer_size = kwargs.get('log_buffer_size')
+        if log_buffer_size is not None and (not isinstance(log_buffer_size, int) or log_buffer_size < 1):
+            raise ApiException(code=500, message='log_buffer_size should be a positive int (bytes)')
+
+    @staticmethod
+    def _validate_json_backend(kwargs):
+        json_backend = kwargs.get('json_backend')
+        if json_backend is not None and json_backend not in JsonHelper.BACKENDS:
+            raise ApiException(code=500, message=f'json_backend should be one of the following values: {", ".join(JsonHelper.BACKENDS)}')
+        try:
+            JsonHelper.get_backend(json_backend)
+        except ValueError as error:
+            raise ApiException(code=500, message=str(error)) from error
+
+    @staticmethod
+    def _validate_timeout(kwargs):
+        for timeout_key in ('timeout', 'timeout_ms'):
+            timeout = kwargs.get(timeout_key)
+            if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0):
+                raise ApiException(code=500, message=f'{timeout_key} should be a positive number')
+        if kwargs.get('use_context_deadline') and not isinstance(kwargs.get('use_context_deadline'), bool):
+            raise ApiException(code=500, message='use_context_deadline should be a boolean')
+        deadline_buffer_ms = kwargs.get('deadline_buffer_ms')
+        if deadline_buffer_ms is not None and (not isinstance(deadline_buffer_ms, int) or isinstance(deadline_buffer_ms, bool) or deadline_buffer_ms < 0):
+            raise ApiException(code=500, message='deadline_buffer_ms should be a non-negative int')
 
     @staticmethod
     def _validate_hooks(kwargs):
@@ -1,3 +1,6 @@
+from chilo_sls.common.async_runner import AsyncRunner
+
+
 class Endpoint:
     def __init__(self, module, method):
         self.__method = getattr(module, method)
@@ -28,4 +31,4 @@ class Endpoint:
         return self.__requirements.get('required_route', '')
 
     def run(self, request, response):
-        return self.__method(request, response)
+        return AsyncRunner.run(self.__method(request, response))
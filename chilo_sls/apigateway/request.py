@@ -3,15 +3,26 @@ import urllib
 
 import xmltodict
 
+from chilo_sls.apigateway.exception import ApiTimeOutException
+from chilo_sls.common.deadline import Deadline
 from chilo_sls.common.json_helper import JsonHelper
+from chilo_sls.common.logger.log_payload import LogPayload
 
 
 class Request:
-
-    def __init__(self, event, lambda_context=None, timeout=None):
+    LOG_FIELDS = ('method', 'path', 'resource', 'route', 'headers', 'params', 'authorizer', 'context', 'body')
+    DEFAULT_LOG_FIELDS = ('method', 'path', 'resource', 'headers', 'params', 'body')
+    __slots__ = (
+        '__event', 'lambda_context', '__timeout', '__body', '__route', '__path_params', '__request_context',
+        '__domain', '__stage', '__context', '__parsers', '__headers', '__parsed', '__json_backend', '__deadline'
+    )
+
+    def __init__(self, event, lambda_context=None, timeout=None, json_backend=None):
         self.__event = event
         self.lambda_context = lambda_context
         self.__timeout = timeout
+        self.__json_backend = json_backend
+        self.__deadline = None
         self.__body = event['body'] if event.get('body') is not None else {}
         self.__route = event['path'] if event.get('path') is not None else ''
         self.__path_params = event['pathParameters'] if event.get('pathParameters') is not None else ''
@@ -19,6 +30,8 @@ class Request:
         self.__domain = event.get('requestContext', {}).get('domainName', '')
         self.__stage = event.get('requestContext', {}).get('stage', '')
         self.__context = {}
+        self.__headers = None
+        self.__parsed = {}
         self.__parsers = {
             'application/json': 'json',
             'application/graphql': 'graphql',
@@ -31,11 +44,12 @@ class Request:
 
     @property
     def cookies(self):
-        if self.__event.get('headers', {}).get('cookie'):
-            cookies = self.__event.get('headers', {}).get('cookie')
-        else:
-            cookies = ';'.join(self.__event.get('cookies', []))
-        return cookies
+        if 'cookies' not in self.__parsed:
+            if self.__event.get('headers', {}).get('cookie'):
+                self.__parsed['cookies'] = self.__event.get('headers', {}).get('cookie')
+            else:
+                self.__parsed['cookies'] = ';'.join(self.__event.get('cookies', []))
+        return self.__parsed['cookies']
 
     @property
     def protocol(self):
@@ -47,7 +61,9 @@ class Request:
 
     @property
     def content_type(self):
-        return self.headers.get('content-type', '').split(';')[0]
+        if 'content_type' not in self.__parsed:
+            self.__parsed['content_type'] = self.headers.get('content-type', '').split(';')[0]
+        return self.__parsed['content_type']
 
     @property
     def host_url(self):
@@ -102,39 +118,49 @@ class Request:
 
     @property
     def headers(self):
-        headers = {k.lower(): v for k, v in self.__event.get('headers', {}).items()}
-        return headers
+        if self.__headers is None:
+            self.__headers = {k.lower(): v for k, v in self.__event.get('headers', {}).items()}
+        return self.__headers
 
     @property
     def body(self):
-        try:
-            content_type = self.headers.get('content-type', '').split(';')[0]
-            parser = self.__parsers.get(content_type, 'raw')
-            return getattr(self, parser)
-        except Exception as error:
-            print(error)
-            return self.__body
+        if 'body' not in self.__parsed:
+            try:
+                parser = self.__parsers.get(self.content_type, 'raw')
+                self.__parsed['body'] = getattr(self, parser)
+            except Exception as error:
+                print(error)
+                self.__parsed['body'] = self.__body
+        return self.__parsed['body']
 
     @property
     def json(self):
-        return JsonHelper.decode(self.__body, True)
+        if 'json' not in self.__parsed:
+            self.__parsed['json'] = JsonHelper.decode(self.__body, True, self.__json_backend)
+        return self.__parsed['json']
 
     @property
     def form(self):
-        return dict(urllib.parse.parse_qsl(self.__body))
+        if 'form' not in self.__parsed:
+            self.__parsed['form'] = dict(urllib.parse.parse_qsl(self.__body))
+        return self.__parsed['form']
 
     @property
     def xml(self):
-        return xmltodict.parse(self.__body)
+        if 'xml' not in self.__parsed:
+            self.__parsed['xml'] = xmltodict.parse(self.__body)
+        return self.__parsed['xml']
 
     @property
     def graphql(self):
-        try:
-            request = base64.b64decode(self.__body).decode('utf-8')
-        except Exception as error:
-            print(error)
-            request = self.__body
-        return JsonHelper.decode(request)
+        if 'graphql' not in self.__parsed:
+            try:
+                request = base64.b64decode(self.__body).decode('utf-8')
+            except Exception as error:
+                print(error)
+                request = self.__body
+            self.__parsed['graphql'] = JsonHelper.decode(request, backend=self.__json_backend)
+        return self.__parsed['graphql']
 
     @property
     def raw(self):
@@ -156,9 +182,9 @@ class Request:
 
     @property
     def query_params(self):
-        if self.__event.get('queryStringParameters') is not None:
-            return self.__event['queryStringParameters']
-        return {}
+        if 'query_params' not in self.__parsed:
+            self.__parsed['query_params'] = self.__event['queryStringParameters'] if self.__event.get('queryStringParameters') is not None else {}
+        return self.__parsed['query_params']
 
     @property
     def path_params(self):
@@ -185,6 +211,20 @@ class Request:
     def timeout(self):
         return self.__timeout
 
+    @property
+    def deadline(self):
+        if self.__deadline is None:
+            self.__deadline = Deadline(timeout=self.__timeout, error=ApiTimeOutException)
+        return self.__deadline
+
+    @deadline.setter
+    def deadline(self, deadline):
+        self.__deadline = deadline
+
+    @property
+    def remaining_time_ms(self):
+        return self.deadline.remaining_ms
+
     @property
     def full(self):
         return {
@@ -197,8 +237,21 @@ class Request:
             'context': self.context
         }
 
+    def to_log_dict(self, fields=None, max_body_size=LogPayload.DEFAULT_MAX_BODY_SIZE):
+        return LogPayload.select({
+            'method': lambda: self.method,
+            'path': lambda: self.path,
+            'resource': lambda: self.resource,
+            'route': lambda: self.route,
+            'headers': lambda: self.headers,
+            'params': lambda: self.params,
+            'authorizer': lambda: self.authorizer,
+            'context': lambda: self.context,
+            'body': lambda: LogPayload.truncate(self.__body, max_body_size)
+        }, fields or self.DEFAULT_LOG_FIELDS)
+
     def clear_path_params(self):
         self.__path_params = {}
 
     def __str__(self):
-        return JsonHelper.encode(self.full)
+        return JsonHelper.encode(self.full, backend=self.__json_backend)
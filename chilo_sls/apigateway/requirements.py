@@ -1,41 +1,40 @@
 import inspect
-import signal
 
 from chilo_sls.apigateway.exception import ApiTimeOutException
+from chilo_sls.common.async_runner import AsyncRunner
+from chilo_sls.common.deadline import Deadline
 
 
 def requirements(**kwargs):
     def decorator_func(func):
 
-        def raise_timeout(*_):
-            raise ApiTimeOutException()
-
-        def start_timeout(timeout=None):
-            if kwargs.get('timeout') is not None or timeout is not None:
-                countdown = kwargs['timeout'] if kwargs.get('timeout') is not None else timeout
-                signal.signal(signal.SIGALRM, raise_timeout)
-                signal.alarm(countdown)
-
-        def end_timeout():
-            signal.alarm(0)
+        def get_deadline(request):
+            if kwargs.get('timeout') is None and kwargs.get('timeout_ms') is None and not kwargs.get('use_context_deadline'):
+                return request.deadline
+            request.deadline = Deadline(
+                timeout=kwargs.get('timeout'),
+                timeout_ms=kwargs.get('timeout_ms'),
+                context=request.lambda_context if kwargs.get('use_context_deadline') else None,
+                buffer_ms=kwargs.get('deadline_buffer_ms', Deadline.DEFAULT_BUFFER_MS),
+                error=ApiTimeOutException
+            )
+            return request.deadline
 
         def run_before(request, response):
             if kwargs.get('before') and callable(kwargs['before']):
-                kwargs['before'](request, response, kwargs)
+                AsyncRunner.run(kwargs['before'](request, response, kwargs))
 
         def run_after(request, response):
             if kwargs.get('after') and callable(kwargs['after']):
-                kwargs['after'](request, response, kwargs)
+                AsyncRunner.run(kwargs['after'](request, response, kwargs))
 
         def run_method(request, response):
             run_before(request, response)
-            start_timeout(request.timeout)
             if not response.has_errors and kwargs.get('data_class') and inspect.isclass(kwargs['data_class']):
                 data_class = kwargs['data_class'](request=request)
-                func(data_class, response)
+                get_deadline(request).run(func, data_class, response)
             elif not response.has_errors:
-                func(request, response)
-            end_timeout()
+                get_deadline(request).run(func, request, response)
             if not response.has_errors:
                 run_after(request, response)
             return response
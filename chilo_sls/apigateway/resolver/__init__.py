@@ -15,9 +15,11 @@ class Resolver:
     def cache_misses(self):
         return self.__cache_misses
 
-    def auto_load(self):
+    def auto_load(self, preload_handlers=False):
         if hasattr(self.__resolver, 'load_importer_files'):
             self.__resolver.load_importer_files()
+        if preload_handlers and hasattr(self.__resolver, 'preload_endpoint_modules'):
+            self.__resolver.preload_endpoint_modules()
 
     def get_endpoint(self, request):
         endpoint_module = self.__get_endpoint_module(request)
@@ -26,15 +28,22 @@ class Resolver:
         endpoint = Endpoint(endpoint_module, request.method)
         self.__assign_normalized_route(request, endpoint)
         self.__check_dynamic_route_and_apply_params(request, endpoint)
-        self.__cacher.put(request.path, endpoint_module, self.__resolver.has_dynamic_route, self.__resolver.dynamic_parts)
+        self.__cacher.put(
+            request.path,
+            endpoint_module,
+            self.__resolver.has_dynamic_route,
+            self.__resolver.dynamic_parts,
+            self.__resolver.route_template
+        )
         self.__resolver.reset()
         return endpoint
 
     def __get_endpoint_module(self, request):
-        cached = self.__cacher.get(request.path)
+        cached = self.__cacher.get(request.path, self.__resolver.get_request_route(request.path))
         endpoint_module = cached.get('endpoint')
         self.__resolver.has_dynamic_route = cached.get('is_dynamic_route', self.__resolver.has_dynamic_route)
         self.__resolver.dynamic_parts = cached.get('dynamic_parts', self.__resolver.dynamic_parts)
+        self.__resolver.route_template = cached.get('route_template', self.__resolver.route_template)
         if endpoint_module is None:
             self.__cache_misses += 1
             endpoint_module = self.__resolver.get_endpoint_module(request)
@@ -8,23 +8,63 @@ class ResolverCache:
 
     def __init__(self, **kwargs):
         self.__cache = OrderedDict()
+        self.__templates = {}
         self.__size = kwargs.get('cache_size', 128)
         self.__mode = kwargs.get('cache_mode', self.CACHE_ALL)
 
-    def get(self, method_path):
-        if method_path not in self.__cache:
-            return {}
-        self.__cache.move_to_end(method_path)
-        return self.__cache[method_path]
+    def get(self, method_path, route=None):
+        if method_path in self.__cache:
+            self.__cache.move_to_end(method_path)
+            return self.__cache[method_path]
+        if route is not None and self.__templates:
+            return self.__get_by_template(route.split('/'))
+        return {}
 
-    def put(self, route_path, endpoint, is_dynamic_route=False, dynamic_parts=None):
+    def put(self, route_path, endpoint, is_dynamic_route=False, dynamic_parts=None, route_template=None):
         if self.__size is None:
             return
         if is_dynamic_route and self.__mode == self.CACHE_STATIC:
             return
         if not is_dynamic_route and self.__mode == self.CACHE_DYNAMIC:
             return
-        self.__cache[route_path] = {'endpoint': endpoint, 'is_dynamic_route': is_dynamic_route, 'dynamic_parts': dynamic_parts}
-        self.__cache.move_to_end(route_path)
+        cache_key = route_path
+        if is_dynamic_route and route_template is not None:
+            cache_key = route_template
+            self.__templates.setdefault(len(route_template), set()).add(route_template)
+        self.__cache[cache_key] = {
+            'endpoint': endpoint,
+            'is_dynamic_route': is_dynamic_route,
+            'dynamic_parts': dynamic_parts,
+            'route_template': route_template
+        }
+        self.__cache.move_to_end(cache_key)
         if self.__size != 0 and len(self.__cache) > self.__size:
-            self.__cache.popitem(last=False)
+            evicted_key, _ = self.__cache.popitem(last=False)
+            self.__remove_template(evicted_key)
+
+    def __get_by_template(self, route_parts):
+        for route_template in self.__templates.get(len(route_parts), ()):
+            dynamic_parts = self.__match_template(route_template, route_parts)
+            if dynamic_parts is not None:
+                self.__cache.move_to_end(route_template)
+                cached = self.__cache[route_template]
+                return {**cached, 'dynamic_parts': dynamic_parts}
+        return {}
+
+    def __remove_template(self, cache_key):
+        if isinstance(cache_key, tuple):
+            self.__templates[len(cache_key)].discard(cache_key)
+
+    @staticmethod
+    def __match_template(route_template, route_parts):
+        dynamic_parts = {}
+        for index, template_part in enumerate(route_template):
+            route_part = route_parts[index].replace('-', '_')
+            if isinstance(template_part, str):
+                if route_part != template_part:
+                    return None
+            elif not route_part or route_part in template_part:
+                return None
+            else:
+                dynamic_parts[index] = route_parts[index]
+        return dynamic_parts
@@ -6,6 +6,7 @@ from chilo_sls.apigateway.exception import ApiException
 
 
 class ResolverImporter:
+    __modules = {}
 
     def __init__(self, **kwargs):
         self.__handlers = self.clean_path(kwargs['handlers'])
@@ -13,11 +14,19 @@ class ResolverImporter:
 
     @staticmethod
     def import_module_from_file(file_path, import_path):
-        spec = importlib.util.spec_from_file_location(import_path, file_path)
-        handler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(handler_module)
+        module_key = os.path.realpath(file_path)
+        handler_module = ResolverImporter.__modules.get(module_key)
+        if handler_module is None:
+            spec = importlib.util.spec_from_file_location(import_path, file_path)
+            handler_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(handler_module)
+            ResolverImporter.__modules[module_key] = handler_module
         return handler_module
 
+    @staticmethod
+    def clear_module_cache():
+        ResolverImporter.__modules.clear()
+
     @property
     def file_separator(self):
         return os.sep
@@ -0,0 +1,142 @@
+from chilo_sls.apigateway.exception import ApiException
+
+
+class RouteNode:
+
+    def __init__(self):
+        self.children = {}
+        self.static_parts = frozenset()
+        self.dynamic = None
+        self.init_route = None
+
+
+class RouteEntry:
+
+    def __init__(self, node=None, route=None):
+        self.node = node
+        self.route = route
+
+    @property
+    def is_directory(self):
+        return self.node is not None
+
+
+class RouteTable:
+
+    def __init__(self, **kwargs):
+        self.__root_directory = kwargs['root_directory']
+        self.__file_pattern = kwargs['file_pattern']
+        self.__file_separator = kwargs['file_separator']
+        self.__static_routes = {}
+        self.__file_routes = []
+        self.__root = None
+
+    @property
+    def is_compiled(self):
+        return self.__root is not None
+
+    @property
+    def static_routes(self):
+        return self.__static_routes
+
+    @property
+    def file_routes(self):
+        return self.__file_routes
+
+    def compile(self, file_tree):
+        self.__static_routes = {}
+        self.__file_routes = []
+        self.__root = self.__compile_node(file_tree, [])
+        self.__collect_static_routes(self.__root, [])
+
+    def lookup(self, route):
+        static_route = self.__static_routes.get(route.replace('-', '_'))
+        if static_route is not None:
+            return static_route, {}, None
+        return self.__walk(route.split('/'))
+
+    def __walk(self, route_parts):
+        node = self.__root
+        route = None
+        dynamic_parts = {}
+        route_template = []
+        last_index = len(route_parts) - 1
+        for index, dirty_part in enumerate(route_parts):
+            route_part = dirty_part.replace('-', '_')
+            if not route_part:
+                route = route or node.init_route
+                route_template = None
+                break
+            entry = node.children.get(route_part)
+            route_template.append(route_part)
+            if entry is None and node.dynamic is not None:
+                entry = node.dynamic
+                dynamic_parts[index] = dirty_part
+                route_template[index] = node.static_parts
+            if entry is None or (entry.is_directory and route is not None):
+                raise ApiException(code=404, message='route not found')
+            if entry.is_directory:
+                node = entry.node
+                route = entry.route if index == last_index else None
+            elif route is None:
+                route = entry.route
+        if route is None:
+            raise ApiException(code=404, message='route not found')
+        if not dynamic_parts or route_template is None:
+            return route, dynamic_parts, None
+        return route, dynamic_parts, tuple(route_template)
+
+    def __compile_node(self, file_tree, relative_path):
+        node = RouteNode()
+        directories = {key: value for key, value in file_tree.items() if isinstance(value, dict)}
+        files = [key for key, value in file_tree.items() if value == '*']
+        for directory, sub_tree in directories.items():
+            child_path = relative_path + [directory]
+            child_node = self.__compile_node(sub_tree, child_path)
+            index_route = self.__get_index_route(directory, sub_tree, child_path)
+            node.children[directory] = RouteEntry(node=child_node, route=index_route)
+        for file_name in files:
+            file_route = self.__build_route(relative_path + [file_name])
+            self.__file_routes.append(file_route)
+            node.children.setdefault(file_name, RouteEntry(route=file_route))
+        for file_name in files:
+            route_part = self.__get_route_part(file_name)
+            if route_part:
+                node.children.setdefault(route_part, node.children[file_name])
+        node.static_parts = frozenset(node.children)
+        if '__init__.py' in files:
+            node.init_route = node.children['__init__.py'].route
+        for dynamic_file in file_tree.get('__dynamic_files', []):
+            node.dynamic = node.children[dynamic_file]
+        return node
+
+    def __collect_static_routes(self, node, route_parts):
+        if not route_parts and node.init_route is not None:
+            self.__static_routes[''] = node.init_route
+        for route_part, entry in node.children.items():
+            child_parts = route_parts + [route_part]
+            if entry.route is not None:
+                self.__static_routes['/'.join(child_parts)] = entry.route
+            if entry.is_directory:
+                self.__collect_static_routes(entry.node, child_parts)
+
+    def __get_index_route(self, directory, sub_tree, relative_path):
+        index_file = self.__file_pattern.replace('*', directory)
+        if index_file in sub_tree:
+            return self.__build_route(relative_path + [index_file])
+        if '__init__.py' in sub_tree:
+            return self.__build_route(relative_path + ['__init__.py'])
+        return None
+
+    def __get_route_part(self, file_name):
+        if '*' not in self.__file_pattern:
+            return None
+        prefix, suffix = self.__file_pattern.split('*', 1)
+        if file_name.startswith(prefix) and file_name.endswith(suffix) and len(file_name) > len(prefix) + len(suffix):
+            return file_name[len(prefix):len(file_name) - len(suffix)]
+        return None
+
+    def __build_route(self, relative_path):
+        file_path = self.__root_directory + self.__file_separator + self.__file_separator.join(relative_path)
+        import_path = file_path.replace(self.__file_separator, '.').replace('.py', '')
+        return file_path, import_path
@@ -3,9 +3,12 @@ import gzip
 from io import BytesIO
 
 from chilo_sls.common.json_helper import JsonHelper
+from chilo_sls.common.logger.log_payload import LogPayload
 
 
 class Response:
+    LOG_FIELDS = ('statusCode', 'headers', 'hasErrors', 'isBase64Encoded', 'body')
+    DEFAULT_LOG_FIELDS = ('statusCode', 'hasErrors', 'body')
 
     def __init__(self, **kwargs):
         self.__code = 200
@@ -13,9 +16,13 @@ class Response:
         self.__cors = kwargs.get('cors', True)
         self.__base64_encoded = False
         self.__compress = False
+        self.__added_encoding = False
+        self.__caller_encoding = None
         self.__content_type = ''
         self.__headers = {}
         self.__body = {}
+        self.__encoded_body = None
+        self.__json_backend = kwargs.get('json_backend')
 
     @property
     def headers(self):
@@ -64,7 +71,16 @@ class Response:
 
     @compress.setter
     def compress(self, value):
+        if not value and self.__compress:
+            self.__base64_encoded = False
+            if self.__added_encoding and self.__caller_encoding is not None:
+                self.__headers['Content-Encoding'] = self.__caller_encoding
+            elif self.__added_encoding:
+                self.__headers.pop('Content-Encoding', None)
+            self.__added_encoding = False
+        self.__caller_encoding = None
         self.__compress = value
+        self.__encoded_body = None
 
     @property
     def code(self):
@@ -85,6 +101,7 @@ class Response:
     @is_json.setter
     def is_json(self, is_json):
         self.__is_json = is_json
+        self.__encoded_body = None
 
     @property
     def has_errors(self):
@@ -92,16 +109,15 @@ class Response:
 
     @property
     def body(self):
-        body = JsonHelper.encode(self.__body, raise_error=True) if self.is_json else self.__body
-        if self.compress:
-            return self.__compress_body(body)
-        if isinstance(self.__body, (dict, list, tuple)):
-            return body
-        return body
+        if self.__encoded_body is None:
+            body = JsonHelper.encode(self.__body, raise_error=True, backend=self.__json_backend) if self.is_json else self.__body
+            self.__encoded_body = self.__compress_body(body) if self.compress else body
+        return self.__encoded_body
 
     @body.setter
     def body(self, body):
         self.__body = body
+        self.__encoded_body = None
 
     @property
     def raw(self):
@@ -109,6 +125,8 @@ class Response:
 
     @property
     def full(self):
+        # the body may have been mutated in place (e.g. via raw) since it was last encoded
+        self.__encoded_body = None
         return {
             'body': self.body,
             'headers': self.headers,
@@ -116,14 +134,37 @@ class Response:
             'isBase64Encoded': self.base64_encoded
         }
 
+    def to_log_dict(self, fields=None, max_body_size=LogPayload.DEFAULT_MAX_BODY_SIZE):
+        return LogPayload.select({
+            'statusCode': lambda: self.code,
+            'headers': lambda: self.headers,
+            'hasErrors': lambda: self.has_errors,
+            'isBase64Encoded': lambda: self.base64_encoded,
+            'body': lambda: self.__get_log_body(max_body_size)
+        }, fields or self.DEFAULT_LOG_FIELDS)
+
     def set_error(self, key_path, message):
         error = {'key_path': key_path, 'message': message}
+        self.__encoded_body = None
         if isinstance(self.__body, dict) and 'errors' in self.__body:
             self.__body['errors'].append(error)
         else:
             self.__body = {'errors': [error]}
 
+    def __get_log_body(self, max_body_size):
+        if self.is_json and not self.compress:
+            try:
+                return LogPayload.truncate(self.body, max_body_size)
+            except Exception:
+                return LogPayload.truncate(str(self.__body), max_body_size)
+        if isinstance(self.__body, (str, bytes)):
+            return LogPayload.truncate(self.__body, max_body_size)
+        return LogPayload.truncate(JsonHelper.encode(self.__body, backend=self.__json_backend), max_body_size)
+
     def __compress_body(self, body):
+        if not self.__added_encoding:
+            self.__caller_encoding = self.__headers.get('Content-Encoding')
+            self.__added_encoding = True
         self.headers = ('Content-Encoding', 'gzip')
         self.__base64_encoded = True
         bytes_io = BytesIO()
@@ -136,14 +177,18 @@ class Response:
         self.__headers['Access-Control-Allow-Headers'] = '*'
 
     def __str__(self):
+        if self.is_json and not self.compress and isinstance(self.__body, (dict, list)):
+            body = self.__body
+        else:
+            body = JsonHelper.decode(self.body, backend=self.__json_backend)
         return str(
             {
                 'hasErrors': self.has_errors,
                 'response': {
-                    'headers': self.full['headers'],
-                    'statusCode': self.full['statusCode'],
-                    'isBase64Encoded': self.full['isBase64Encoded'],
-                    'body': JsonHelper.decode(self.full['body'])
+                    'headers': self.headers,
+                    'statusCode': self.code,
+                    'isBase64Encoded': self.base64_encoded,
+                    'body': body
                 }
             }
         )
@@ -6,8 +6,12 @@ from chilo_sls.apigateway.request import Request
 from chilo_sls.apigateway.resolver import Resolver
 from chilo_sls.apigateway.response import Response
 from chilo_sls.apigateway.config_validator import ConfigValidator
+from chilo_sls.common.async_runner import AsyncRunner
+from chilo_sls.common.deadline import Deadline
 from chilo_sls.common.validator import Validator
 from chilo_sls.common import logger
+from chilo_sls.common.logger.log_payload import LogPayload
+from chilo_sls.common.logger.log_sampler import LogSampler
 
 
 class Router:
@@ -23,31 +27,60 @@ class Router:
         self.__on_shutdown = tuple(kwargs.get('on_shutdown', []) or [])
         self.__cors = kwargs.get('cors', True)
         self.__timeout = kwargs.get('timeout', None)
+        self.__timeout_ms = kwargs.get('timeout_ms')
+        self.__use_context_deadline = kwargs.get('use_context_deadline', False)
+        self.__deadline_buffer_ms = kwargs.get('deadline_buffer_ms', Deadline.DEFAULT_BUFFER_MS)
+        self.__json_backend = kwargs.get('json_backend')
         self.__output_error = kwargs.get('output_error', False)
         self.__verbose = kwargs.get('verbose', False)
+        self.__log_request_fields = kwargs.get('log_request_fields')
+        self.__log_response_fields = kwargs.get('log_response_fields')
+        self.__log_body_size = kwargs.get('log_body_size', LogPayload.DEFAULT_MAX_BODY_SIZE)
+        self.__verbose_sampler = LogSampler(
+            sample_rate=kwargs.get('verbose_sample_rate', 1.0),
+            route_rates=kwargs.get('verbose_route_rates'),
+            rate_limit=kwargs.get('verbose_rate_limit'),
+            burst=kwargs.get('verbose_burst'),
+            always_on_error=kwargs.get('verbose_always_on_error', True)
+        )
+        self.__buffer_logs = kwargs.get('buffer_logs', False)
+        self.__log_buffer_size = kwargs.get('log_buffer_size')
         self.__openapi_validate_request = kwargs.get('openapi_validate_request', False)
         self.__openapi_validate_response = kwargs.get('openapi_validate_response', False)
         self.__resolver = Resolver(**kwargs)
         self.__validator = Validator(**kwargs)
         atexit.register(self.cooldown)
 
-    def auto_load(self):
-        self.__resolver.auto_load()
+    def auto_load(self, preload_handlers=False):
+        self.__resolver.auto_load(preload_handlers)
         self.__validator.auto_load()
 
     def warmup(self):
         for hook in self.__on_startup:
-            hook()
+            AsyncRunner.run(hook())
 
     def cooldown(self):
         for hook in self.__on_shutdown:
-            hook()
+            AsyncRunner.run(hook())
 
     def route(self, event, context):
-        request = Request(event, context, self.__timeout)
-        response = Response(cors=self.__cors)
+        with logger.buffered(self.__buffer_logs, self.__log_buffer_size):
+            return self.__route(event, context)
+
+    def __route(self, event, context):
+        request = Request(event, context, self.__timeout, json_backend=self.__json_backend)
+        request.deadline = Deadline(
+            timeout=self.__timeout,
+            timeout_ms=self.__timeout_ms,
+            context=context if self.__use_context_deadline else None,
+            buffer_ms=self.__deadline_buffer_ms,
+            error=ApiTimeOutException
+        )
+        response = Response(cors=self.__cors, json_backend=self.__json_backend)
+        sampled = self.__verbose and self.__verbose_sampler.should_log(request.resource, request.path)
         try:
-            self.__log_verbose(title='request-received', log={'request': request})
+            if sampled:
+                self.__log_verbose('request-received', request)
             self.__run_route_procedure(request, response)
         except ApiTimeOutException as timeout_error:
             kwargs = {'code': timeout_error.code, 'key_path': timeout_error.key_path, 'message': timeout_error.message, 'error': timeout_error}
@@ -59,8 +92,10 @@ class Router:
             output = str(error) if self.__output_error else 'internal service error'
             kwargs = {'code': 500, 'key_path': 'unknown', 'message': output, 'error': error}
             self.__handle_error(request, response, **kwargs)
-        self.__log_verbose(title='request-processed', log={'request': request, 'response': response})
-        return response.full
+        full_response = response.full
+        if sampled or (self.__verbose and response.has_errors and self.__verbose_sampler.should_log(error=True)):
+            self.__log_verbose('request-processed', request, response)
+        return full_response
 
     def __run_route_procedure(self, request, response):
         endpoint = self.__resolver.get_endpoint(request)
@@ -75,12 +110,12 @@ class Router:
 
     def __run_before_all(self, request, response, endpoint):
         if not response.has_errors and self.__before_all and callable(self.__before_all):
-            self.__before_all(request, response, endpoint.requirements)
+            AsyncRunner.run(self.__before_all(request, response, endpoint.requirements))
 
     def __run_when_auth_required(self, request, response, endpoint):
         if not response.has_errors and self.__when_auth_required and callable(self.__when_auth_required):
             if (self.__openapi_validate_request and self.__validator.request_has_security(request)) or endpoint.requires_auth:
-                self.__when_auth_required(request, response, endpoint.requirements)
+                AsyncRunner.run(self.__when_auth_required(request, response, endpoint.requirements))
 
     def __run_request_validation(self, request, response, endpoint):
         if not response.has_errors and self.__openapi_validate_request:
@@ -96,19 +131,24 @@ class Router:
 
     def __run_after_all(self, request, response, endpoint):
         if not response.has_errors and self.__after_all and callable(self.__after_all):
-            self.__after_all(request, response, endpoint.requirements)
+            AsyncRunner.run(self.__after_all(request, response, endpoint.requirements))
 
     def __handle_error(self, request, response, error_func=None, **kwargs):
         try:
             response.code = kwargs['code']
             response.set_error(key_path=kwargs['key_path'], message=kwargs['message'])
             if error_func and callable(error_func):
-                error_func(request, response, kwargs.get('error'))
+                AsyncRunner.run(error_func(request, response, kwargs.get('error')))
             else:
-                logger.log(level='ERROR', log={'request': request, 'response': response, 'error': kwargs})
+                logger.log(level='ERROR', log=lambda: {**self.__get_log_payload(request, response), 'error': kwargs})
         except Exception as exception:
             logging.exception(exception)
 
-    def __log_verbose(self, title, log):
-        if self.__verbose:
-            logger.log(level='INFO', log={'title': title, 'log': log})
+    def __log_verbose(self, title, request, response=None):
+        logger.log(level='INFO', log=lambda: {'title': title, 'log': self.__get_log_payload(request, response)})
+
+    def __get_log_payload(self, request, response=None):
+        payload = {'request': request.to_log_dict(self.__log_request_fields, self.__log_body_size)}
+        if response is not None:
+            payload['response'] = response.to_log_dict(self.__log_response_fields, self.__log_body_size)
+        return payload
@@ -1,8 +1,19 @@
-from chilo_sls.common.records.exception import RecordException
+import asyncio
+import collections
+import contextvars
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from chilo_sls.common import logger
+from chilo_sls.common.async_runner import AsyncRunner
+from chilo_sls.common.deadline import Deadline
+from chilo_sls.common.records.exception import EventException, RecordException
 from chilo_sls.base.no_data import NoDataClass
 from chilo_sls.base.placeholder import PlaceHolderRecord
 from chilo_sls.common.validator import Validator
 
+_FILTERED = object()
+
 
 class BaseRecordsEvent:
 
@@ -12,8 +23,10 @@ class BaseRecordsEvent:
         self._kwargs = kwargs
         self._records = []
         self._record_class = PlaceHolderRecord
+        self._stop_on_failure = False
+        self.__records = None
         self.__data_class = NoDataClass
-        self.__validator = Validator(**kwargs)
+        self.__validator = kwargs.get('_validator')
 
     @property
     def event(self):
@@ -36,6 +49,7 @@ class BaseRecordsEvent:
     @data_class.setter
     def data_class(self, data_class):
         self.__data_class = data_class
+        self.__records = None
 
     @property
     def data_classes(self):
@@ -43,37 +57,254 @@ class BaseRecordsEvent:
 
     @property
     def records(self):
-        self._records = [self._record_class(record) for record in self.raw_records]
-        self._validate_operations()
-        self._validate_record_body()
-        return self.data_classes if self.data_class is not None else self._records
-
-    def _validate_operations(self):
-        if not self._kwargs.get('operations'):
-            return
-        validated = []
-        for record in self._records:
-            if record.operation in self._kwargs['operations']:
-                validated.append(record)
-            elif self._kwargs.get('raise_operation_error'):
-                raise RecordException(record=record, message=f'record did not meet operation requirement; required: {self._kwargs["operations"]}, received: {record.operation}')
-        self._reset_records(validated)
-
-    def _validate_record_body(self):
+        if self._kwargs.get('stream'):
+            return self.iter_records()
+        if self.__records is None:
+            self._materialize_records()
+            self.__records = self.data_classes if self.data_class is not None else self._records
+        return self.__records
+
+    def iter_records(self):
+        for record in self._iter_validated_records():
+            yield self.data_class(record=record) if self.data_class is not None else record
+
+    def process_records(self, func):
+        self.__validate_concurrency()
+        if inspect.iscoroutinefunction(func):
+            return AsyncRunner.run(self.aprocess_records(func))
+        if (self._kwargs.get('concurrency') or 1) > 1:
+            outcomes = self.__process_concurrently(func)
+        else:
+            outcomes = self.__process_sequentially(func)
+        return self.__get_process_results(outcomes)
+
+    async def aprocess_records(self, func):
+        self.__validate_concurrency()
+        semaphore = asyncio.Semaphore(self._kwargs.get('concurrency') or 1)
+        if (self._kwargs.get('concurrency') or 1) > 1:
+            grouped = await asyncio.gather(*[self.__aprocess_group(group, func, semaphore) for group in self.__group_records()])
+            indexed_outcomes = [indexed for group in grouped for indexed in group]
+            outcomes = [outcome for _, outcome in sorted(indexed_outcomes, key=lambda indexed: indexed[0])]
+        else:
+            outcomes = await self.__aprocess_sequentially(func, semaphore)
+        return self.__get_process_results(outcomes)
+
+    async def aiter_records(self, prefetch=None):
+        limit = prefetch or self._kwargs.get('concurrency') or 1
+        loop = asyncio.get_running_loop()
+        pending = collections.deque()
+        try:
+            for record in self._iter_built_records():
+                if not self._validate_operation(record) or not self._filter_record(record):
+                    continue
+                pending.append(loop.run_in_executor(None, contextvars.copy_context().run, self.__prepare_validated_record, record))
+                if len(pending) >= limit:
+                    record = await pending.popleft()
+                    if record is not _FILTERED:
+                        yield self.data_class(record=record) if self.data_class is not None else record
+            while pending:
+                record = await pending.popleft()
+                if record is not _FILTERED:
+                    yield self.data_class(record=record) if self.data_class is not None else record
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def __prepare_validated_record(self, record):
+        self._prepare_record(record)
+        return record if self._validate_body(record) else _FILTERED
+
+    def __validate_concurrency(self):
+        if self._stop_on_failure and (self._kwargs.get('concurrency') or 1) > 1 and not self._kwargs.get('preserve_order'):
+            raise EventException(message='concurrency requires preserve_order for ordered stream sources (kinesis, dynamodb)')
+
+    def __process_sequentially(self, func):
+        outcomes = []
+        failed_keys = set()
+        for record in self._iter_built_records():
+            Deadline.check_current()
+            if record.ordering_key is not None and record.ordering_key in failed_keys:
+                outcomes.append(self.__get_skipped_outcome(record))
+                continue
+            outcome = self.__process_outcome(record, func)
+            outcomes.append(outcome)
+            if outcome[2] is not None and (self._stop_on_failure or not self._kwargs.get('batch_item_failures')):
+                break
+            if outcome[2] is not None and record.ordering_key is not None:
+                failed_keys.add(record.ordering_key)
+        return outcomes
+
+    def __process_concurrently(self, func):
+        executor = ThreadPoolExecutor(max_workers=self._kwargs['concurrency'])
+        futures = []
+        try:
+            futures = [executor.submit(contextvars.copy_context().run, self.__process_group, group, func) for group in self.__group_records()]
+            indexed_outcomes = [indexed for future in futures for indexed in future.result()]
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return [outcome for _, outcome in sorted(indexed_outcomes, key=lambda indexed: indexed[0])]
+
+    def __group_records(self):
+        groups = {}
+        for index, record in enumerate(self._iter_built_records()):
+            ordering_key = record.ordering_key if self._kwargs.get('preserve_order') else None
+            group_key = ordering_key if ordering_key is not None else ('record', index)
+            groups.setdefault(group_key, []).append((index, record))
+        return list(groups.values())
+
+    def __process_group(self, group, func):
+        outcomes = []
+        failed = False
+        for index, record in group:
+            if failed:
+                outcomes.append((index, self.__get_skipped_outcome(record)))
+                continue
+            Deadline.check_current()
+            outcome = self.__process_outcome(record, func)
+            failed = outcome[2] is not None
+            outcomes.append((index, outcome))
+        return outcomes
+
+    async def __aprocess_sequentially(self, func, semaphore):
+        outcomes = []
+        failed_keys = set()
+        for record in self._iter_built_records():
+            if record.ordering_key is not None and record.ordering_key in failed_keys:
+                outcomes.append(self.__get_skipped_outcome(record))
+                continue
+            outcome = await self.__aprocess_outcome(record, func, semaphore)
+            outcomes.append(outcome)
+            if outcome[2] is not None and (self._stop_on_failure or not self._kwargs.get('batch_item_failures')):
+                break
+            if outcome[2] is not None and record.ordering_key is not None:
+                failed_keys.add(record.ordering_key)
+        return outcomes
+
+    async def __aprocess_group(self, group, func, semaphore):
+        outcomes = []
+        failed = False
+        for index, record in group:
+            if failed:
+                outcomes.append((index, self.__get_skipped_outcome(record)))
+                continue
+            outcome = await self.__aprocess_outcome(record, func, semaphore)
+            failed = outcome[2] is not None
+            outcomes.append((index, outcome))
+        return outcomes
+
+    @staticmethod
+    def __get_skipped_outcome(record):
+        error = RecordException(record=record, message='record skipped; earlier record with the same ordering key failed')
+        return record, _FILTERED, error
+
+    async def __aprocess_outcome(self, record, func, semaphore):
+        async with semaphore:
+            try:
+                result = self._process_record(record, func)
+                if inspect.isawaitable(result):
+                    result = await result
+                return record, result, None
+            except Exception as error:
+                self.__raise_if_expired(error)
+                self.__log_failure(record, error)
+                return record, _FILTERED, error
+
+    def __process_outcome(self, record, func):
+        try:
+            return record, self._process_record(record, func), None
+        except Exception as error:
+            self.__raise_if_expired(error)
+            self.__log_failure(record, error)
+            return record, _FILTERED, error
+
+    @staticmethod
+    def __raise_if_expired(error):
+        # a timeout fails the whole batch; it is not a per-record failure
+        deadline = Deadline.current()
+        if deadline is not None and deadline.is_expired:
+            raise error
+
+    def __log_failure(self, record, error):
+        if self._kwargs.get('batch_item_failures'):
+            logger.log(level='ERROR', log=lambda: {'message': 'record failed', 'item_identifier': record.item_identifier, 'error': repr(error)})
+
+    def __get_process_results(self, outcomes):
+        if self._kwargs.get('batch_item_failures'):
+            return self.__get_batch_item_failures(outcomes)
+        for _, _, error in outcomes:
+            if error is not None:
+                raise error
+        return [result for _, result, _ in outcomes if result is not _FILTERED]
+
+    @staticmethod
+    def __get_batch_item_failures(outcomes):
+        failures = []
+        for record, _, error in outcomes:
+            if error is None:
+                continue
+            if record.item_identifier is None:
+                raise error
+            failures.append({'itemIdentifier': record.item_identifier})
+        return {'batchItemFailures': failures}
+
+    def refresh(self):
+        self.__records = None
+        return self.records
+
+    def _materialize_records(self):
+        self._records = list(self._iter_validated_records())
+
+    def _iter_validated_records(self):
+        for record in self._iter_built_records():
+            if not self._validate_operation(record) or not self._filter_record(record):
+                continue
+            self._prepare_record(record)
+            if self._validate_body(record):
+                yield record
+
+    def _process_record(self, record, func):
+        if not self._validate_operation(record) or not self._filter_record(record):
+            return _FILTERED
+        self._prepare_record(record)
+        if not self._validate_body(record):
+            return _FILTERED
+        return func(self.data_class(record=record) if self.data_class is not None else record)
+
+    def _iter_built_records(self):
+        json_backend = self._kwargs.get('json_backend')
+        for raw_record in self._iter_raw_records():
+            yield self._record_class(raw_record, json_backend)
+
+    def _iter_raw_records(self):
+        return iter(self.raw_records)
+
+    def _filter_record(self, record):
+        return True
+
+    def _prepare_record(self, record):
+        pass
+
+    def _validate_operation(self, record):
+        if not self._kwargs.get('operations') or record.operation in self._kwargs['operations']:
+            return True
+        if self._kwargs.get('raise_operation_error'):
+            raise RecordException(record=record, message=f'record did not meet operation requirement; required: {self._kwargs["operations"]}, received: {record.operation}')
+        return False
+
+    def _validate_body(self, record):
         if not self._kwargs.get('required_body'):
-            return
-        validated = []
-        for record in self._records:
-            errors = self.__validator.validate_record_body(record.body, self._kwargs.get('required_body'))
-            if len(errors) != 0 and self._kwargs.get('raise_body_error'):
-                raise RecordException(record=record, message=f'record did not meet body requirement; errors: {errors}')
-            if len(errors) == 0:
-                validated.append(record)
-        self._reset_records(validated)
-
-    def _reset_records(self, validated):
-        self._records.clear()
-        self._records = validated
+            return True
+        errors = self._get_body_errors(record.body)
+        if len(errors) != 0 and self._kwargs.get('raise_body_error'):
+            raise RecordException(record=record, message=f'record did not meet body requirement; errors: {errors}')
+        return len(errors) == 0
+
+    def _get_body_errors(self, body):
+        if self.__validator is None:
+            self.__validator = Validator(**self._kwargs)
+        return self.__validator.validate_record_body(body, self._kwargs.get('required_body'))
 
     def __str__(self):
         return str([str(record) for record in self.records])
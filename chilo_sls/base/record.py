@@ -1,17 +1,23 @@
 import abc
+import base64
+
+from chilo_sls.common.json_helper import JsonHelper
 
 
 class BaseRecord(abc.ABC):
+    __slots__ = ('valid', '_body', '_record', '_json_backend', '_attributes', '_decoded')
     CREATED = 'created'
     UPDATED = 'updated'
     DELETED = 'deleted'
     UNKNOWN = 'unknown'
 
-    def __init__(self, record):
+    def __init__(self, record, json_backend=None):
         self.valid = True
         self._body = None
         self._record = record
+        self._json_backend = json_backend
         self._attributes = {}
+        self._decoded = {}
 
     @property
     @abc.abstractmethod
@@ -22,3 +28,23 @@ class BaseRecord(abc.ABC):
     @abc.abstractmethod
     def operation(self):
         raise NotImplementedError
+
+    @property
+    def item_identifier(self):
+        return None
+
+    @property
+    def ordering_key(self):
+        return None
+
+    def _get_raw_bytes(self, key, encoded):
+        raw_key = ('raw', key)
+        if raw_key not in self._decoded:
+            self._decoded[raw_key] = base64.b64decode(encoded)
+        return self._decoded[raw_key]
+
+    def _get_decoded_json(self, key, encoded):
+        if key not in self._decoded:
+            b64_decoded = self._get_raw_bytes(key, encoded).decode('utf-8')
+            self._decoded[key] = JsonHelper.decode(b64_decoded, backend=self._json_backend)
+        return self._decoded[key]
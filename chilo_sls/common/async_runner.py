@@ -0,0 +1,21 @@
+import asyncio
+import inspect
+import threading
+
+
+class AsyncRunner:
+    __local = threading.local()
+
+    @staticmethod
+    def get_loop():
+        loop = getattr(AsyncRunner.__local, 'loop', None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            AsyncRunner.__local.loop = loop
+        return loop
+
+    @staticmethod
+    def run(result):
+        if not inspect.isawaitable(result):
+            return result
+        return AsyncRunner.get_loop().run_until_complete(result)
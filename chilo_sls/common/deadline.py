@@ -0,0 +1,114 @@
+import asyncio
+import contextvars
+import inspect
+import signal
+import threading
+import time
+
+from chilo_sls.common.async_runner import AsyncRunner
+
+
+class Deadline:
+    DEFAULT_BUFFER_MS = 100
+    __current = contextvars.ContextVar('chilo_sls_deadline', default=None)
+
+    def __init__(self, **kwargs):
+        self.__error = kwargs.get('error', TimeoutError)
+        budgets_ms = []
+        if kwargs.get('timeout') is not None:
+            budgets_ms.append(kwargs['timeout'] * 1000)
+        if kwargs.get('timeout_ms') is not None:
+            budgets_ms.append(kwargs['timeout_ms'])
+        context_ms = self.get_context_remaining_ms(kwargs.get('context'))
+        if context_ms is not None:
+            budgets_ms.append(max(0, context_ms - kwargs.get('buffer_ms', self.DEFAULT_BUFFER_MS)))
+        self.__expires_at = time.monotonic() + min(budgets_ms) / 1000 if budgets_ms else None
+
+    @property
+    def has_deadline(self):
+        return self.__expires_at is not None
+
+    @property
+    def remaining_ms(self):
+        if self.__expires_at is None:
+            return None
+        return max(0, int((self.__expires_at - time.monotonic()) * 1000))
+
+    @property
+    def remaining_seconds(self):
+        if self.__expires_at is None:
+            return None
+        return max(0.0, self.__expires_at - time.monotonic())
+
+    @property
+    def is_expired(self):
+        return self.__expires_at is not None and time.monotonic() >= self.__expires_at
+
+    @staticmethod
+    def current():
+        return Deadline.__current.get()
+
+    @staticmethod
+    def get_context_remaining_ms(context):
+        get_remaining = getattr(context, 'get_remaining_time_in_millis', None)
+        if not callable(get_remaining):
+            return None
+        try:
+            return int(get_remaining())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def check_current():
+        deadline = Deadline.current()
+        if deadline is not None:
+            deadline.check()
+
+    def check(self):
+        if self.is_expired:
+            raise self.__error()
+
+    def run(self, func, *args):
+        token = Deadline.__current.set(self)
+        try:
+            if self.__expires_at is None:
+                return AsyncRunner.run(func(*args))
+            self.check()
+            if inspect.iscoroutinefunction(func):
+                return AsyncRunner.run(self.__wait_for(func(*args)))
+            result = self.__run_sync(func, args)
+            if inspect.isawaitable(result):
+                return AsyncRunner.run(self.__wait_for(result))
+            return result
+        finally:
+            Deadline.__current.reset(token)
+
+    async def __wait_for(self, awaitable):
+        try:
+            return await asyncio.wait_for(awaitable, self.remaining_seconds)
+        except asyncio.TimeoutError as error:
+            raise self.__error() from error
+
+    def __run_sync(self, func, args):
+        if threading.current_thread() is not threading.main_thread() or not hasattr(signal, 'setitimer'):
+            result = func(*args)
+            if not inspect.isawaitable(result):
+                self.check()
+            return result
+        armed = [True]
+
+        def raise_timeout(*_):
+            if armed[0]:
+                raise self.__error()
+
+        started = time.monotonic()
+        previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+        previous_delay, previous_interval = signal.setitimer(signal.ITIMER_REAL, max(self.remaining_seconds, 0.001))
+        try:
+            return func(*args)
+        finally:
+            armed[0] = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler if previous_handler is not None else signal.SIG_DFL)
+            if previous_delay > 0:
+                signal.setitimer(signal.ITIMER_REAL, max(previous_delay - (time.monotonic() - started), 0.001), previous_interval)
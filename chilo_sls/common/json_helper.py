@@ -1,21 +1,117 @@
-import simplejson as json
+import decimal
+import json as std_json
+
+import simplejson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+# json/orjson/ujson have no decimal type: integral Decimals become ints and fractional ones become
+# floats, which can lose precision. Use the default simplejson backend when exact decimals matter.
+def _encode_default(value):
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class SimpleJsonBackend:
+    name = 'simplejson'
+
+    @staticmethod
+    def decode(data):
+        return simplejson.loads(data, use_decimal=True)
+
+    @staticmethod
+    def encode(data):
+        return simplejson.dumps(data, use_decimal=True)
+
+
+class StdJsonBackend:
+    name = 'json'
+
+    @staticmethod
+    def decode(data):
+        return std_json.loads(data)
+
+    @staticmethod
+    def encode(data):
+        return std_json.dumps(data, default=_encode_default)
+
+
+class OrJsonBackend:
+    name = 'orjson'
+
+    @staticmethod
+    def decode(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def encode(data):
+        return orjson.dumps(data, default=_encode_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+class UJsonBackend:
+    name = 'ujson'
+
+    @staticmethod
+    def decode(data):
+        return ujson.loads(data)
+
+    @staticmethod
+    def encode(data):
+        return ujson.dumps(data, default=_encode_default, escape_forward_slashes=False)
 
 
 class JsonHelper:
+    DECIMAL = 'simplejson'
+    FAST = 'fast'
+    BACKENDS = ('simplejson', 'json', 'orjson', 'ujson', 'fast')
+    __backends = {
+        'simplejson': SimpleJsonBackend,
+        'json': StdJsonBackend,
+        'orjson': OrJsonBackend if orjson is not None else None,
+        'ujson': UJsonBackend if ujson is not None else None
+    }
+    __backends['fast'] = __backends['orjson'] or __backends['ujson'] or SimpleJsonBackend
+    __default_backend = SimpleJsonBackend
+
+    @staticmethod
+    def get_backend(backend=None):
+        if backend is None:
+            return JsonHelper.__default_backend
+        if backend not in JsonHelper.__backends:
+            raise ValueError(f'json_backend must be one of {", ".join(JsonHelper.BACKENDS)}; received: {backend}')
+        if JsonHelper.__backends[backend] is None:
+            raise ValueError(f'json_backend {backend} requires the {backend} package to be installed')
+        return JsonHelper.__backends[backend]
+
+    @staticmethod
+    def set_default_backend(backend=DECIMAL):
+        JsonHelper.__default_backend = JsonHelper.get_backend(backend)
 
     @staticmethod
-    def decode(data, raise_error=False):
+    def decode(data, raise_error=False, backend=None):
+        json_backend = JsonHelper.get_backend(backend)
         try:
-            return json.loads(data, use_decimal=True)
+            return json_backend.decode(data)
         except Exception as error:
             if raise_error:
                 raise error
             return data
 
     @staticmethod
-    def encode(data, raise_error=False):
+    def encode(data, raise_error=False, backend=None):
+        json_backend = JsonHelper.get_backend(backend)
         try:
-            return json.dumps(data, use_decimal=True)
+            return json_backend.encode(data)
         except Exception as error:
             if raise_error:
                 raise error
@@ -1,3 +1,4 @@
+import contextlib
 import logging
 
 from chilo_sls.common.logger.common_logger import CommonLogger
@@ -5,7 +6,16 @@ from chilo_sls.common.logger.common_logger import CommonLogger
 
 def log(**kwargs):
     try:
-        logger = CommonLogger()
-        logger.log(**kwargs)
+        CommonLogger.get_logger().log(**kwargs)
     except Exception as exception:
         logging.exception(exception)
+
+
+@contextlib.contextmanager
+def buffered(enabled=True, max_bytes=None):
+    started = enabled and CommonLogger.start_buffer(max_bytes)
+    try:
+        yield
+    finally:
+        if started:
+            CommonLogger.end_buffer()
@@ -1,19 +1,27 @@
 import datetime
+import inspect
 import os
+import sys
 import traceback
 
 import jsonpickle
 
+from chilo_sls.common.json_helper import JsonHelper
+from chilo_sls.common.logger.log_buffer import LogBuffer
+from chilo_sls.common.logger.log_payload import LogPayload
+
+jsonpickle.set_encoder_options('simplejson', use_decimal=True)
+jsonpickle.set_preferred_backend('simplejson')
+
 
 class CommonLogger:
+    __logger = None
+    __buffer = None
 
-    def __init__(self):
-        self.__json = jsonpickle
-        env_format = os.getenv('LOG_FORMAT', 'JSON') or 'JSON'
+    def __init__(self, log_format=None, log_level=None):
+        env_format = log_format if log_format is not None else os.getenv('LOG_FORMAT', 'JSON') or 'JSON'
         self.__format = env_format.strip().upper()
-        self.__log_level = os.getenv('LOG_LEVEL', 'INFO')
-        self.__json.set_encoder_options('simplejson', use_decimal=True)
-        self.__json.set_preferred_backend('simplejson')
+        self.__log_level = log_level if log_level is not None else os.getenv('LOG_LEVEL', 'INFO')
         self.log_levels = {
             'INFO': 1,
             'WARN': 2,
@@ -22,39 +30,83 @@ class CommonLogger:
         if self.__format not in ['JSON', 'INLINE']:
             raise ValueError(f'LOG_FORMAT ENV must be either `JSON` or `INLINE`, recieved: {self.__format}')
 
+    @staticmethod
+    def get_logger():
+        # LOG_FORMAT and LOG_LEVEL are read once per process; call reset() after changing them
+        if CommonLogger.__logger is None:
+            CommonLogger.__logger = CommonLogger()
+        return CommonLogger.__logger
+
+    @staticmethod
+    def reset():
+        CommonLogger.__logger = None
+
+    @staticmethod
+    def start_buffer(max_bytes=None):
+        if CommonLogger.__buffer is not None:
+            return False
+        CommonLogger.__buffer = LogBuffer(max_bytes)
+        return True
+
+    @staticmethod
+    def flush_buffer():
+        if CommonLogger.__buffer is not None:
+            CommonLogger.__buffer.flush()
+
+    @staticmethod
+    def end_buffer():
+        log_buffer = CommonLogger.__buffer
+        CommonLogger.__buffer = None
+        if log_buffer is not None:
+            log_buffer.flush()
+
+    def is_enabled(self, level):
+        return self.log_levels[level] >= self.log_levels[self.__log_level]
+
     def log(self, **kwargs):
-        default_log = {'level': kwargs.get('level', 'INFO'), 'log': kwargs.get('log', {})}
-        if self.__should_log(default_log['level']) and self.__format == 'JSON':
-            self.__log_json(**kwargs)
-        elif self.__should_log(default_log['level']) and self.__format == 'INLINE':
-            self.__log_inline(**kwargs)
-
-    def __get_traceback(self):
-        trace = traceback.format_exc()
-        if str(trace) != 'NoneType: None\n':
-            return trace
-        return ''
-
-    def __should_log(self, level):
-        current_log_level = self.log_levels[level]
-        log_level_setting = self.log_levels[self.__log_level]
-        return current_log_level >= log_level_setting
-
-    def __log_json(self, **kwargs):
-        print(self.__json.encode({
-            'level': kwargs['level'],
+        level = kwargs.get('level', 'INFO')
+        if not self.is_enabled(level):
+            return
+        log_value = kwargs.get('log', {})
+        if inspect.isfunction(log_value) or inspect.ismethod(log_value):
+            log_value = log_value()
+        log_value = LogPayload.prepare(log_value)
+        if self.__format == 'JSON':
+            self.__log_json(level, log_value)
+        else:
+            self.__log_inline(level, log_value)
+
+    @staticmethod
+    def __get_traceback():
+        if sys.exc_info()[0] is None:
+            return ''
+        return traceback.format_exc()
+
+    @staticmethod
+    def __emit(line):
+        if CommonLogger.__buffer is not None:
+            CommonLogger.__buffer.write(line)
+        else:
+            print(line)
+
+    def __log_json(self, level, log_value):
+        entry = {
+            'level': level,
             'time': datetime.datetime.now(datetime.timezone.utc).isoformat(),
             'trace': [trace.strip() for trace in self.__get_traceback().split('\n') if trace],
-            'log': kwargs['log']
-        }, indent=4))
+            'log': log_value
+        }
+        try:
+            self.__emit(JsonHelper.encode(entry, raise_error=True))
+        except (TypeError, ValueError):
+            self.__emit(jsonpickle.encode(entry))
 
-    def __log_inline(self, **kwargs):
+    def __log_inline(self, level, log_value):
         timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
         trace = self.__get_traceback().strip().replace('\n', ' | ')
-        log_value = kwargs['log']
         if not isinstance(log_value, str):
             log_value = str(log_value)
-        inline_message = f"{kwargs['level']}|time={timestamp} log={log_value}"
+        inline_message = f"{level}|time={timestamp} log={log_value}"
         if trace:
             inline_message = f"{inline_message} trace={trace}"
-        print(inline_message)
+        self.__emit(inline_message)
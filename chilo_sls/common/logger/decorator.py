@@ -1,18 +1,29 @@
 from chilo_sls.common import logger
+from chilo_sls.common.logger.log_sampler import LogSampler
 
 
 def log(**settings):
+    error_message = LogSampler.validate(**settings)
+    if error_message:
+        raise ValueError(error_message)
+    sampler = LogSampler(**settings)
+    log_errors = settings.get('always_on_error', False)
+
     def decorator_func(func):
-        captured = {'arguments': {}, 'result': None}
 
         def run_func(*args, **kwargs):
-            captured['arguments']['args'] = list(args)
-            captured['arguments']['kwargs'] = kwargs
-            captured['result'] = func(*args, **kwargs)
+            captured = {'arguments': {'args': list(args), 'kwargs': kwargs}, 'result': None}
+            try:
+                captured['result'] = func(*args, **kwargs)
+            except Exception as error:
+                if log_errors and sampler.should_log(error=True):
+                    captured['error'] = error
+                    logger.log(level='ERROR', log=captured)
+                raise
             if settings.get('condition') and callable(settings['condition']):
-                if settings['condition'](*args, **kwargs):
+                if settings['condition'](*args, **kwargs) and sampler.should_log():
                     logger.log(level=settings.get('level', 'INFO'), log=captured)
-            else:
+            elif sampler.should_log():
                 logger.log(level=settings.get('level', 'INFO'), log=captured)
             return captured['result']
 
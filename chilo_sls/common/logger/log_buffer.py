@@ -0,0 +1,33 @@
+import sys
+import threading
+
+
+class LogBuffer:
+    DEFAULT_MAX_BYTES = 262144
+
+    def __init__(self, max_bytes=None):
+        self.__max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.__lines = []
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self.__size
+
+    def write(self, line):
+        with self.__lock:
+            self.__lines.append(line)
+            self.__size += len(line) + 1
+            should_flush = self.__size >= self.__max_bytes
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        with self.__lock:
+            lines = self.__lines
+            self.__lines = []
+            self.__size = 0
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
@@ -0,0 +1,24 @@
+class LogPayload:
+    DEFAULT_MAX_BODY_SIZE = 2048
+
+    @staticmethod
+    def prepare(value):
+        if hasattr(value, 'to_log_dict'):
+            return value.to_log_dict()
+        if isinstance(value, dict):
+            return {key: LogPayload.prepare(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [LogPayload.prepare(item) for item in value]
+        return value
+
+    @staticmethod
+    def truncate(value, max_size=DEFAULT_MAX_BODY_SIZE):
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='replace')
+        if max_size is None or not isinstance(value, str) or len(value) <= max_size:
+            return value
+        return f'{value[:max_size]}...[truncated {len(value) - max_size} chars]'
+
+    @staticmethod
+    def select(values, fields):
+        return {field: values[field]() for field in fields if field in values}
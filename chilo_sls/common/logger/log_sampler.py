@@ -0,0 +1,82 @@
+import random
+import threading
+import time
+
+
+class TokenBucket:
+
+    def __init__(self, rate, burst=None):
+        self.__rate = float(rate)
+        self.__capacity = float(burst if burst is not None else max(1.0, self.__rate))
+        self.__tokens = self.__capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self.__tokens
+
+    def consume(self, tokens=1):
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            if self.__tokens < tokens:
+                return False
+            self.__tokens -= tokens
+            return True
+
+
+class LogSampler:
+
+    def __init__(self, **kwargs):
+        self.__sample_rate = kwargs.get('sample_rate', 1.0)
+        self.__route_rates = kwargs.get('route_rates') or {}
+        self.__always_on_error = kwargs.get('always_on_error', True)
+        rate_limit = kwargs.get('rate_limit')
+        self.__bucket = TokenBucket(rate_limit, kwargs.get('burst')) if rate_limit is not None else None
+
+    @property
+    def always_on_error(self):
+        return self.__always_on_error
+
+    def get_rate(self, *keys):
+        for key in keys:
+            if key in self.__route_rates:
+                return self.__route_rates[key]
+        return self.__sample_rate
+
+    def should_log(self, *keys, error=False):
+        if error and self.__always_on_error:
+            return True
+        rate = self.get_rate(*keys)
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return False
+        return self.__bucket is None or self.__bucket.consume()
+
+    @staticmethod
+    def validate(prefix='', **kwargs):
+        sample_rate = kwargs.get(f'{prefix}sample_rate')
+        if sample_rate is not None and not LogSampler.__is_rate(sample_rate):
+            return f'{prefix}sample_rate should be a number between 0 and 1'
+        route_rates = kwargs.get(f'{prefix}route_rates')
+        if route_rates is not None and (not isinstance(route_rates, dict) or not all(LogSampler.__is_rate(rate) for rate in route_rates.values())):
+            return f'{prefix}route_rates should be a dict of route to a number between 0 and 1'
+        rate_limit = kwargs.get(f'{prefix}rate_limit')
+        if rate_limit is not None and (not LogSampler.__is_number(rate_limit) or rate_limit <= 0):
+            return f'{prefix}rate_limit should be a positive number (logs per second)'
+        burst = kwargs.get(f'{prefix}burst')
+        if burst is not None and (not LogSampler.__is_number(burst) or burst < 1):
+            return f'{prefix}burst should be a number greater than or equal to 1'
+        always_on_error = kwargs.get(f'{prefix}always_on_error')
+        if always_on_error is not None and not isinstance(always_on_error, bool):
+            return f'{prefix}always_on_error should be a boolean'
+        return None
+
+    @staticmethod
+    def __is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    @staticmethod
+    def __is_rate(value):
+        return LogSampler.__is_number(value) and 0 <= value <= 1
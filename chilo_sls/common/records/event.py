@@ -7,13 +7,11 @@ class Event(BaseRecordsEvent):
     def __init__(self, event, context=None, **kwargs):
         super().__init__(event, context, **kwargs)
         self._record_class = Record
-        self._records = event if isinstance(event, list) else [event]
+        self.__raw_records = event if isinstance(event, list) else [event]
 
     @property
     def raw_records(self):
-        return self._records
+        return self.__raw_records
 
-    @property
-    def records(self):
-        self._records = [self._record_class(record) for record in self.raw_records]
-        return self.data_classes if self.data_class is not None else self._records
+    def _iter_validated_records(self):
+        return self._iter_built_records()
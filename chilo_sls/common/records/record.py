@@ -6,7 +6,7 @@ class Record(BaseRecord):
 
     @property
     def body(self):
-        return JsonHelper.decode(self._record)
+        return JsonHelper.decode(self._record, backend=self._json_backend)
 
     @property
     def operation(self):
@@ -1,9 +1,12 @@
 import inspect
-import signal
 
 from chilo_sls.common import logger
+from chilo_sls.common.async_runner import AsyncRunner
+from chilo_sls.common.deadline import Deadline
+from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.common.records.exception import EventException, EventTimeOutException
 from chilo_sls.common.records.event import Event as CommonEvent
+from chilo_sls.common.validator import Validator
 from chilo_sls.documentdb.event import Event as DocumentDBEvent
 from chilo_sls.dynamodb.event import Event as DynamoDBEvent
 from chilo_sls.firehose.event import Event as FirehoseEvent
@@ -16,6 +19,13 @@ from chilo_sls.sqs.event import Event as SQSEvent
 
 
 def requirements(**kwargs):
+    JsonHelper.get_backend(kwargs.get('json_backend'))
+    if kwargs.get('concurrency') is not None and (not isinstance(kwargs['concurrency'], int) or kwargs['concurrency'] < 1):
+        raise EventException(message='concurrency should be a positive int')
+    S3Event.validate_options(**kwargs)
+    records_validator = Validator(**kwargs)
+    if kwargs.get('required_body'):
+        records_validator.get_body_validator(kwargs['required_body'])
 
     def __find_event_source(event):
         if event.get('eventSource'):
@@ -43,44 +53,50 @@ def requirements(**kwargs):
         }
         try:
             source = __find_event_source(event)
-            return event_clients[source](event, context, **kwargs)
+            return event_clients[source](event, context, **{**kwargs, '_validator': records_validator})
         except EventException as event_error:
             if kwargs.get('verbose'):
                 logger.log(level='ERROR', log={'event': event, 'context': context, 'error': event_error})
-            return event_clients['unknown'](event, context, **kwargs)
+            return event_clients['unknown'](event, context, **{**kwargs, '_validator': records_validator})
 
     def decorator_func(func):
 
-        def raise_timeout(*_):
-            raise EventTimeOutException
-
-        def start_timeout():
-            if kwargs.get('timeout') is not None:
-                signal.signal(signal.SIGALRM, raise_timeout)
-                signal.alarm(kwargs['timeout'])
-
-        def end_timeout():
-            signal.alarm(0)
+        def get_deadline(context):
+            return Deadline(
+                timeout=kwargs.get('timeout'),
+                timeout_ms=kwargs.get('timeout_ms'),
+                context=context if kwargs.get('use_context_deadline') else None,
+                buffer_ms=kwargs.get('deadline_buffer_ms', Deadline.DEFAULT_BUFFER_MS),
+                error=EventTimeOutException
+            )
 
         def run_before(records_event):
             if kwargs.get('before') and callable(kwargs['before']):
-                kwargs['before'](records_event, kwargs)
+                AsyncRunner.run(kwargs['before'](records_event, kwargs))
 
         def run_after(records_event, result):
             if kwargs.get('after') and callable(kwargs['after']):
-                kwargs['after'](records_event, result, kwargs)
+                AsyncRunner.run(kwargs['after'](records_event, result, kwargs))
 
-        def run_function(event, context):
+        def run_records(event, context):
             records_event = __determine_event_type(event, context)
             run_before(records_event)
             if kwargs.get('data_class') and inspect.isclass(kwargs['data_class']):
                 records_event.data_class = kwargs['data_class']
-            start_timeout()
-            result = func(records_event)
-            end_timeout()
+            deadline = get_deadline(context)
+            if (kwargs.get('batch_item_failures') or kwargs.get('concurrency')) and inspect.iscoroutinefunction(func):
+                result = deadline.run(records_event.aprocess_records, func)
+            elif kwargs.get('batch_item_failures') or kwargs.get('concurrency'):
+                result = deadline.run(records_event.process_records, func)
+            else:
+                result = deadline.run(func, records_event)
             run_after(records_event, result)
             return result
 
+        def run_function(event, context):
+            with logger.buffered(kwargs.get('buffer_logs', False), kwargs.get('log_buffer_size')):
+                return run_records(event, context)
+
         return run_function
 
     return decorator_func
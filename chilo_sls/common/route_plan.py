@@ -0,0 +1,62 @@
+from types import MappingProxyType
+
+
+class RoutePlan:
+
+    def __init__(self, **kwargs):
+        self.__has_security = bool(kwargs.get('has_security'))
+        self.__required_headers = tuple(kwargs.get('required_headers', ()))
+        self.__available_headers = self.__combine_available(kwargs.get('available_headers'), self.__required_headers)
+        self.__required_query = tuple(kwargs.get('required_query', ()))
+        self.__available_query = self.__combine_available(kwargs.get('available_query'), self.__required_query)
+        self.__body_validators = self.__freeze(kwargs.get('body_validators'))
+        self.__response_validators = self.__freeze(kwargs.get('response_validators'))
+        self.__default_response_validator = kwargs.get('default_response_validator')
+
+    @property
+    def has_security(self):
+        return self.__has_security
+
+    @property
+    def required_headers(self):
+        return self.__required_headers
+
+    @property
+    def available_headers(self):
+        return self.__available_headers
+
+    @property
+    def required_query(self):
+        return self.__required_query
+
+    @property
+    def available_query(self):
+        return self.__available_query
+
+    @property
+    def has_body(self):
+        return self.__body_validators is not None
+
+    @property
+    def has_responses(self):
+        return self.__response_validators is not None
+
+    def get_body_validator(self, content_type):
+        return self.__body_validators[content_type]
+
+    def get_response_validator(self, code, content_type):
+        if self.__response_validators is None:
+            return self.__default_response_validator
+        return self.__response_validators[f'{code}'][content_type]
+
+    @staticmethod
+    def __combine_available(available, required):
+        if not available:
+            return frozenset()
+        return frozenset(available) | frozenset(required)
+
+    @staticmethod
+    def __freeze(validators):
+        if validators is None:
+            return None
+        return MappingProxyType({key: RoutePlan.__freeze(value) if isinstance(value, dict) else value for key, value in validators.items()})
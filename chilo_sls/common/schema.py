@@ -8,6 +8,7 @@ import yaml
 
 
 class Schema:
+    HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
 
     def __init__(self, **kwargs):
         self.__schema = kwargs.get('openapi') or kwargs.get('schema')
@@ -37,12 +38,24 @@ class Schema:
         else:
             body_spec = {}
 
-        body_spec['additionalProperties'] = self.__config.get('allow_additional_properties', False)
-        return body_spec
+        return {**body_spec, 'additionalProperties': self.__config.get('allow_additional_properties', False)}
 
     def get_route_spec(self, route, method):
         return self.__get_route_spec(route, method)
 
+    def get_spec_route(self, route):
+        spec = self.__get_full_spec()
+        if spec.get('basePath'):
+            return route.replace(spec['basePath'], '')
+        return route
+
+    def get_route_specs(self):
+        spec = self.__get_full_spec()
+        for route, path_spec in spec.get('paths', {}).items():
+            for method, route_spec in path_spec.items():
+                if method in self.HTTP_METHODS:
+                    yield route, method, route_spec
+
     def __get_full_spec(self):
         if not self.spec and self.__schema:
             unresolved_spec = self.__get_spec_from_file()
@@ -94,6 +107,4 @@ class Schema:
 
     def __get_route_spec(self, route, method):
         spec = self.__get_full_spec()
-        if spec.get('basePath'):
-            route = route.replace(spec['basePath'], '')
-        return spec['paths'][route][method]
+        return spec['paths'][self.get_spec_route(route)][method]
@@ -4,6 +4,7 @@ from collections import defaultdict
 from jsonschema import Draft7Validator
 from pydantic import BaseModel, ValidationError
 
+from chilo_sls.common.route_plan import RoutePlan
 from chilo_sls.common.schema import Schema
 
 
@@ -18,27 +19,52 @@ class Validator:
             'available_query': 'query_params',
             'required_body': 'body'
         }
+        self.__route_plans = {}
+        self.__body_validators = {}
 
     def auto_load(self):
         self.__schema.load_schema_file()
+        if self.__schema.spec:
+            self.__compile_route_plans()
 
     def request_has_security(self, request):
-        route_spec = self.__schema.get_route_spec(request.route, request.method)
-        if route_spec.get('security'):
-            return True
-        return False
+        return self.get_route_plan(request.route, request.method).has_security
+
+    def get_body_validator(self, required_body=None):
+        cache_key = id(required_body) if isinstance(required_body, dict) else required_body
+        cached = self.__body_validators.get(cache_key)
+        if cached is None or cached[0] is not required_body:
+            cached = (required_body, self.__build_body_validator(required_body))
+            self.__body_validators[cache_key] = cached
+        return cached[1]
+
+    def get_route_plan(self, route, method):
+        plan_key = (self.__schema.get_spec_route(route), method)
+        if plan_key not in self.__route_plans:
+            route_spec = self.__schema.get_route_spec(route, method)
+            self.__route_plans[plan_key] = self.__compile_route_plan(route_spec)
+        return self.__route_plans[plan_key]
 
     def validate_request_with_openapi(self, request, response):
-        route_spec = self.__schema.get_route_spec(request.route, request.method)
-        requirements = Validator.combine_parameters(route_spec.get('parameters', []))
-        if route_spec.get('requestBody'):
-            requirements['required_body'] = route_spec['requestBody']['content'][request.content_type]['schema']
-        self.validate_request(request, response, requirements)
+        plan = self.get_route_plan(request.route, request.method)
+        if plan.required_headers:
+            Validator.check_required_fields(response, plan.required_headers, request.headers, 'headers')
+        if plan.available_headers:
+            Validator.check_available_fields(response, plan.available_headers, request.headers, 'headers')
+        if plan.required_query:
+            Validator.check_required_fields(response, plan.required_query, request.query_params, 'query_params')
+        if plan.available_query:
+            Validator.check_available_fields(response, plan.available_query, request.query_params, 'query_params')
+        body_validator = plan.get_body_validator(request.content_type) if plan.has_body else None
+        if body_validator is not None:
+            Validator.check_body_with_validator(response, body_validator, request.body)
+        if response.has_errors:
+            response.code = 400
 
     def validate_request(self, request, response, requirements):
         for required, source in self.__pairings.items():
             if requirements.get(required) and required == 'required_body':
-                Validator.check_required_body(response, self.__schema.get_body_spec(requirements[required]), getattr(request, source))
+                Validator.check_body_with_validator(response, self.get_body_validator(requirements[required]), getattr(request, source))
             elif requirements.get(required) and 'required' in required:
                 Validator.check_required_fields(response, requirements[required], getattr(request, source), source)
             elif requirements.get(required) and 'available' in required:
@@ -48,26 +74,82 @@ class Validator:
             response.code = 400
 
     def openapi_validate_response_with_openapi(self, request, response):
-        requirements = {}
-        route_spec = self.__schema.get_route_spec(request.route, request.method)
-        if route_spec.get('responses'):
-            requirements['required_response'] = route_spec['responses'][f'{response.code}']['content'][response.content_type]['schema']
-        self.openapi_validate_response(response, requirements)
+        plan = self.get_route_plan(request.route, request.method)
+        response_validator = plan.get_response_validator(response.code, response.content_type)
+        if response_validator is not None:
+            Validator.check_body_with_validator(response, response_validator, response.raw)
+        if response.has_errors:
+            response.set_error('response', 'There was a problem with the APIs response; does not match defined schema')
+            response.code = 500
 
     def openapi_validate_response(self, response, requirements):
-        Validator.check_required_body(response, self.__schema.get_body_spec(requirements.get('required_response', {})), response.raw)
+        Validator.check_body_with_validator(response, self.get_body_validator(requirements.get('required_response')), response.raw)
         if response.has_errors:
             response.set_error('response', 'There was a problem with the APIs response; does not match defined schema')
             response.code = 500
 
     def validate_record_body(self, body, schema):
         errors = []
-        schema_validator = Draft7Validator(self.__schema.get_body_spec(schema))
+        schema_validator = self.get_body_validator(schema)
+        if not isinstance(schema_validator, Draft7Validator):
+            try:
+                schema_validator(**body)
+            except ValidationError as error:
+                for validation_error in error.errors():
+                    errors.append({'key': '.'.join(str(loc) for loc in validation_error['loc']), 'message': validation_error['msg']})
+            return errors
         for schema_error in sorted(schema_validator.iter_errors(body), key=str):
             error_key = Validator.format_schema_error_key(schema_error)
             errors.append({'key': error_key, 'message': schema_error.message})
         return errors
 
+    def __compile_route_plans(self):
+        for route, method, route_spec in self.__schema.get_route_specs():
+            # a route that cannot be compiled is left to compile (and fail) on its first request
+            try:
+                self.__route_plans[(route, method)] = self.__compile_route_plan(route_spec)
+            except Exception:
+                continue
+
+    def __compile_route_plan(self, route_spec):
+        requirements = Validator.combine_parameters(route_spec.get('parameters', []))
+        body_validators = None
+        response_validators = None
+        if route_spec.get('requestBody'):
+            body_validators = {
+                content_type: self.__build_spec_validator(content)
+                for content_type, content in route_spec['requestBody'].get('content', {}).items()
+            }
+        if route_spec.get('responses'):
+            response_validators = {
+                f'{code}': {
+                    content_type: self.__build_spec_validator(content)
+                    for content_type, content in code_spec.get('content', {}).items()
+                }
+                for code, code_spec in route_spec['responses'].items()
+            }
+        return RoutePlan(
+            has_security=route_spec.get('security'),
+            body_validators=body_validators,
+            response_validators=response_validators,
+            default_response_validator=None if response_validators else self.__build_body_validator({}),
+            **requirements
+        )
+
+    def __build_spec_validator(self, content):
+        # openapi schemas are not strict draft 7 (e.g. boolean exclusiveMinimum) and media types may omit them
+        if not isinstance(content, dict) or 'schema' not in content:
+            return None
+        body_spec = self.__schema.get_body_spec(content['schema'])
+        return Draft7Validator(body_spec) if isinstance(body_spec, dict) else body_spec
+
+    def __build_body_validator(self, required_body):
+        body_spec = self.__schema.get_body_spec(required_body)
+        if isinstance(body_spec, dict):
+            Draft7Validator.check_schema(body_spec)
+            return Draft7Validator(body_spec)
+        return body_spec
+
     @staticmethod
     def check_required_fields(response, required, sent, list_name=''):
         sent_keys = []
@@ -96,20 +178,29 @@ class Validator:
 
     @staticmethod
     def check_required_body(response, schema, request_body):
+        if schema and isinstance(schema, dict):
+            schema = Draft7Validator(schema)
+        Validator.check_body_with_validator(response, schema, request_body)
+
+    @staticmethod
+    def check_body_with_validator(response, schema_validator, request_body):
         if not Validator.is_json(response, request_body):
             return
-        if schema and isinstance(schema, dict):
-            schema_validator = Draft7Validator(schema)
-            for schema_error in sorted(schema_validator.iter_errors(request_body), key=str):
-                error_key = Validator.format_schema_error_key(schema_error)
-                response.set_error(key_path=error_key, message=schema_error.message)
-        elif inspect.isclass(schema) and issubclass(schema, BaseModel):
+        if isinstance(schema_validator, Draft7Validator):
+            Validator.check_schema_errors(response, schema_validator, request_body)
+        elif inspect.isclass(schema_validator) and issubclass(schema_validator, BaseModel):
             try:
-                schema(**request_body)
+                schema_validator(**request_body)
             except ValidationError as error:
                 for validation_error in error.errors():
                     response.set_error(key_path='.'.join(validation_error['loc']), message=validation_error['msg'])
 
+    @staticmethod
+    def check_schema_errors(response, schema_validator, request_body):
+        for schema_error in sorted(schema_validator.iter_errors(request_body), key=str):
+            error_key = Validator.format_schema_error_key(schema_error)
+            response.set_error(key_path=error_key, message=schema_error.message)
+
     @staticmethod
     def combine_parameters(parameters):
         requirements = defaultdict(lambda: [])
@@ -6,8 +6,8 @@ from chilo_sls.base.record import BaseRecord
 
 class Record(BaseRecord):
 
-    def __init__(self, event):
-        super().__init__(event)
+    def __init__(self, event, json_backend=None):
+        super().__init__(event, json_backend)
         self._event = event.get('event')
         self.mongo_operations = {
             'create': self.CREATED,
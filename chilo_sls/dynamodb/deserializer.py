@@ -0,0 +1,76 @@
+import base64
+import datetime
+import decimal
+
+
+# defaults match dynamodb_json: float numbers, base64 str binaries, datetime for %Y-%m-%dT%H:%M:%S.%f strings,
+# SS as a list and NS/BS as sets of the raw strings
+class AttributeDeserializer:
+
+    def __init__(self, use_decimal=False, decode_binary=False):
+        self.__use_decimal = use_decimal
+        self.__decode_binary = decode_binary
+        self.__decoders = {
+            'S': self.__decode_string,
+            'N': self.__decode_number,
+            'B': self.__decode_binary_value,
+            'BOOL': bool,
+            'NULL': lambda _: None,
+            'M': self.deserialize_image,
+            'L': lambda values: [self.deserialize(value) for value in values],
+            'SS': list,
+            'NS': lambda values: {self.__decode_number(value) for value in values} if self.__use_decimal else set(values),
+            'BS': lambda values: {self.__decode_binary_value(value) for value in values} if self.__decode_binary else set(values)
+        }
+
+    def deserialize_image(self, image):
+        if not image:
+            return {}
+        return {key: self.deserialize(attribute) for key, attribute in image.items()}
+
+    def deserialize(self, attribute):
+        for attribute_type, value in attribute.items():
+            decoder = self.__decoders.get(attribute_type)
+            if decoder is None:
+                raise ValueError(f'unknown dynamodb attribute type: {attribute_type}')
+            return decoder(value)
+        raise ValueError('dynamodb attribute value is empty')
+
+    @staticmethod
+    def is_equal(old_attribute, new_attribute):
+        if old_attribute is None or new_attribute is None:
+            return old_attribute is new_attribute
+        if old_attribute.keys() != new_attribute.keys():
+            return False
+        for attribute_type, old_value in old_attribute.items():
+            new_value = new_attribute[attribute_type]
+            if attribute_type in _SET_TYPES:
+                return set(old_value) == set(new_value)
+            if attribute_type == 'M':
+                return old_value.keys() == new_value.keys() and all(AttributeDeserializer.is_equal(old_value[key], new_value[key]) for key in old_value)
+            if attribute_type == 'L':
+                return len(old_value) == len(new_value) and all(AttributeDeserializer.is_equal(old, new) for old, new in zip(old_value, new_value))
+            return old_value == new_value
+        return True
+
+    @staticmethod
+    def __decode_string(value):
+        if 'T' not in value or '.' not in value:
+            return value
+        try:
+            return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f')
+        except ValueError:
+            return value
+
+    def __decode_number(self, value):
+        if '.' not in value and 'e' not in value and 'E' not in value:
+            return int(value)
+        return decimal.Decimal(value) if self.__use_decimal else float(value)
+
+    def __decode_binary_value(self, value):
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value) if self.__decode_binary else base64.b64encode(value).decode('ascii')
+        return base64.b64decode(value) if self.__decode_binary else value
+
+
+_SET_TYPES = frozenset(('SS', 'NS', 'BS'))
@@ -1,4 +1,5 @@
 from chilo_sls.base.event import BaseRecordsEvent
+from chilo_sls.dynamodb.deserializer import AttributeDeserializer
 from chilo_sls.dynamodb.record import Record
 
 
@@ -7,3 +8,16 @@ class Event(BaseRecordsEvent):
     def __init__(self, event, context=None, **kwargs):
         super().__init__(event, context, **kwargs)
         self._record_class = Record
+        self._stop_on_failure = True
+        self.__deserializer = AttributeDeserializer(kwargs.get('use_decimal', False), kwargs.get('decode_binary', False))
+
+    def _iter_built_records(self):
+        json_backend = self._kwargs.get('json_backend')
+        for raw_record in self._iter_raw_records():
+            yield self._record_class(raw_record, json_backend, self.__deserializer)
+
+    def _filter_record(self, record):
+        changed_fields = self._kwargs.get('changed_fields')
+        if not changed_fields or record.operation == record.UNKNOWN:
+            return True
+        return record.has_changed(changed_fields)
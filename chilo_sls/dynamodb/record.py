@@ -1,9 +1,18 @@
-from dynamodb_json import json_util as ddb_json
+import json
 
 from chilo_sls.base.record import BaseRecord
+from chilo_sls.dynamodb.deserializer import AttributeDeserializer
+
+
+_DEFAULT_DESERIALIZER = AttributeDeserializer()
 
 
 class Record(BaseRecord):
+    __slots__ = ('_deserializer',)
+
+    def __init__(self, record, json_backend=None, deserializer=None):
+        super().__init__(record, json_backend)
+        self._deserializer = deserializer or _DEFAULT_DESERIALIZER
 
     @property
     def name(self):
@@ -43,15 +52,40 @@ class Record(BaseRecord):
 
     @property
     def keys(self):
-        return ddb_json.loads(self._record['dynamodb'].get('Keys', {}))
+        return self.__get_image('Keys')
 
     @property
     def old_image(self):
-        return ddb_json.loads(self._record['dynamodb'].get('OldImage', {}))
+        return self.__get_image('OldImage')
 
     @property
     def new_image(self):
-        return ddb_json.loads(self._record['dynamodb'].get('NewImage', {}))
+        return self.__get_image('NewImage')
+
+    @property
+    def changed_attributes(self):
+        if 'changed_attributes' not in self._decoded:
+            old_image = self._record['dynamodb'].get('OldImage') or {}
+            new_image = self._record['dynamodb'].get('NewImage') or {}
+            self._decoded['changed_attributes'] = frozenset(
+                key for key in old_image.keys() | new_image.keys()
+                if not AttributeDeserializer.is_equal(old_image.get(key), new_image.get(key))
+            )
+        return self._decoded['changed_attributes']
+
+    @property
+    def diff(self):
+        if 'diff' not in self._decoded:
+            old_image = self._record['dynamodb'].get('OldImage') or {}
+            new_image = self._record['dynamodb'].get('NewImage') or {}
+            self._decoded['diff'] = {
+                key: {'old': self.__deserialize(old_image.get(key)), 'new': self.__deserialize(new_image.get(key))}
+                for key in sorted(self.changed_attributes)
+            }
+        return self._decoded['diff']
+
+    def has_changed(self, fields):
+        return not self.changed_attributes.isdisjoint(fields)
 
     @property
     def approximate_creation_time(self):
@@ -61,13 +95,24 @@ class Record(BaseRecord):
     def body(self):
         return self.new_image
 
+    @property
+    def item_identifier(self):
+        return self.sequence_number
+
+    @property
+    def ordering_key(self):
+        keys = self._record['dynamodb'].get('Keys')
+        return json.dumps(keys, sort_keys=True, separators=(',', ':')) if keys else None
+
     @property
     def operation(self):
-        if self.new_image and not self.old_image:
+        has_new_image = bool(self._record['dynamodb'].get('NewImage'))
+        has_old_image = bool(self._record['dynamodb'].get('OldImage'))
+        if has_new_image and not has_old_image:
             return self.CREATED
-        if self.new_image and self.old_image:
+        if has_new_image and has_old_image:
             return self.UPDATED
-        if not self.new_image and self.old_image:
+        if not has_new_image and has_old_image:
             return self.DELETED
         return self.UNKNOWN
 
@@ -87,3 +132,11 @@ class Record(BaseRecord):
             'dynamodb_new_image': self.new_image,
             'approximate_creation_time': self.approximate_creation_time
         })
+
+    def __get_image(self, image_key):
+        if image_key not in self._decoded:
+            self._decoded[image_key] = self._deserializer.deserialize_image(self._record['dynamodb'].get(image_key, {}))
+        return self._decoded[image_key]
+
+    def __deserialize(self, attribute):
+        return self._deserializer.deserialize(attribute) if attribute is not None else None
@@ -3,10 +3,11 @@ from chilo_sls.common.json_helper import JsonHelper
 
 class Event:
 
-    def __init__(self, event, context=None):
+    def __init__(self, event, context=None, json_backend=None):
         self._event = event
         self._context = context
+        self._json_backend = json_backend
 
     @property
     def body(self):
-        return JsonHelper.decode(self._event)
+        return JsonHelper.decode(self._event, backend=self._json_backend)
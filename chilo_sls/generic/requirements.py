@@ -1,46 +1,50 @@
 import inspect
-import signal
 
+from chilo_sls.common import logger
 from chilo_sls.generic.event import Event
+from chilo_sls.common.async_runner import AsyncRunner
+from chilo_sls.common.deadline import Deadline
+from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.common.records.exception import EventTimeOutException
 
 # pylint: disable=duplicate-code
 
 
 def requirements(**kwargs):
+    JsonHelper.get_backend(kwargs.get('json_backend'))
 
     def decorator_func(func):
 
-        def raise_timeout(*_):
-            raise EventTimeOutException
-
-        def start_timeout():
-            if kwargs.get('timeout') is not None:
-                signal.signal(signal.SIGALRM, raise_timeout)
-                signal.alarm(kwargs['timeout'])
-
-        def end_timeout():
-            signal.alarm(0)
+        def get_deadline(context):
+            return Deadline(
+                timeout=kwargs.get('timeout'),
+                timeout_ms=kwargs.get('timeout_ms'),
+                context=context if kwargs.get('use_context_deadline') else None,
+                buffer_ms=kwargs.get('deadline_buffer_ms', Deadline.DEFAULT_BUFFER_MS),
+                error=EventTimeOutException
+            )
 
         def run_before(generic_event):
             if kwargs.get('before') and callable(kwargs['before']):
-                kwargs['before'](generic_event, kwargs)
+                AsyncRunner.run(kwargs['before'](generic_event, kwargs))
 
         def run_after(generic_event, result):
             if kwargs.get('after') and callable(kwargs['after']):
-                kwargs['after'](generic_event, result, kwargs)
+                AsyncRunner.run(kwargs['after'](generic_event, result, kwargs))
 
-        def run_function(event, context):
-            generic_event = Event(event, context)
+        def run_generic(event, context):
+            generic_event = Event(event, context, kwargs.get('json_backend'))
             run_before(generic_event)
             if kwargs.get('data_class') and inspect.isclass(kwargs['data_class']):
                 generic_event = kwargs['data_class'](event=generic_event)
-            start_timeout()
-            result = func(generic_event)
-            end_timeout()
+            result = get_deadline(context).run(func, generic_event)
             run_after(generic_event, result)
             return result
 
+        def run_function(event, context):
+            with logger.buffered(kwargs.get('buffer_logs', False), kwargs.get('log_buffer_size')):
+                return run_generic(event, context)
+
         return run_function
 
     return decorator_func
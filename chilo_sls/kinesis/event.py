@@ -7,3 +7,4 @@ class Event(BaseRecordsEvent):
     def __init__(self, event, context=None, **kwargs):
         super().__init__(event, context, **kwargs)
         self._record_class = Record
+        self._stop_on_failure = True
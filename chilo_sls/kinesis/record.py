@@ -1,10 +1,8 @@
-import base64
-
-from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.base.record import BaseRecord
 
 
 class Record(BaseRecord):
+    __slots__ = ()
 
     @property
     def id(self):
@@ -50,15 +48,26 @@ class Record(BaseRecord):
     def sequence_number(self):
         return self._record.get('kinesis', {}).get('sequenceNumber')
 
+    @property
+    def raw_data(self):
+        return self._get_raw_bytes('data', self._record.get('kinesis', {}).get('data'))
+
     @property
     def data(self):
-        b64_decoded = base64.b64decode(self._record.get('kinesis', {}).get('data')).decode('utf-8')
-        return JsonHelper.decode(b64_decoded)
+        return self._get_decoded_json('data', self._record.get('kinesis', {}).get('data'))
 
     @property
     def body(self):
         return self.data
 
+    @property
+    def item_identifier(self):
+        return self.sequence_number
+
+    @property
+    def ordering_key(self):
+        return self.partition_key
+
     @property
     def operation(self):
         return self.UNKNOWN
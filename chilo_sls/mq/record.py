@@ -1,10 +1,8 @@
-import base64
-
-from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.base.record import BaseRecord
 
 
 class Record(BaseRecord):
+    __slots__ = ()
 
     @property
     def message_id(self):
@@ -14,10 +12,13 @@ class Record(BaseRecord):
     def message_type(self):
         return self._record.get('messageType')
 
+    @property
+    def raw_data(self):
+        return self._get_raw_bytes('data', self._record.get('data'))
+
     @property
     def data(self):
-        b64_decoded = base64.b64decode(self._record.get('data')).decode('utf-8')
-        return JsonHelper.decode(b64_decoded)
+        return self._get_decoded_json('data', self._record.get('data'))
 
     @property
     def delivery_mode(self):
@@ -12,15 +12,9 @@ class Event(BaseRecordsEvent):
     def raw_records(self):
         return self._event.get('records', {})
 
-    @property
-    def records(self):
-        self._records = []
+    def _iter_raw_records(self):
         for topic in self.raw_records:
-            for msk_record in self.raw_records[topic]:
-                self._records.append(self._record_class(msk_record))
-        self._validate_operations()
-        self._validate_record_body()
-        return self.data_classes if self.data_class is not None else self._records
+            yield from self.raw_records[topic]
 
     @property
     def topics(self):
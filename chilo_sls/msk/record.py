@@ -1,10 +1,8 @@
-import base64
-
-from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.base.record import BaseRecord
 
 
 class Record(BaseRecord):
+    __slots__ = ()
 
     @property
     def topic(self):
@@ -26,19 +24,30 @@ class Record(BaseRecord):
     def time_stamp_type(self):
         return self._record.get('timestampType')
 
+    @property
+    def raw_key(self):
+        return self._get_raw_bytes('key', self._record.get('key'))
+
     @property
     def key(self):
-        return base64.b64decode(self._record.get('key')).decode('utf-8')
+        return self.raw_key.decode('utf-8')
+
+    @property
+    def raw_value(self):
+        return self._get_raw_bytes('value', self._record.get('value'))
 
     @property
     def value(self):
-        b64_decoded = base64.b64decode(self._record.get('value')).decode('utf-8')
-        return JsonHelper.decode(b64_decoded)
+        return self._get_decoded_json('value', self._record.get('value'))
 
     @property
     def headers(self):
         return self._record.get('headers')
 
+    @property
+    def ordering_key(self):
+        return f'{self.topic}-{self.partition}'
+
     @property
     def operation(self):
         return self.UNKNOWN
@@ -0,0 +1,24 @@
+import threading
+
+import boto3
+
+
+class S3ClientPool:
+    __clients = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_client(**kwargs):
+        pool_key = tuple(sorted((key, repr(value)) for key, value in kwargs.items()))
+        client = S3ClientPool.__clients.get(pool_key)
+        if client is not None:
+            return client
+        with S3ClientPool.__lock:
+            if pool_key not in S3ClientPool.__clients:
+                S3ClientPool.__clients[pool_key] = boto3.client('s3', **kwargs)
+            return S3ClientPool.__clients[pool_key]
+
+    @staticmethod
+    def clear():
+        with S3ClientPool.__lock:
+            S3ClientPool.__clients.clear()
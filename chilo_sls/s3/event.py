@@ -1,35 +1,98 @@
-import csv
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
-
-from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.base.event import BaseRecordsEvent
+from chilo_sls.common.records.exception import EventException, RecordException
+from chilo_sls.s3.client_pool import S3ClientPool
+from chilo_sls.s3.reader import ObjectReader
 from chilo_sls.s3.record import Record
 
 
 class Event(BaseRecordsEvent):
+    DEFAULT_MAX_WORKERS = 8
 
     def __init__(self, event, context=None, **kwargs):
         super().__init__(event, context, **kwargs)
         self._record_class = Record
+        self.__client = None
+        self.validate_options(**kwargs)
 
-    @property
-    def records(self):
-        self._records = [self._record_class(record) for record in self._event.get('Records', [])]
-        self._validate_operations()
-        self.__get_objects()
-        self._validate_record_body()
-        return self.data_classes if self.data_class is not None else self._records
+    def _iter_validated_records(self):
+        max_workers = self._kwargs.get('max_workers') or self.DEFAULT_MAX_WORKERS
+        if not self._kwargs.get('get_object') or self._kwargs.get('stream') or max_workers <= 1:
+            yield from super()._iter_validated_records()
+            return
+        records = [record for record in self._iter_built_records() if self._validate_operation(record) and self._filter_record(record)]
+        if len(records) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(records))) as executor:
+                list(executor.map(self._prepare_record, records))
+        else:
+            for record in records:
+                self._prepare_record(record)
+        for record in records:
+            if self._validate_body(record):
+                yield record
 
-    def __get_objects(self):
+    def _prepare_record(self, record):
         if not self._kwargs.get('get_object'):
             return
-        client = boto3.client('s3', **self._kwargs.get('s3', {}))
-        for record in self._records:
-            s3_object_body = client.get_object(Bucket=record.bucket, Key=record.key)['Body']
-            if self._kwargs.get('data_type') == 'json':
-                s3_object_body = JsonHelper.decode(s3_object_body.read().decode('utf-8'), True)
-            elif self._kwargs.get('data_type') == 'csv':
-                csv_data = csv.DictReader(s3_object_body.read().decode('utf-8').splitlines(), delimiter=self._kwargs.get('delimiter', ','))
-                s3_object_body = list(csv_data)
-            record.body = s3_object_body.copy()
+        s3_object = self.__get_client().get_object(**self.__get_object_kwargs(record))
+        reader = ObjectReader(s3_object, **{**self._kwargs, 'key': record.key})
+        if not self._kwargs.get('stream_body'):
+            record.body = reader.read()
+            return
+        rows = self.__iter_valid_rows(record, reader.iter_rows())
+        if self._kwargs.get('batch_size'):
+            rows = ObjectReader.iter_batches(rows, self._kwargs['batch_size'])
+        record.body = rows
+
+    def _validate_body(self, record):
+        if self._kwargs.get('get_object') and self._kwargs.get('stream_body'):
+            return True
+        return super()._validate_body(record)
+
+    def __iter_valid_rows(self, record, rows):
+        for row in rows:
+            if not self._kwargs.get('required_body'):
+                yield row
+                continue
+            errors = self._get_body_errors(row)
+            if len(errors) != 0 and self._kwargs.get('raise_body_error'):
+                raise RecordException(record=record, message=f'record row did not meet body requirement; errors: {errors}')
+            if len(errors) == 0:
+                yield row
+
+    def __get_object_kwargs(self, record):
+        object_kwargs = {'Bucket': record.bucket, 'Key': record.key}
+        byte_range = self.__get_byte_range()
+        if byte_range is not None:
+            object_kwargs['Range'] = byte_range
+        return object_kwargs
+
+    def __get_byte_range(self):
+        byte_range = self._kwargs.get('byte_range')
+        max_bytes = self._kwargs.get('max_bytes')
+        if isinstance(byte_range, str):
+            return byte_range
+        if byte_range is None and max_bytes is None:
+            return None
+        start, end = byte_range if byte_range is not None else (0, None)
+        if max_bytes is not None:
+            end = start + max_bytes - 1 if end is None else min(end, start + max_bytes - 1)
+        return f'bytes={start}-{end if end is not None else ""}'
+
+    @staticmethod
+    def validate_options(**kwargs):
+        if Event.__get_range_start(kwargs.get('byte_range')) > 0 and kwargs.get('data_type') == ObjectReader.CSV and not kwargs.get('fieldnames'):
+            raise EventException(message='byte_range starting after byte 0 requires fieldnames for csv data_type')
+
+    @staticmethod
+    def __get_range_start(byte_range):
+        if isinstance(byte_range, str):
+            start = byte_range.replace('bytes=', '').split('-', 1)[0]
+            return int(start) if start.isdigit() else 0
+        return byte_range[0] if byte_range is not None else 0
+
+    def __get_client(self):
+        if self.__client is None:
+            self.__client = self._kwargs.get('s3_client') or S3ClientPool.get_client(**self._kwargs.get('s3', {}))
+        return self.__client
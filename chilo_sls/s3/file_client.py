@@ -0,0 +1,38 @@
+import io
+import os
+import re
+
+from botocore.exceptions import ClientError
+
+
+class FileS3Client:
+    RANGE = re.compile(r'bytes=(\d*)-(\d*)')
+
+    def __init__(self, root_directory):
+        self.__root_directory = root_directory
+
+    def get_object(self, **kwargs):
+        file_path = os.path.join(self.__root_directory, kwargs['Bucket'], kwargs['Key'])
+        if not os.path.isfile(file_path):
+            raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'The specified key does not exist.'}}, 'GetObject')
+        with open(file_path, 'rb') as s3_file:
+            data = s3_file.read()
+        s3_object = {'ContentLength': len(data)}
+        if kwargs.get('Range'):
+            start, end = self.__get_range(kwargs['Range'], len(data))
+            s3_object['ContentRange'] = f'bytes {start}-{end}/{len(data)}'
+            data = data[start:end + 1]
+            s3_object['ContentLength'] = len(data)
+        if kwargs['Key'].endswith('.gz'):
+            s3_object['ContentEncoding'] = 'gzip'
+        s3_object['Body'] = io.BytesIO(data)
+        return s3_object
+
+    def __get_range(self, byte_range, size):
+        matched = self.RANGE.fullmatch(byte_range)
+        if matched is None:
+            raise ClientError({'Error': {'Code': 'InvalidRange', 'Message': 'The requested range is not satisfiable'}}, 'GetObject')
+        start, end = matched.groups()
+        if not start:
+            return max(size - int(end), 0), size - 1
+        return int(start), min(int(end), size - 1) if end else size - 1
@@ -0,0 +1,141 @@
+import csv
+import gzip
+import io
+import re
+
+from chilo_sls.common.json_helper import JsonHelper
+
+
+class RawStream(io.RawIOBase):
+
+    def __init__(self, body):
+        super().__init__()
+        self.__body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self.__body.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        if hasattr(self.__body, 'close'):
+            self.__body.close()
+        super().close()
+
+
+class ObjectReader:
+    CSV = 'csv'
+    JSON = 'json'
+    JSON_LINES = 'jsonl'
+    GZIP = 'gzip'
+    DEFAULT_CHUNK_SIZE = 65536
+    CONTENT_RANGE = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
+
+    def __init__(self, s3_object, **kwargs):
+        self.__body = s3_object['Body']
+        self.__data_type = kwargs.get('data_type')
+        self.__delimiter = kwargs.get('delimiter', ',')
+        self.__encoding = kwargs.get('encoding', 'utf-8')
+        self.__chunk_size = kwargs.get('chunk_size') or self.DEFAULT_CHUNK_SIZE
+        self.__json_backend = kwargs.get('json_backend')
+        self.__fieldnames = kwargs.get('fieldnames')
+        self.__columns = tuple(kwargs['columns']) if kwargs.get('columns') else None
+        self.__compression = kwargs.get('compression')
+        self.__compressed = self.__is_compressed(s3_object, kwargs)
+        self.__partial_start, self.__partial_end = self.__get_partial_range(s3_object.get('ContentRange'))
+        if self.__partial_start and self.__compressed:
+            raise ValueError('byte_range starting after byte 0 cannot be used with gzip-compressed objects')
+        if self.__partial_start and self.__data_type == self.CSV and not self.__fieldnames:
+            raise ValueError('byte_range starting after byte 0 requires fieldnames for csv data_type')
+
+    @property
+    def is_partial(self):
+        return self.__partial_start or self.__partial_end
+
+    @property
+    def is_compressed(self):
+        return self.__compressed
+
+    def read(self):
+        if self.__data_type == self.JSON:
+            return self.__project(JsonHelper.decode(self.__open_text().read(), True, self.__json_backend))
+        if self.__data_type in (self.CSV, self.JSON_LINES):
+            return list(self.iter_rows())
+        if self.__compression == self.GZIP:
+            return self.__open_binary()
+        return self.__body
+
+    def iter_rows(self):
+        if self.__data_type == self.CSV:
+            for row in csv.DictReader(self.__iter_lines(), fieldnames=self.__fieldnames, delimiter=self.__delimiter):
+                yield self.__project(row)
+        elif self.__data_type == self.JSON_LINES:
+            for line in self.__iter_lines():
+                if line.strip():
+                    yield self.__project(JsonHelper.decode(line, True, self.__json_backend))
+        elif self.__data_type == self.JSON:
+            yield self.read()
+        else:
+            stream = self.__open_binary()
+            yield from iter(lambda: stream.read(self.__chunk_size), b'')
+
+    @staticmethod
+    def iter_batches(rows, batch_size):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def __iter_lines(self):
+        previous = None
+        partial_end = self.__partial_end
+        try:
+            for index, line in enumerate(self.__open_text()):
+                if index == 0 and self.__partial_start:
+                    continue
+                if previous is not None:
+                    yield previous
+                previous = line
+        except EOFError:
+            if not self.is_partial:
+                raise
+            partial_end = True
+        if previous is not None and (not partial_end or previous.endswith('\n')):
+            yield previous
+
+    def __project(self, data):
+        if self.__columns is None:
+            return data
+        if isinstance(data, list):
+            return [self.__project(item) for item in data]
+        if isinstance(data, dict):
+            return {column: data[column] for column in self.__columns if column in data}
+        return data
+
+    def __open_binary(self):
+        stream = io.BufferedReader(RawStream(self.__body), buffer_size=self.__chunk_size)
+        if self.__compressed:
+            return gzip.GzipFile(fileobj=stream, mode='rb')
+        return stream
+
+    def __open_text(self):
+        return io.TextIOWrapper(self.__open_binary(), encoding=self.__encoding, newline='')
+
+    def __is_compressed(self, s3_object, kwargs):
+        if kwargs.get('compression') is not None:
+            return kwargs['compression'] == self.GZIP
+        return s3_object.get('ContentEncoding') == self.GZIP or str(kwargs.get('key', '')).endswith('.gz')
+
+    def __get_partial_range(self, content_range):
+        matched = self.CONTENT_RANGE.match(content_range or '')
+        if matched is None:
+            return False, False
+        start, end, total = matched.groups()
+        return int(start) > 0, total == '*' or int(end) + 1 < int(total)
@@ -69,7 +69,7 @@ class Record(BaseRecord):
 
     @property
     def body(self):
-        return JsonHelper.decode(self.message)
+        return JsonHelper.decode(self.message, backend=self._json_backend)
 
     @property
     def operation(self):
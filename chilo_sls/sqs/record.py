@@ -14,7 +14,15 @@ class Record(BaseRecord):
 
     @property
     def body(self):
-        return JsonHelper.decode(self._record.get('body'))
+        return JsonHelper.decode(self._record.get('body'), backend=self._json_backend)
+
+    @property
+    def item_identifier(self):
+        return self.message_id
+
+    @property
+    def ordering_key(self):
+        return self._record.get('attributes', {}).get('MessageGroupId')
 
     @property
     def operation(self):
@@ -18,7 +18,6 @@ setup(
     python_requires='>=3.8',
     install_requires=[
         'boto3',
-        'dynamodb_json',
         'jsonpickle',
         'jsonref',
         'jsonschema',
@@ -28,6 +27,9 @@ setup(
         'simplejson',
         'xmltodict'
     ],
+    extras_require={
+        'fast-json': ['orjson']
+    },
     keywords=[
         'aws', 'lambda', 'serverless', 'apigateway', 'router', 'openapi', 'pydantic',
         'dynamodb', 'sqs', 'sns', 's3', 'kinesis', 'firehose', 'msk', 'documentdb',
@@ -214,3 +214,10 @@ class PatternModeResolverTest(unittest.TestCase):
         second_file_path, second_import_path = resolver._get_file_and_import_path(request.path)
         self.assertEqual(first_file_path, second_file_path)
         self.assertEqual(first_import_path, second_import_path)
+
+    def test_load_importer_files_compiles_route_table(self):
+        resolver = PatternModeResolver(base_path=self.base_path, handlers=self.handler_directory)
+        self.assertFalse(resolver.route_table.is_compiled)
+        resolver.load_importer_files()
+        self.assertTrue(resolver.route_table.is_compiled)
+        self.assertIn('nested_1/nested_2/basic', resolver.route_table.static_routes)
@@ -122,3 +122,34 @@ class ResolverCacheTest(unittest.TestCase):
         cacher.put('get::/unit-test/v1/cacher/basic', get_endpoint, True, dynamic_parts)
         cached = cacher.get('get::/unit-test/v1/cacher/basic')
         self.assertDictEqual(cached['dynamic_parts'], dynamic_parts)
+
+    def test_cache_dynamic_route_by_template(self):
+        file_path = f'{self.handler_path}/basic.py'
+        import_path = 'tests.unit.mocks.apigateway.cacher.directory_handlers.basic'
+        endpoint_module = self.importer.import_module_from_file(file_path, import_path)
+        route_template = ('user', frozenset({'basic'}))
+        cacher = ResolverCache()
+        cacher.put('/unit-test/v1/user/1', endpoint_module, True, {1: '1'}, route_template)
+        cached = cacher.get('/unit-test/v1/user/2', 'user/2')
+        self.assertIs(cached['endpoint'], endpoint_module)
+        self.assertDictEqual(cached['dynamic_parts'], {1: '2'})
+        self.assertEqual(cached['route_template'], route_template)
+
+    def test_cache_template_does_not_match_static_sibling(self):
+        file_path = f'{self.handler_path}/basic.py'
+        import_path = 'tests.unit.mocks.apigateway.cacher.directory_handlers.basic'
+        endpoint_module = self.importer.import_module_from_file(file_path, import_path)
+        cacher = ResolverCache()
+        cacher.put('/unit-test/v1/user/1', endpoint_module, True, {1: '1'}, ('user', frozenset({'basic'})))
+        self.assertTrue(cacher.get('/unit-test/v1/user/basic', 'user/basic').get('endpoint') is None)
+        self.assertTrue(cacher.get('/unit-test/v1/account/1', 'account/1').get('endpoint') is None)
+        self.assertTrue(cacher.get('/unit-test/v1/user/1/item', 'user/1/item').get('endpoint') is None)
+
+    def test_cache_template_evicted_with_lru(self):
+        file_path = f'{self.handler_path}/basic.py'
+        import_path = 'tests.unit.mocks.apigateway.cacher.directory_handlers.basic'
+        endpoint_module = self.importer.import_module_from_file(file_path, import_path)
+        cacher = ResolverCache(cache_size=1)
+        cacher.put('/unit-test/v1/user/1', endpoint_module, True, {1: '1'}, ('user', frozenset()))
+        cacher.put('/unit-test/v1/basic', endpoint_module, False, {})
+        self.assertTrue(cacher.get('/unit-test/v1/user/2', 'user/2').get('endpoint') is None)
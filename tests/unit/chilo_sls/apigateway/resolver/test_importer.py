@@ -85,3 +85,20 @@ class ResolverImporterTest(unittest.TestCase):
         import_path = 'tests.unit.mocks.apigateway.importer.directory_handlers.basic'
         handler_module = importer.import_module_from_file(file_path, import_path)
         self.assertTrue(hasattr(handler_module, 'post'))
+
+    def test_import_module_from_file_imports_once(self):
+        importer = ResolverImporter(handlers=self.handler_path, mode='directory')
+        file_path = f'{self.handler_path}/nested_1/nested_2/basic.py'
+        import_path = 'tests.unit.mocks.apigateway.importer.directory_handlers.nested_1.nested_2.basic'
+        first_module = importer.import_module_from_file(file_path, import_path)
+        second_module = importer.import_module_from_file(f'./{file_path}', import_path)
+        self.assertIs(first_module, second_module)
+
+    def test_clear_module_cache_reimports_module(self):
+        importer = ResolverImporter(handlers=self.handler_path, mode='directory')
+        file_path = f'{self.handler_path}/basic.py'
+        import_path = 'tests.unit.mocks.apigateway.importer.directory_handlers.basic'
+        first_module = importer.import_module_from_file(file_path, import_path)
+        ResolverImporter.clear_module_cache()
+        second_module = importer.import_module_from_file(file_path, import_path)
+        self.assertIsNot(first_module, second_module)
@@ -1,9 +1,11 @@
 import unittest
+from unittest.mock import patch
 
 from chilo_sls.apigateway.endpoint import Endpoint
 from chilo_sls.apigateway.exception import ApiException
 from chilo_sls.apigateway.request import Request
 from chilo_sls.apigateway.resolver import Resolver
+from chilo_sls.apigateway.resolver.importer import ResolverImporter
 
 from tests.unit.mocks.apigateway import mock_request
 
@@ -69,3 +71,21 @@ class ResolverTest(unittest.TestCase):
         self.assertEqual(1, resolver.cache_misses)
         resolver.get_endpoint(request)
         self.assertEqual(1, resolver.cache_misses)
+
+    def test_auto_load_preload_handlers_imports_modules_before_requests(self):
+        ResolverImporter.clear_module_cache()
+        resolver = Resolver(base_path=self.base_path, handlers=self.handler_path)
+        resolver.auto_load(preload_handlers=True)
+        with patch('importlib.util.module_from_spec', side_effect=AssertionError('handler re-imported')):
+            endpoint = resolver.get_endpoint(Request(self.basic_request))
+        self.assertTrue(isinstance(endpoint, Endpoint))
+
+    def test_dynamic_routes_share_one_cache_entry(self):
+        resolver = Resolver(base_path=self.base_path, handlers=self.handler_path)
+        for user_id in ('1', '2', '3'):
+            event = mock_request.get_dynamic_nested_request_get(f'user/{user_id}/item/a')
+            event['httpMethod'] = 'GET'
+            request = Request(event)
+            resolver.get_endpoint(request)
+            self.assertDictEqual({'user_id': user_id, 'item_id': 'a'}, request.path_params)
+        self.assertEqual(resolver.cache_misses, 1)
@@ -0,0 +1,64 @@
+import unittest
+
+from chilo_sls.apigateway.exception import ApiException
+from chilo_sls.apigateway.resolver.importer import ResolverImporter
+from chilo_sls.apigateway.resolver.route_table import RouteTable
+
+
+class RouteTableTest(unittest.TestCase):
+    pattern_root = 'tests/unit/mocks/apigateway/resolver/pattern_handlers'
+    directory_root = 'tests/unit/mocks/apigateway/resolver/directory_handlers'
+
+    def setUp(self):
+        pattern_importer = ResolverImporter(handlers=f'{self.pattern_root}/**/*_controller.py')
+        self.pattern_table = RouteTable(root_directory=self.pattern_root, file_pattern='*_controller.py', file_separator='/')
+        self.pattern_table.compile(pattern_importer.get_handlers_file_tree())
+        directory_importer = ResolverImporter(handlers=self.directory_root)
+        self.directory_table = RouteTable(root_directory=self.directory_root, file_pattern='*.py', file_separator='/')
+        self.directory_table.compile(directory_importer.get_handlers_file_tree())
+
+    def test_is_compiled(self):
+        table = RouteTable(root_directory=self.pattern_root, file_pattern='*.py', file_separator='/')
+        self.assertFalse(table.is_compiled)
+        self.assertTrue(self.pattern_table.is_compiled)
+
+    def test_static_routes_are_flattened(self):
+        self.assertIn('basic', self.pattern_table.static_routes)
+        self.assertIn('nested_1/nested_2/basic', self.pattern_table.static_routes)
+        self.assertIn('', self.directory_table.static_routes)
+        self.assertIn('user/_user_id/item', self.directory_table.static_routes)
+
+    def test_static_lookup(self):
+        route, dynamic_parts, _ = self.pattern_table.lookup('nested-1/nested-2/basic')
+        self.assertEqual(f'{self.pattern_root}/nested_1/nested_2/basic/basic_controller.py', route[0])
+        self.assertEqual('tests.unit.mocks.apigateway.resolver.pattern_handlers.nested_1.nested_2.basic.basic_controller', route[1])
+        self.assertDictEqual({}, dynamic_parts)
+
+    def test_directory_index_lookup(self):
+        route, _, _ = self.directory_table.lookup('home')
+        self.assertEqual(f'{self.directory_root}/home/__init__.py', route[0])
+
+    def test_root_init_lookup(self):
+        route, _, _ = self.directory_table.lookup('')
+        self.assertEqual(f'{self.directory_root}/__init__.py', route[0])
+
+    def test_dynamic_lookup(self):
+        route, dynamic_parts, _ = self.pattern_table.lookup('user/1/item/a')
+        self.assertEqual(f'{self.pattern_root}/user/_user_id/item/_item_id_controller.py', route[0])
+        self.assertDictEqual({1: '1', 3: 'a'}, dynamic_parts)
+
+    def test_dynamic_file_consumes_remaining_parts(self):
+        route, dynamic_parts, _ = self.directory_table.lookup('triple/1/2/3')
+        self.assertEqual(f'{self.directory_root}/triple/_coordinates.py', route[0])
+        self.assertDictEqual({1: '1', 2: '2', 3: '3'}, dynamic_parts)
+
+    def test_unknown_route_raises_not_found(self):
+        with self.assertRaises(ApiException) as table_error:
+            self.pattern_table.lookup('not/a/route')
+        self.assertEqual(table_error.exception.code, 404)
+        self.assertEqual(table_error.exception.message, 'route not found')
+
+    def test_directory_after_file_raises_not_found(self):
+        with self.assertRaises(ApiException) as table_error:
+            self.directory_table.lookup('basic/user')
+        self.assertEqual(table_error.exception.code, 404)
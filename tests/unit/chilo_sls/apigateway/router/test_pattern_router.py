@@ -69,6 +69,46 @@ class RouterPatternTest(unittest.TestCase):
         self.assertDictEqual(self.expected_open_headers, result['headers'])
         self.assertDictEqual({"router_pattern_basic": {"body_key": "body_value"}}, json_dict_response)
 
+    def test_verbose_logging_skips_unsampled_requests(self):
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_pattern,
+            openapi=self.schema_path,
+            verbose=True,
+            verbose_sample_rate=0
+        )
+        with patch('chilo_sls.apigateway.router.logger.log') as mock_log:
+            result = router.route(self.basic_event, None)
+        self.assertEqual(200, result['statusCode'])
+        mock_log.assert_not_called()
+
+    def test_verbose_logging_uses_route_rate(self):
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_pattern,
+            openapi=self.schema_path,
+            verbose=True,
+            verbose_sample_rate=0,
+            verbose_route_rates={self.basic_event['path']: 1}
+        )
+        with patch('chilo_sls.apigateway.router.logger.log') as mock_log:
+            router.route(self.basic_event, None)
+        self.assertEqual(2, mock_log.call_count)
+
+    def test_verbose_logging_always_logs_errors(self):
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_pattern,
+            verbose=True,
+            verbose_sample_rate=0,
+            on_error=mock_middleware.mock_on_error
+        )
+        with patch('chilo_sls.apigateway.router.logger.log') as mock_log:
+            result = router.route(self.raise_exception_event, None)
+        self.assertNotEqual(200, result['statusCode'])
+        self.assertEqual(1, mock_log.call_count)
+        self.assertEqual('request-processed', mock_log.call_args.kwargs['log']()['title'])
+
     def test_auto_load_works(self):
         try:
             router = Router(
@@ -162,6 +202,17 @@ class RouterPatternTest(unittest.TestCase):
         router.route(self.raise_exception_event, None)
         self.assertTrue(mock_middleware.mock_on_error.has_been_called)
 
+    def test_basic_pattern_routing_works_and_async_on_error_function_awaited(self):
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_pattern,
+            on_error=mock_middleware.mock_async_on_error,
+            openapi=self.schema_path
+        )
+        response = router.route(self.raise_exception_event, None)
+        self.assertTrue(mock_middleware.mock_async_on_error.has_been_called)
+        self.assertEqual('called', response['headers']['x-async-on-error'])
+
     def test_basic_pattern_routing_works_and_bad_on_error_function_caught(self):
         router = Router(
             base_path=self.base_path,
@@ -560,6 +611,19 @@ class RouterPatternTest(unittest.TestCase):
         self.assertTrue(mock_middleware.mock_on_shutdown.has_been_called)
         mock_middleware.mock_on_shutdown.has_been_called = False
 
+    def test_warmup_and_cooldown_await_async_hooks(self):
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_pattern,
+            on_startup=[mock_middleware.mock_async_on_startup],
+            on_shutdown=[mock_middleware.mock_async_on_shutdown],
+            openapi=self.schema_path
+        )
+        router.warmup()
+        router.cooldown()
+        self.assertTrue(mock_middleware.mock_async_on_startup.has_been_called)
+        self.assertTrue(mock_middleware.mock_async_on_shutdown.has_been_called)
+
     def test_cooldown_auto_registered_and_calls_shutdown_hooks(self):
         registered = {}
 
@@ -3,6 +3,7 @@ import os
 from unittest import TestCase, mock
 
 from chilo_sls.apigateway.router import Router
+from chilo_sls.common.logger.common_logger import CommonLogger
 
 from tests.unit.mocks.apigateway import mock_middleware, mock_request
 
@@ -15,6 +16,12 @@ class RouterTimeoutTest(TestCase):
     schema_path = 'tests/unit/mocks/apigateway/openapi.yml'
     mock_request = mock_request
 
+    def setUp(self):
+        CommonLogger.reset()
+
+    def tearDown(self):
+        CommonLogger.reset()
+
     def test_global_timeout_works(self):
         dynamic_event = self.mock_request.get_dynamic_event(
             path='unit-test/v1/timeout',
@@ -42,6 +49,23 @@ class RouterTimeoutTest(TestCase):
         response = router.route(dynamic_event, None)
         self.assertEqual(408, response['statusCode'])
 
+    def test_context_deadline_timeout_works(self):
+        dynamic_event = self.mock_request.get_dynamic_event(
+            path='unit-test/v1/timeout',
+            method='post'
+        )
+        context = mock.Mock()
+        context.get_remaining_time_in_millis.return_value = 200
+        router = Router(
+            base_path=self.base_path,
+            handlers=self.handler_path,
+            use_context_deadline=True
+        )
+        started = time.monotonic()
+        response = router.route(dynamic_event, context)
+        self.assertEqual(408, response['statusCode'])
+        self.assertLess(time.monotonic() - started, 1)
+
     def test_global_timeout_with_middleware_works(self):
         dynamic_event = self.mock_request.get_dynamic_event(
             path='unit-test/v1/timeout',
@@ -101,3 +101,43 @@ class ConfigValidatorTest(unittest.TestCase):
         except ApiException as api_error:
             self.assertTrue(isinstance(api_error, ApiException))
             self.assertEqual('cache_mode should be a string of the one of the following values: all, static-only, dynamic-only', api_error.message)
+
+    def test_config_validator_validates_json_backend_is_appropriate(self):
+        try:
+            ConfigValidator.validate(base_path='some/path', handlers='some/path/**/*.py', json_backend='bad')
+            self.assertTrue(False)
+        except ApiException as api_error:
+            self.assertTrue(isinstance(api_error, ApiException))
+            self.assertEqual('json_backend should be one of the following values: simplejson, json, orjson, ujson, fast', api_error.message)
+
+    def test_config_validator_validates_log_buffer_size_is_appropriate(self):
+        try:
+            ConfigValidator.validate(base_path='some/path', handlers='some/path/**/*.py', buffer_logs=True, log_buffer_size=0)
+            self.assertTrue(False)
+        except ApiException as api_error:
+            self.assertTrue(isinstance(api_error, ApiException))
+            self.assertEqual('log_buffer_size should be a positive int (bytes)', api_error.message)
+
+    def test_config_validator_validates_verbose_sample_rate_is_appropriate(self):
+        try:
+            ConfigValidator.validate(base_path='some/path', handlers='some/path/**/*.py', verbose=True, verbose_sample_rate=1.5)
+            self.assertTrue(False)
+        except ApiException as api_error:
+            self.assertTrue(isinstance(api_error, ApiException))
+            self.assertEqual('verbose_sample_rate should be a number between 0 and 1', api_error.message)
+
+    def test_config_validator_validates_log_request_fields_are_appropriate(self):
+        try:
+            ConfigValidator.validate(base_path='some/path', handlers='some/path/**/*.py', log_request_fields=['event'])
+            self.assertTrue(False)
+        except ApiException as api_error:
+            self.assertTrue(isinstance(api_error, ApiException))
+            self.assertIn('log_request_fields should be a list of the following values', api_error.message)
+
+    def test_config_validator_validates_timeout_ms_is_appropriate(self):
+        try:
+            ConfigValidator.validate(base_path='some/path', handlers='some/path/**/*.py', timeout_ms=0)
+            self.assertTrue(False)
+        except ApiException as api_error:
+            self.assertTrue(isinstance(api_error, ApiException))
+            self.assertEqual('timeout_ms should be a positive number', api_error.message)
@@ -1,3 +1,5 @@
+import asyncio
+import types
 import unittest
 
 from chilo_sls.apigateway.endpoint import Endpoint
@@ -88,3 +90,15 @@ class EndpointTest(unittest.TestCase):
         request = Request({})
         result = endpoint.run(request, response)
         self.assertEqual('{"endpoint_directory_basic": "patch"}', result.full['body'])
+
+    def test_endpoint_runs_async_method(self):
+        async def post(request, response):
+            await asyncio.sleep(0)
+            response.body = {'async': True}
+            return response
+
+        endpoint = Endpoint(types.SimpleNamespace(post=post), 'post')
+        response = Response()
+        result = endpoint.run(Request({}), response)
+        self.assertIs(result, response)
+        self.assertDictEqual(response.raw, {'async': True})
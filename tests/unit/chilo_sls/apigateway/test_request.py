@@ -1,10 +1,12 @@
 import json
 import unittest
 import urllib
+from unittest.mock import patch
 
 import xmltodict
 
 from chilo_sls.apigateway.request import Request
+from chilo_sls.common.json_helper import JsonHelper
 from tests.unit.mocks.apigateway import mock_request
 
 
@@ -86,6 +88,24 @@ class RequestTest(unittest.TestCase):
         request = Request(self.basic_request)
         self.assertDictEqual(request.headers, self.basic_request['headers'])
 
+    def test_headers_are_memoized(self):
+        request = Request(self.basic_request)
+        self.assertIs(request.headers, request.headers)
+
+    def test_body_is_parsed_once(self):
+        request = Request(self.basic_request)
+        with patch.object(JsonHelper, 'decode', wraps=JsonHelper.decode) as decode_spy:
+            first_body = request.body
+            second_body = request.body
+            request_json = request.json
+        self.assertEqual(1, decode_spy.call_count)
+        self.assertIs(first_body, second_body)
+        self.assertIs(first_body, request_json)
+
+    def test_request_has_no_instance_dict(self):
+        request = Request(self.basic_request)
+        self.assertFalse(hasattr(request, '__dict__'))
+
     def test_body_json(self):
         request = Request(self.basic_request)
         self.assertDictEqual(request.body, json.loads(self.basic_request['body']))
@@ -243,3 +263,23 @@ class RequestTest(unittest.TestCase):
     def test_timeout(self):
         request = Request(self.basic_request, None, 30)
         self.assertEqual(request.timeout, 30)
+
+    def test_to_log_dict_uses_default_fields(self):
+        request = Request(self.basic_request)
+        log_dict = request.to_log_dict()
+        self.assertEqual(list(log_dict), list(Request.DEFAULT_LOG_FIELDS))
+        self.assertEqual(log_dict['body'], self.basic_request['body'])
+
+    def test_to_log_dict_selects_fields(self):
+        request = Request(self.basic_request)
+        self.assertDictEqual(request.to_log_dict(fields=['method', 'path']), {'method': 'get', 'path': self.basic_request['path']})
+
+    def test_to_log_dict_truncates_body(self):
+        request = Request({**self.basic_request, 'body': 'x' * 20})
+        self.assertEqual(request.to_log_dict(fields=['body'], max_body_size=5)['body'], 'xxxxx...[truncated 15 chars]')
+
+    def test_to_log_dict_does_not_parse_body(self):
+        request = Request(self.basic_request)
+        with patch('chilo_sls.apigateway.request.JsonHelper.decode') as mock_decode:
+            request.to_log_dict()
+        mock_decode.assert_not_called()
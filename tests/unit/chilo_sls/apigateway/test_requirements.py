@@ -72,6 +72,18 @@ class ApigatewayRequirementsTest(unittest.TestCase):
         except ApiTimeOutException as error:
             self.assertTrue(isinstance(error, ApiTimeOutException))
 
+    def test_requirements_millisecond_timeout_raises_exception(self):
+        request = Request(self.basic_request)
+        response = Response()
+        with self.assertRaises(ApiTimeOutException):
+            basic.put(request, response)
+
+    def test_requirements_exposes_remaining_time(self):
+        request = Request(self.basic_request)
+        response = Response()
+        basic.delete(request, response)
+        self.assertTrue(0 < response.raw['remaining_time_ms'] <= 1000)
+
     def test_requirements_local_overwrites_global_timeout_setting(self):
         event = mock_request.get_dynamic_event(method='patch')
         request = Request(event, None, 10)
@@ -81,3 +93,11 @@ class ApigatewayRequirementsTest(unittest.TestCase):
             self.assertTrue(False)
         except ApiTimeOutException as error:
             self.assertTrue(isinstance(error, ApiTimeOutException))
+
+    def test_requirements_runs_async_handler(self):
+        request = Request(self.basic_request)
+        response = Response()
+        result = basic.async_post(request, response)
+        self.assertIs(result, response)
+        self.assertDictEqual(response.raw, {'requirements_async': True})
+        self.assertEqual(response.headers['x-async-before'], 'true')
@@ -2,8 +2,10 @@ import base64
 import gzip
 import json
 import unittest
+from unittest.mock import patch
 
 from chilo_sls.apigateway.response import Response
+from chilo_sls.common.json_helper import JsonHelper
 
 
 class ResponseTest(unittest.TestCase):
@@ -62,6 +64,46 @@ class ResponseTest(unittest.TestCase):
         self.assertEqual(apigateway_response['headers']['Content-Encoding'], 'gzip')
         self.assertDictEqual(decoded, {'unit-test': True})
 
+    def test_body_is_encoded_once(self):
+        self.response.body = {'unit-test': True}
+        with patch.object(JsonHelper, 'encode', wraps=JsonHelper.encode) as encode_spy:
+            self.response.full
+            str(self.response)
+            self.response.body
+        self.assertEqual(1, encode_spy.call_count)
+
+    def test_body_setter_resets_encoded_body(self):
+        self.response.body = {'first': True}
+        self.assertEqual('{"first": true}', self.response.body)
+        self.response.body = {'second': True}
+        self.assertEqual('{"second": true}', self.response.body)
+        self.response.set_error('root', 'bad')
+        self.assertIn('errors', json.loads(self.response.body))
+
+    def test_compress_disabled_after_encoding(self):
+        self.response.body = {'unit-test': True}
+        self.response.compress = True
+        self.assertTrue(self.response.full['isBase64Encoded'])
+        self.response.compress = False
+        apigateway_response = self.response.full
+        self.assertFalse(apigateway_response['isBase64Encoded'])
+        self.assertNotIn('Content-Encoding', apigateway_response['headers'])
+        self.assertEqual('{"unit-test": true}', apigateway_response['body'])
+
+    def test_compress_disabled_restores_caller_content_encoding(self):
+        self.response.headers = ('Content-Encoding', 'br')
+        self.response.body = {'unit-test': True}
+        self.response.compress = True
+        self.assertEqual('gzip', self.response.full['headers']['Content-Encoding'])
+        self.response.compress = False
+        self.assertEqual('br', self.response.full['headers']['Content-Encoding'])
+
+    def test_full_reencodes_body_mutated_in_place(self):
+        self.response.body = {'first': True}
+        self.assertEqual('{"first": true}', self.response.full['body'])
+        self.response.raw['second'] = True
+        self.assertEqual('{"first": true, "second": true}', self.response.full['body'])
+
     def test_default_code(self):
         self.response.body = {'key': 'value'}
         self.assertEqual(self.response.code, 200)
@@ -110,3 +152,20 @@ class ResponseTest(unittest.TestCase):
     def test_raw(self):
         self.response.body = {'raw': True}
         self.assertDictEqual({'raw': True}, self.response.raw)
+
+    def test_to_log_dict_uses_default_fields(self):
+        self.response.body = {'logged': True}
+        self.assertDictEqual(self.response.to_log_dict(), {'statusCode': 200, 'hasErrors': False, 'body': '{"logged": true}'})
+
+    def test_to_log_dict_selects_fields_and_truncates_body(self):
+        self.response.body = {'logged': 'x' * 20}
+        log_dict = self.response.to_log_dict(fields=['statusCode', 'body'], max_body_size=10)
+        self.assertEqual(log_dict['statusCode'], 200)
+        self.assertEqual(log_dict['body'], '{"logged":...[truncated 24 chars]')
+
+    def test_to_log_dict_reuses_encoded_body(self):
+        self.response.body = {'logged': True}
+        self.response.full
+        with patch('chilo_sls.apigateway.response.JsonHelper.encode') as mock_encode:
+            self.response.to_log_dict()
+        mock_encode.assert_not_called()
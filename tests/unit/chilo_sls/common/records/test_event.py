@@ -26,3 +26,10 @@ class CommonRecordsTest(unittest.TestCase):
     def test_event_accepts_event_provides_raw_records(self):
         event = Event(self.event)
         self.assertDictEqual(event.raw_records[0], self.event)
+
+    def test_event_refresh_keeps_raw_records(self):
+        event = Event(self.event)
+        first = event.records
+        self.assertIs(event.records, first)
+        self.assertDictEqual(event.refresh()[0].body, self.event)
+        self.assertDictEqual(event.raw_records[0], self.event)
@@ -1,6 +1,16 @@
+import asyncio
+import copy
+import threading
+import time
+import types
 import unittest
+from unittest.mock import patch
 
-from chilo_sls.common.records.exception import EventTimeOutException
+from jsonschema import Draft7Validator
+
+from chilo_sls.common.records.exception import EventException, EventTimeOutException
+from chilo_sls.common.records.requirements import requirements
+from chilo_sls.common.validator import Validator
 
 from chilo_sls.common.records.event import Event as CommonEvent
 from chilo_sls.documentdb.event import Event as DocumentDBEvent
@@ -23,7 +33,8 @@ from tests.unit.mocks.s3 import mock_event as mock_s3
 from tests.unit.mocks.sns import mock_event as mock_sns
 from tests.unit.mocks.sqs import mock_event as mock_sqs
 
-from tests.unit.mocks.common.mock_functions import mock_func_verbose, mock_func_timeout
+from tests.unit.mocks.common import mock_functions
+from tests.unit.mocks.common.mock_functions import mock_func_verbose, mock_func_timeout, mock_func_stream, mock_func_batch_item_failures
 
 
 class CommonRequirementsTest(unittest.TestCase):
@@ -85,3 +96,111 @@ class CommonRequirementsTest(unittest.TestCase):
             self.assertTrue(False)
         except EventTimeOutException as error:
             self.assertTrue(isinstance(error, EventTimeOutException))
+
+    def test_decorator_timeout_leaves_no_side_effects(self):
+        mock_functions.mock_timeout_side_effects.clear()
+        with self.assertRaises(EventTimeOutException):
+            mock_functions.mock_func_batch_timeout(self.sqs_event, self.context)
+        time.sleep(0.4)
+        self.assertEqual(mock_functions.mock_timeout_side_effects, [])
+
+    def test_decorator_async_batch_timeout_runs_on_calling_thread(self):
+        mock_functions.mock_timeout_side_effects.clear()
+        thread_count = threading.active_count()
+        with self.assertRaises(EventTimeOutException):
+            mock_functions.mock_func_async_batch_timeout(self.sqs_event, self.context)
+        self.assertEqual(threading.active_count(), thread_count)
+        time.sleep(0.4)
+        self.assertEqual(mock_functions.mock_timeout_side_effects, [])
+
+    def test_decorator_with_stream(self):
+        result = mock_func_stream(self.sqs_event, self.context)
+        self.assertTrue(isinstance(result, types.GeneratorType))
+        self.assertEqual(len(list(result)), len(self.sqs_event['Records']))
+
+    def test_decorator_with_batch_item_failures(self):
+        event = copy.deepcopy(self.sqs_event)
+        poison_record = copy.deepcopy(event['Records'][0])
+        poison_record['messageId'] = 'poison-message'
+        poison_record['body'] = '{"fail": true}'
+        event['Records'].append(poison_record)
+        result = mock_func_batch_item_failures(event, self.context)
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': 'poison-message'}]})
+
+    def test_decorator_with_batch_item_failures_all_succeed(self):
+        result = mock_func_batch_item_failures(self.sqs_event, self.context)
+        self.assertDictEqual(result, {'batchItemFailures': []})
+
+    def test_decorator_with_concurrency(self):
+        @requirements(concurrency=4)
+        def handler(record):
+            return record.message_id
+
+        result = handler(self.sqs_event, self.context)
+        self.assertListEqual(result, [record['messageId'] for record in self.sqs_event['Records']])
+
+    def test_decorator_accepts_user_validator_kwarg(self):
+        @requirements(validator='custom')
+        def handler(event):
+            return len(event.records)
+
+        self.assertEqual(handler(self.sqs_event, self.context), len(self.sqs_event['Records']))
+
+    def test_decorator_rejects_invalid_concurrency(self):
+        with self.assertRaises(EventException):
+            requirements(concurrency=0)
+
+    def test_decorator_with_async_batch_handler(self):
+        @requirements()
+        async def handler(event):
+            return [record.message_id async for record in event.aiter_records()]
+
+        result = handler(self.sqs_event, self.context)
+        self.assertListEqual(result, [record['messageId'] for record in self.sqs_event['Records']])
+
+    def test_decorator_with_async_record_handler(self):
+        running = []
+        peak = []
+        event = copy.deepcopy(self.sqs_event)
+        for index in range(5):
+            record = copy.deepcopy(self.sqs_event['Records'][0])
+            record['messageId'] = f'message-{index}'
+            event['Records'].append(record)
+
+        @requirements(concurrency=2)
+        async def handler(record):
+            running.append(record.message_id)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(record.message_id)
+            return record.message_id
+
+        result = handler(event, self.context)
+        self.assertListEqual(result, [record['messageId'] for record in event['Records']])
+        self.assertEqual(max(peak), 2)
+
+    def test_decorator_with_async_record_handler_batch_item_failures(self):
+        @requirements(batch_item_failures=True)
+        async def handler(record):
+            await asyncio.sleep(0)
+            raise ValueError('poison message')
+
+        result = handler(self.sqs_event, self.context)
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': self.sqs_event['Records'][0]['messageId']}]})
+
+    def test_decorator_rejects_csv_byte_range_without_fieldnames(self):
+        with self.assertRaises(EventException) as context:
+            requirements(get_object=True, data_type='csv', byte_range=(10, 100))
+        self.assertEqual('byte_range starting after byte 0 requires fieldnames for csv data_type', context.exception.message)
+
+    def test_decorator_builds_validator_once(self):
+        with patch('chilo_sls.common.records.requirements.Validator', wraps=Validator) as mock_validator:
+            @requirements(openapi='tests/unit/mocks/sqs/openapi.yml', required_body='v1-sqs-body')
+            def handler(event):
+                return event.records
+
+            with patch.object(Draft7Validator, 'check_schema', wraps=Draft7Validator.check_schema) as mock_draft:
+                for _ in range(3):
+                    self.assertEqual(len(handler(self.sqs_event, self.context)), len(self.sqs_event['Records']))
+        self.assertEqual(mock_validator.call_count, 1)
+        mock_draft.assert_not_called()
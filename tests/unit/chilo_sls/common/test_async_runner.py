@@ -0,0 +1,35 @@
+import asyncio
+import threading
+import unittest
+
+from chilo_sls.common.async_runner import AsyncRunner
+
+
+async def mock_coroutine(value):
+    await asyncio.sleep(0)
+    return value
+
+
+class AsyncRunnerTest(unittest.TestCase):
+
+    def test_run_returns_non_awaitable(self):
+        self.assertEqual(AsyncRunner.run('value'), 'value')
+
+    def test_run_drives_coroutine(self):
+        self.assertEqual(AsyncRunner.run(mock_coroutine('value')), 'value')
+
+    def test_run_reuses_event_loop(self):
+        self.assertIs(AsyncRunner.get_loop(), AsyncRunner.get_loop())
+
+    def test_run_replaces_closed_event_loop(self):
+        loop = AsyncRunner.get_loop()
+        loop.close()
+        self.assertIsNot(AsyncRunner.get_loop(), loop)
+        self.assertEqual(AsyncRunner.run(mock_coroutine('value')), 'value')
+
+    def test_run_uses_event_loop_per_thread(self):
+        loops = []
+        thread = threading.Thread(target=lambda: loops.append(AsyncRunner.get_loop()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(loops[0], AsyncRunner.get_loop())
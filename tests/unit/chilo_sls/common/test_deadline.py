@@ -0,0 +1,128 @@
+import asyncio
+import signal
+import threading
+import time
+import unittest
+from unittest import mock
+
+from chilo_sls.common.deadline import Deadline
+
+
+async def mock_slow_coroutine():
+    await asyncio.sleep(1)
+    return 'late'
+
+
+class DeadlineTest(unittest.TestCase):
+
+    def test_deadline_without_budget_runs_function(self):
+        deadline = Deadline()
+        self.assertFalse(deadline.has_deadline)
+        self.assertIsNone(deadline.remaining_ms)
+        self.assertEqual(deadline.run(lambda value: value, 'value'), 'value')
+
+    def test_deadline_supports_milliseconds(self):
+        deadline = Deadline(timeout_ms=300)
+        self.assertTrue(0 < deadline.remaining_ms <= 300)
+
+    def test_deadline_supports_fractional_seconds(self):
+        deadline = Deadline(timeout=0.3)
+        self.assertTrue(0 < deadline.remaining_ms <= 300)
+
+    def test_deadline_uses_smallest_budget(self):
+        context = mock.Mock()
+        context.get_remaining_time_in_millis.return_value = 250
+        deadline = Deadline(timeout=10, context=context, buffer_ms=50)
+        self.assertTrue(150 < deadline.remaining_ms <= 200)
+
+    def test_deadline_ignores_context_without_remaining_time(self):
+        self.assertFalse(Deadline(context=object()).has_deadline)
+
+    def test_deadline_raises_configured_error_for_sync_function(self):
+        deadline = Deadline(timeout_ms=50, error=ValueError)
+        started = time.monotonic()
+        with self.assertRaises(ValueError):
+            deadline.run(time.sleep, 1)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_deadline_cancels_coroutine_function(self):
+        with self.assertRaises(TimeoutError):
+            Deadline(timeout_ms=50).run(mock_slow_coroutine)
+
+    def test_deadline_raises_when_already_expired(self):
+        deadline = Deadline(timeout_ms=1)
+        time.sleep(0.01)
+        self.assertTrue(deadline.is_expired)
+        with self.assertRaises(TimeoutError):
+            deadline.check()
+
+    def test_deadline_reraises_function_errors(self):
+        def raise_error():
+            raise KeyError('failed')
+        with self.assertRaises(KeyError):
+            Deadline(timeout=1).run(raise_error)
+
+    def test_deadline_is_current_while_running(self):
+        deadline = Deadline(timeout=1)
+        self.assertIs(deadline.run(Deadline.current), deadline)
+        self.assertIsNone(Deadline.current())
+
+    def test_deadline_timed_out_handler_has_no_later_side_effects(self):
+        side_effects = []
+        thread_count = threading.active_count()
+
+        def handler():
+            time.sleep(0.3)
+            side_effects.append('late')
+
+        with self.assertRaises(TimeoutError):
+            Deadline(timeout_ms=50).run(handler)
+        time.sleep(0.4)
+        self.assertEqual(side_effects, [])
+        self.assertEqual(threading.active_count(), thread_count)
+
+    def test_deadline_restores_previous_alarm_handler(self):
+        previous = signal.getsignal(signal.SIGALRM)
+        Deadline(timeout=1).run(lambda: None)
+        self.assertIs(signal.getsignal(signal.SIGALRM), previous)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+
+    def test_deadline_runs_sync_function_on_calling_thread(self):
+        self.assertIs(Deadline(timeout=1).run(threading.current_thread), threading.current_thread())
+
+    def test_deadline_awaits_coroutine_results(self):
+        with self.assertRaises(TimeoutError):
+            Deadline(timeout_ms=50).run(lambda: mock_slow_coroutine())
+
+    def test_deadline_is_cooperative_off_main_thread(self):
+        outcome = {}
+
+        def target():
+            try:
+                Deadline(timeout_ms=50).run(time.sleep, 0.1)
+            except TimeoutError as error:
+                outcome['error'] = error
+
+        worker = threading.Thread(target=target)
+        worker.start()
+        worker.join(2)
+        self.assertIsInstance(outcome.get('error'), TimeoutError)
+
+    def test_deadline_check_current_raises_inside_expired_run(self):
+        outcome = {}
+
+        def target():
+            def handler():
+                time.sleep(0.1)
+                Deadline.check_current()
+                outcome['late'] = True
+            try:
+                Deadline(timeout_ms=50).run(handler)
+            except TimeoutError as error:
+                outcome['error'] = error
+
+        worker = threading.Thread(target=target)
+        worker.start()
+        worker.join(2)
+        self.assertNotIn('late', outcome)
+        self.assertIsInstance(outcome.get('error'), TimeoutError)
@@ -1,4 +1,11 @@
+import decimal
 import unittest
+from unittest import mock
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from chilo_sls.common.json_helper import JsonHelper
 
@@ -44,3 +51,49 @@ class JsonHelperTest(unittest.TestCase):
             fail = False
         if fail:
             self.fail('didnt raise error')
+
+    def test_decode_default_preserves_decimal(self):
+        decoded = JsonHelper.decode('{"price": 1.10}')
+        self.assertEqual(decoded['price'], decimal.Decimal('1.10'))
+
+    def test_backends_decode_and_encode(self):
+        for backend in JsonHelper.BACKENDS:
+            decoded = JsonHelper.decode(self.valid_json, backend=backend)
+            self.assertDictEqual(decoded, self.valid_dict)
+            encoded = JsonHelper.encode(self.valid_dict, backend=backend)
+            self.assertDictEqual(JsonHelper.decode(encoded), self.valid_dict)
+
+    def test_std_backend_encodes_decimal(self):
+        encoded = JsonHelper.encode({'count': decimal.Decimal('2'), 'price': decimal.Decimal('1.5')}, backend='json')
+        self.assertEqual(encoded, '{"count": 2, "price": 1.5}')
+
+    def test_unknown_backend_raises_error(self):
+        with self.assertRaises(ValueError):
+            JsonHelper.decode(self.valid_json, backend='fake')
+
+    def test_unknown_backend_raises_error_even_without_raise_error(self):
+        with self.assertRaises(ValueError):
+            JsonHelper.encode(self.valid_dict, backend='fake')
+
+    def test_set_default_backend(self):
+        JsonHelper.set_default_backend('json')
+        try:
+            self.assertIsInstance(JsonHelper.decode('{"price": 1.10}')['price'], float)
+        finally:
+            JsonHelper.set_default_backend()
+        self.assertEqual(JsonHelper.decode('{"price": 1.10}')['price'], decimal.Decimal('1.10'))
+
+    @unittest.skipUnless(orjson is not None, 'orjson not installed')
+    def test_orjson_backend_encodes_decimal(self):
+        encoded = JsonHelper.encode({'price': decimal.Decimal('1.5')}, backend='orjson')
+        self.assertEqual(encoded, '{"price":1.5}')
+
+    @unittest.skipUnless(orjson is not None, 'orjson not installed')
+    def test_orjson_backend_encodes_non_string_keys(self):
+        self.assertEqual(JsonHelper.encode({1: 'one'}, raise_error=True, backend='orjson'), '{"1":"one"}')
+
+    def test_missing_explicit_backend_raises_error(self):
+        with mock.patch.dict(JsonHelper._JsonHelper__backends, {'orjson': None}):
+            with self.assertRaises(ValueError) as context:
+                JsonHelper.get_backend('orjson')
+        self.assertEqual(str(context.exception), 'json_backend orjson requires the orjson package to be installed')
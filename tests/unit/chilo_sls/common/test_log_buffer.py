@@ -0,0 +1,78 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from chilo_sls.common import logger
+from chilo_sls.common.logger.common_logger import CommonLogger
+from chilo_sls.common.logger.log_buffer import LogBuffer
+
+
+class LogBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        CommonLogger.reset()
+
+    def tearDown(self):
+        CommonLogger.reset()
+
+    def test_buffer_writes_once_on_flush(self):
+        buffer = io.StringIO()
+        log_buffer = LogBuffer()
+        with redirect_stdout(buffer):
+            log_buffer.write('first')
+            log_buffer.write('second')
+            self.assertEqual(buffer.getvalue(), '')
+            log_buffer.flush()
+        self.assertEqual(buffer.getvalue(), 'first\nsecond\n')
+        self.assertEqual(log_buffer.size, 0)
+
+    def test_buffer_flushes_early_at_size_cap(self):
+        buffer = io.StringIO()
+        log_buffer = LogBuffer(max_bytes=10)
+        with redirect_stdout(buffer):
+            log_buffer.write('12345')
+            self.assertEqual(buffer.getvalue(), '')
+            log_buffer.write('67890')
+        self.assertEqual(buffer.getvalue(), '12345\n67890\n')
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_logger_buffers_until_context_exits(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            with logger.buffered():
+                logger.log(level='INFO', log='first')
+                logger.log(level='INFO', log='second')
+                self.assertEqual(buffer.getvalue(), '')
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith('log=first'))
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_logger_flushes_buffer_on_error(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            with self.assertRaises(ValueError):
+                with logger.buffered():
+                    logger.log(level='INFO', log='before-error')
+                    raise ValueError('error')
+        self.assertIn('log=before-error', buffer.getvalue())
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_logger_nested_buffer_flushes_at_outer_exit(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            with logger.buffered():
+                with logger.buffered():
+                    logger.log(level='INFO', log='nested')
+                self.assertEqual(buffer.getvalue(), '')
+        self.assertIn('log=nested', buffer.getvalue())
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_logger_disabled_buffer_prints_immediately(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            with logger.buffered(False):
+                logger.log(level='INFO', log='direct')
+                self.assertIn('log=direct', buffer.getvalue())
@@ -0,0 +1,106 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from chilo_sls.common.logger.decorator import log
+from chilo_sls.common.logger.common_logger import CommonLogger
+from chilo_sls.common.logger.log_sampler import LogSampler, TokenBucket
+
+
+@log(sample_rate=0)
+def mock_func_never_sampled(arg1):
+    return arg1
+
+
+@log(sample_rate=0, always_on_error=True)
+def mock_func_error_sampled(arg1):
+    raise ValueError(arg1)
+
+
+@log(rate_limit=1, burst=1)
+def mock_func_rate_limited(arg1):
+    return arg1
+
+
+class LogSamplerTest(unittest.TestCase):
+
+    def setUp(self):
+        CommonLogger.reset()
+
+    def tearDown(self):
+        CommonLogger.reset()
+
+    def test_token_bucket_limits_burst(self):
+        bucket = TokenBucket(rate=1, burst=2)
+        self.assertTrue(bucket.consume())
+        self.assertTrue(bucket.consume())
+        self.assertFalse(bucket.consume())
+
+    def test_token_bucket_refills_over_time(self):
+        with mock.patch('chilo_sls.common.logger.log_sampler.time.monotonic', side_effect=[0.0, 0.0, 0.5, 1.0]):
+            bucket = TokenBucket(rate=2, burst=1)
+            self.assertTrue(bucket.consume())
+            self.assertTrue(bucket.consume())
+            self.assertTrue(bucket.consume())
+
+    def test_sampler_uses_fixed_rate(self):
+        sampler = LogSampler(sample_rate=0.5)
+        with mock.patch('chilo_sls.common.logger.log_sampler.random.random', return_value=0.4):
+            self.assertTrue(sampler.should_log())
+        with mock.patch('chilo_sls.common.logger.log_sampler.random.random', return_value=0.6):
+            self.assertFalse(sampler.should_log())
+
+    def test_sampler_uses_route_rate(self):
+        sampler = LogSampler(sample_rate=0, route_rates={'/orders': 1})
+        self.assertTrue(sampler.should_log('/orders'))
+        self.assertTrue(sampler.should_log('/unknown', '/orders'))
+        self.assertFalse(sampler.should_log('/users'))
+
+    def test_sampler_always_logs_errors(self):
+        sampler = LogSampler(sample_rate=0, rate_limit=1, burst=1)
+        sampler.should_log()
+        self.assertTrue(sampler.should_log(error=True))
+        self.assertFalse(LogSampler(sample_rate=0, always_on_error=False).should_log(error=True))
+
+    def test_sampler_applies_rate_limit(self):
+        sampler = LogSampler(rate_limit=1, burst=1)
+        self.assertTrue(sampler.should_log())
+        self.assertFalse(sampler.should_log())
+
+    def test_sampler_validates_settings(self):
+        self.assertIsNone(LogSampler.validate(sample_rate=0.1, route_rates={'/a': 1}, rate_limit=5, burst=10))
+        self.assertEqual(LogSampler.validate(sample_rate=2), 'sample_rate should be a number between 0 and 1')
+        self.assertEqual(LogSampler.validate(route_rates={'/a': -1}), 'route_rates should be a dict of route to a number between 0 and 1')
+        self.assertEqual(LogSampler.validate(rate_limit=0), 'rate_limit should be a positive number (logs per second)')
+        self.assertEqual(LogSampler.validate(burst=0.5), 'burst should be a number greater than or equal to 1')
+        self.assertEqual(LogSampler.validate(prefix='verbose_', verbose_always_on_error=1), 'verbose_always_on_error should be a boolean')
+
+    def test_decorator_rejects_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            log(sample_rate='all')
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_decorator_skips_unsampled_calls(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            result = mock_func_never_sampled(1)
+        self.assertEqual(result, 1)
+        self.assertEqual(buffer.getvalue(), '')
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_decorator_logs_errors_when_unsampled(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            with self.assertRaises(ValueError):
+                mock_func_error_sampled('failed')
+        self.assertTrue(buffer.getvalue().startswith('ERROR|'))
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'INLINE', 'LOG_LEVEL': 'INFO'})
+    def test_decorator_applies_rate_limit(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            mock_func_rate_limited(1)
+            mock_func_rate_limited(2)
+        self.assertEqual(len(buffer.getvalue().splitlines()), 1)
@@ -5,6 +5,7 @@ from contextlib import redirect_stdout
 from unittest import TestCase, mock
 
 from chilo_sls.common import logger
+from chilo_sls.common.logger.common_logger import CommonLogger
 from chilo_sls.common.logger.decorator import log
 
 def some_log_condition(*args, **_):
@@ -27,6 +28,12 @@ def mock_func_condition(arg1, arg2, **kwargs):
 
 class LoggerTest(TestCase):
 
+    def setUp(self):
+        CommonLogger.reset()
+
+    def tearDown(self):
+        CommonLogger.reset()
+
     @mock.patch.dict(os.environ, {'RUN_MODE': 'SEE-LOGS', 'LOG_STAGE_VARIABLE': 'STAGE', 'STAGE': 'local'})
     def test_logger_logs_simple_local_json(self):
         logger.log(level='ERROR', log={'error': 'test-simple'})
@@ -122,3 +129,74 @@ class LoggerTest(TestCase):
     @mock.patch.dict(os.environ, {'RUN_MODE': 'SEE-LOGS', 'LOG_STAGE_VARIABLE': 'STAGE', 'STAGE': 'local', 'LOG_LEVEL': 'ERROR', 'LOG_FORMAT': 'BAD'})
     def test_logger_handles_bad_format(self):
         logger.log(level='INFO', log={'INFO': 'ignore'})
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_json_output_is_single_line(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            logger.log(level='INFO', log={'compact': True})
+        log_output = buffer.getvalue()
+        self.assertEqual(log_output.count('\n'), 1)
+        self.assertListEqual(json.loads(log_output)['trace'], [])
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_json_output_includes_active_traceback(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            try:
+                raise ValueError('trace-me')
+            except ValueError as error:
+                logger.log(level='ERROR', log={'error': str(error)})
+        self.assertIn('ValueError: trace-me', json.loads(buffer.getvalue())['trace'])
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_is_reused(self):
+        self.assertIs(CommonLogger.get_logger(), CommonLogger.get_logger())
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_reads_environment_once(self):
+        CommonLogger.get_logger()
+        with mock.patch('chilo_sls.common.logger.common_logger.os.getenv') as mock_getenv:
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                logger.log(level='INFO', log={'cached': True})
+        mock_getenv.assert_not_called()
+
+    def test_logger_reset_picks_up_environment_changes(self):
+        with mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'}):
+            self.assertTrue(CommonLogger.get_logger().is_enabled('INFO'))
+        with mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'ERROR'}):
+            self.assertTrue(CommonLogger.get_logger().is_enabled('INFO'))
+            CommonLogger.reset()
+            self.assertFalse(CommonLogger.get_logger().is_enabled('INFO'))
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'ERROR'})
+    def test_logger_checks_level_before_building_payload(self):
+        build_payload = mock.Mock(return_value={'lazy': True})
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            logger.log(level='INFO', log=lambda: build_payload())
+        build_payload.assert_not_called()
+        self.assertEqual(buffer.getvalue(), '')
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_builds_lazy_payload(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            logger.log(level='INFO', log=lambda: {'lazy': True})
+        self.assertDictEqual(json.loads(buffer.getvalue())['log'], {'lazy': True})
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_logger_uses_to_log_dict(self):
+        loggable = mock.Mock()
+        loggable.to_log_dict.return_value = {'summary': True}
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            logger.log(level='INFO', log={'item': loggable})
+        self.assertDictEqual(json.loads(buffer.getvalue())['log'], {'item': {'summary': True}})
+
+    @mock.patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'ERROR'})
+    def test_logger_skips_to_log_dict_below_level(self):
+        loggable = mock.Mock()
+        logger.log(level='INFO', log={'item': loggable})
+        loggable.to_log_dict.assert_not_called()
@@ -185,3 +185,10 @@ class SchemaTest(unittest.TestCase):
         schema = Schema(openapi=self.schema_path)
         spec = schema.get_route_spec('/unit-test/v1/schema', 'get')
         self.assertDictEqual(self.expected_route_spec, spec)
+
+    def test_get_body_spec_does_not_mutate_required_body(self):
+        schema = Schema(openapi=self.schema_path)
+        required_body = {'type': 'object', 'properties': {'id': {'type': 'string'}}}
+        spec = schema.get_body_spec(required_body)
+        self.assertFalse(spec['additionalProperties'])
+        self.assertNotIn('additionalProperties', required_body)
@@ -1,7 +1,11 @@
 import unittest
+from unittest.mock import patch
+
+from jsonschema import Draft7Validator
 
 from chilo_sls.apigateway.request import Request
 from chilo_sls.apigateway.response import Response
+from chilo_sls.common.schema import Schema
 from chilo_sls.common.validator import Validator
 
 from tests.unit.mocks.apigateway import mock_request
@@ -139,3 +143,86 @@ class ValidatorTest(unittest.TestCase):
         self.validator.validate_request(request, response, requirements)
         self.assertTrue(response.has_errors)
         self.assertEqual('{"errors": [{"key_path": "id", "message": "Field required"}]}', response.body)
+
+    def test_auto_load_compiles_route_plans(self):
+        self.validator.auto_load()
+        plan = self.validator.get_route_plan('/unit-test/v1/schema', 'patch')
+        self.assertEqual(('key',), plan.required_headers)
+        self.assertEqual(('unit_id',), plan.required_query)
+        self.assertTrue(plan.has_body)
+        self.assertTrue(plan.has_responses)
+        self.assertIs(plan, self.validator.get_route_plan('/unit-test/v1/schema', 'patch'))
+
+    def test_auto_load_accepts_media_types_without_schema(self):
+        validator = Validator(openapi='tests/unit/mocks/common/lenient_openapi.yml')
+        validator.auto_load()
+        plan = validator.get_route_plan('/unit-test/v1/upload', 'put')
+        self.assertTrue(plan.has_body)
+        self.assertIsNone(plan.get_body_validator('application/octet-stream'))
+        self.assertIsNone(plan.get_response_validator(200, 'application/octet-stream'))
+
+    def test_validate_request_with_openapi_skips_media_types_without_schema(self):
+        validator = Validator(openapi='tests/unit/mocks/common/lenient_openapi.yml')
+        validator.auto_load()
+        request = Request({'path': '/unit-test/v1/upload', 'httpMethod': 'PUT', 'headers': {'content-type': 'application/octet-stream'}, 'body': 'raw-bytes'})
+        request.route = '/unit-test/v1/upload'
+        response = Response()
+        validator.validate_request_with_openapi(request, response)
+        self.assertFalse(response.has_errors)
+
+    def test_auto_load_compiles_openapi_30_schemas(self):
+        validator = Validator(openapi='tests/unit/mocks/common/lenient_openapi.yml')
+        validator.auto_load()
+        plan = validator.get_route_plan('/unit-test/v1/upload', 'put')
+        self.assertIsInstance(plan.get_body_validator('application/json'), Draft7Validator)
+
+    def test_auto_load_skips_routes_that_fail_to_compile(self):
+        validator = Validator(openapi='tests/unit/mocks/common/lenient_openapi.yml')
+        with patch.object(Validator, '_Validator__compile_route_plan', side_effect=KeyError('schema')):
+            validator.auto_load()
+        self.assertTrue(validator.get_route_plan('/unit-test/v1/upload', 'put').has_body)
+
+    def test_get_route_plan_includes_available_with_required(self):
+        plan = self.validator.get_route_plan('/unit-test/v1/schema', 'get')
+        self.assertEqual(('unit_id',), plan.required_query)
+        self.assertSetEqual({'test_id', 'unit_id'}, set(plan.available_query))
+        self.assertFalse(plan.has_body)
+
+    def test_validate_request_with_openapi_uses_compiled_plan(self):
+        self.validator.auto_load()
+        request = Request(mock_request.get_openapi_validate_request_data())
+        response = Response()
+        with patch.object(Schema, 'get_route_spec', side_effect=AssertionError('route spec rebuilt')):
+            self.validator.validate_request_with_openapi(request, response)
+        self.assertFalse(response.has_errors)
+
+    def test_validate_response_with_openapi_uses_compiled_plan(self):
+        request = Request(mock_request.get_openapi_validate_request_data())
+        response = Response()
+        response.body = {'unexpected': True}
+        self.validator.openapi_validate_response_with_openapi(request, response)
+        self.assertTrue(response.has_errors)
+        self.assertEqual(500, response.code)
+
+    def test_get_body_validator_is_cached_per_requirement(self):
+        required_body = {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'string'}}}
+        first_validator = self.validator.get_body_validator(required_body)
+        self.assertIs(first_validator, self.validator.get_body_validator(required_body))
+        self.assertIs(self.validator.get_body_validator('v1-required-body-test'), self.validator.get_body_validator('v1-required-body-test'))
+        self.assertNotIn('additionalProperties', required_body)
+
+    def test_get_body_validator_returns_pydantic_model(self):
+        self.assertIs(UserRequest, self.validator.get_body_validator(UserRequest))
+
+    def test_validate_record_body_reuses_validator(self):
+        validator = Validator(openapi='tests/unit/mocks/sqs/openapi.yml')
+        body = {'lang': 'en-us', 'sms': True, 'email': True, 'push': True}
+        with patch.object(Draft7Validator, 'check_schema', wraps=Draft7Validator.check_schema) as mock_draft:
+            for _ in range(3):
+                self.assertListEqual(validator.validate_record_body(body, 'v1-sqs-body'), [])
+        self.assertEqual(mock_draft.call_count, 1)
+
+    def test_validate_record_body_with_pydantic_model(self):
+        errors = Validator().validate_record_body({'id': -1, 'email': 'a', 'active': True, 'favorites': [], 'notification_config': {}}, UserRequest)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['key'], 'id')
@@ -0,0 +1,85 @@
+import datetime
+import decimal
+import unittest
+
+from chilo_sls.dynamodb.deserializer import AttributeDeserializer
+
+
+class AttributeDeserializerTest(unittest.TestCase):
+
+    def test_deserialize_scalars(self):
+        self.assertEqual(AttributeDeserializer().deserialize({'S': 'value'}), 'value')
+        self.assertEqual(AttributeDeserializer().deserialize({'N': '42'}), 42)
+        self.assertEqual(AttributeDeserializer().deserialize({'N': '-1.10'}), -1.1)
+        self.assertIsInstance(AttributeDeserializer().deserialize({'N': '-1.10'}), float)
+        self.assertEqual(AttributeDeserializer().deserialize({'B': 'dGVzdA=='}), 'dGVzdA==')
+        self.assertIs(AttributeDeserializer().deserialize({'BOOL': False}), False)
+        self.assertIsNone(AttributeDeserializer().deserialize({'NULL': True}))
+
+    def test_deserialize_datetime_strings(self):
+        self.assertEqual(AttributeDeserializer().deserialize({'S': '2020-01-02T03:04:05.123456'}), datetime.datetime(2020, 1, 2, 3, 4, 5, 123456))
+        self.assertEqual(AttributeDeserializer().deserialize({'S': '2020-01-02T03:04:05'}), '2020-01-02T03:04:05')
+        self.assertEqual(AttributeDeserializer().deserialize({'S': 'Time.Out'}), 'Time.Out')
+
+    def test_deserialize_sets(self):
+        self.assertListEqual(AttributeDeserializer().deserialize({'SS': ['a', 'b']}), ['a', 'b'])
+        self.assertSetEqual(AttributeDeserializer().deserialize({'NS': ['1', '0.1']}), {'1', '0.1'})
+        self.assertSetEqual(AttributeDeserializer().deserialize({'BS': ['dGVzdA==']}), {'dGVzdA=='})
+
+    def test_deserialize_matches_dynamodb_json(self):
+        image = {
+            'created': {'S': '2020-01-02T03:04:05.1'},
+            'name': {'S': 'value'},
+            'price': {'N': '-1.10'},
+            'count': {'N': '3'},
+            'blob': {'B': 'dGVzdA=='},
+            'tags': {'SS': ['x', 'y']},
+            'scores': {'NS': ['1', '0.1']},
+            'blobs': {'BS': ['dGVzdA==']},
+            'nested': {'M': {'items': {'L': [{'S': '2021-05-06T07:08:09.000001'}, {'NULL': True}, {'BOOL': True}]}}}
+        }
+        expected = {
+            'created': datetime.datetime(2020, 1, 2, 3, 4, 5, 100000),
+            'name': 'value',
+            'price': -1.1,
+            'count': 3,
+            'blob': 'dGVzdA==',
+            'tags': ['x', 'y'],
+            'scores': {'1', '0.1'},
+            'blobs': {'dGVzdA=='},
+            'nested': {'items': [datetime.datetime(2021, 5, 6, 7, 8, 9, 1), None, True]}
+        }
+        self.assertDictEqual(AttributeDeserializer().deserialize_image(image), expected)
+
+    def test_deserialize_opt_in_exact_types(self):
+        deserializer = AttributeDeserializer(use_decimal=True, decode_binary=True)
+        self.assertEqual(deserializer.deserialize({'N': '-1.10'}), decimal.Decimal('-1.10'))
+        self.assertEqual(deserializer.deserialize({'N': '1E+2'}), decimal.Decimal('1E+2'))
+        self.assertEqual(deserializer.deserialize({'B': 'dGVzdA=='}), b'test')
+        self.assertSetEqual(deserializer.deserialize({'NS': ['1', '0.1']}), {1, decimal.Decimal('0.1')})
+        self.assertSetEqual(deserializer.deserialize({'BS': ['dGVzdA==']}), {b'test'})
+
+    def test_deserialize_nested_image(self):
+        image = {
+            'id': {'S': '123'},
+            'profile': {'M': {'scores': {'L': [{'N': '1'}, {'N': '2.50'}]}, 'tags': {'SS': ['x']}}}
+        }
+        expected = {'id': '123', 'profile': {'scores': [1, 2.5], 'tags': ['x']}}
+        self.assertDictEqual(AttributeDeserializer().deserialize_image(image), expected)
+
+    def test_deserialize_empty_image(self):
+        self.assertDictEqual(AttributeDeserializer().deserialize_image(None), {})
+
+    def test_deserialize_unknown_type(self):
+        with self.assertRaises(ValueError):
+            AttributeDeserializer().deserialize({'X': 'value'})
+
+    def test_is_equal_ignores_set_order(self):
+        self.assertTrue(AttributeDeserializer.is_equal({'SS': ['a', 'b']}, {'SS': ['b', 'a']}))
+        self.assertTrue(AttributeDeserializer.is_equal({'M': {'tags': {'NS': ['1', '2']}}}, {'M': {'tags': {'NS': ['2', '1']}}}))
+
+    def test_is_equal_detects_changes(self):
+        self.assertFalse(AttributeDeserializer.is_equal({'S': 'a'}, {'S': 'b'}))
+        self.assertFalse(AttributeDeserializer.is_equal({'S': '1'}, {'N': '1'}))
+        self.assertFalse(AttributeDeserializer.is_equal({'L': [{'S': 'a'}]}, {'L': [{'S': 'a'}, {'S': 'b'}]}))
+        self.assertFalse(AttributeDeserializer.is_equal(None, {'S': 'a'}))
@@ -1,3 +1,7 @@
+import copy
+import decimal
+import threading
+import time
 import unittest
 
 from chilo_sls.dynamodb.event import Event
@@ -25,6 +29,59 @@ class DynamoDBEventTest(unittest.TestCase):
         'transportation': ['public-transit', 'car-access']
     }
 
+    def test_event_filters_unchanged_fields(self):
+        event = Event(self.updated_event, changed_fields=['note', 'personal'])
+        self.assertEqual(len(event.records), 0)
+
+    def test_event_keeps_changed_fields(self):
+        event = Event(self.updated_event, changed_fields=['active'])
+        self.assertEqual(len(event.records), 1)
+        self.assertDictEqual(event.records[0].diff, {'active': {'old': False, 'new': True}})
+
+    def test_event_passes_deserializer_options(self):
+        event_data = {'Records': [{'eventSource': 'aws:dynamodb', 'dynamodb': {'NewImage': {'price': {'N': '1.10'}, 'blob': {'B': 'dGVzdA=='}}}}]}
+        self.assertDictEqual(Event(event_data).records[0].body, {'price': 1.1, 'blob': 'dGVzdA=='})
+        exact_body = Event(event_data, use_decimal=True, decode_binary=True).records[0].body
+        self.assertDictEqual(exact_body, {'price': decimal.Decimal('1.10'), 'blob': b'test'})
+
+    def __get_key_event(self, example_ids):
+        event_data = {'Records': []}
+        for index, example_id in enumerate(example_ids):
+            record = copy.deepcopy(self.updated_event['Records'][0])
+            record['dynamodb']['SequenceNumber'] = f'{index}'
+            record['dynamodb']['Keys'] = {'example_id': {'S': example_id}}
+            event_data['Records'].append(record)
+        return event_data
+
+    def test_event_concurrency_preserves_order_per_key(self):
+        processed = []
+        lock = threading.Lock()
+
+        def handler(record):
+            time.sleep(0.05 - int(record.sequence_number) * 0.01)
+            with lock:
+                processed.append(record.sequence_number)
+
+        event = Event(self.__get_key_event(['a'] * 5), concurrency=5, preserve_order=True)
+        event.process_records(handler)
+        self.assertListEqual(processed, ['0', '1', '2', '3', '4'])
+
+    def test_event_concurrency_skips_key_after_failure(self):
+        processed = []
+        lock = threading.Lock()
+
+        def handler(record):
+            with lock:
+                processed.append(record.sequence_number)
+            if record.sequence_number == '1':
+                raise ValueError('poison record')
+
+        event = Event(self.__get_key_event(['a', 'a', 'b', 'a', 'b']), concurrency=2, preserve_order=True, batch_item_failures=True)
+        result = event.process_records(handler)
+        self.assertNotIn('3', processed)
+        self.assertLess(processed.index('2'), processed.index('4'))
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': '1'}, {'itemIdentifier': '3'}]})
+
     def test_event_accepts_event(self):
         event = Event(self.created_event)
         self.assertEqual(event.context, None)
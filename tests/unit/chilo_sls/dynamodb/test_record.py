@@ -1,5 +1,7 @@
 import unittest
+from unittest.mock import patch
 
+from chilo_sls.dynamodb.deserializer import AttributeDeserializer
 from chilo_sls.dynamodb.record import Record
 
 from tests.unit.mocks.dynamodb import mock_event
@@ -10,6 +12,13 @@ class DynamoDBRecordTest(unittest.TestCase):
     updated_record = mock_event.get_updated_event()['Records'][0]
     deleted_record = mock_event.get_deleted_event()['Records'][0]
 
+    def test_record_ordering_key_is_canonical_keys(self):
+        first = Record({'dynamodb': {'Keys': {'pk': {'S': 'a'}, 'sk': {'N': '1'}}}})
+        second = Record({'dynamodb': {'Keys': {'sk': {'N': '1'}, 'pk': {'S': 'a'}}}})
+        self.assertEqual(first.ordering_key, second.ordering_key)
+        self.assertNotEqual(first.ordering_key, Record({'dynamodb': {'Keys': {'pk': {'S': 'b'}, 'sk': {'N': '1'}}}}).ordering_key)
+        self.assertIsNone(Record({'dynamodb': {}}).ordering_key)
+
     def test_record_accepts_event(self):
         record = Record(self.created_record)
         expected_keys = {'example_id': '123456789'}
@@ -62,3 +71,43 @@ class DynamoDBRecordTest(unittest.TestCase):
         except Exception as error:
             print(error)
             self.assertTrue(False)
+
+    def test_record_caches_images(self):
+        deserializer = AttributeDeserializer()
+        record = Record(self.updated_record, deserializer=deserializer)
+        with patch.object(deserializer, 'deserialize_image', wraps=deserializer.deserialize_image) as mock_deserialize:
+            self.assertIs(record.new_image, record.body)
+            self.assertIsNot(record.old_image, record.new_image)
+            self.assertEqual(record.operation, record.UPDATED)
+            print(record)
+        self.assertEqual(mock_deserialize.call_count, 3)
+
+    def test_record_uses_event_deserializer_options(self):
+        image = {'price': {'N': '1.10'}, 'blob': {'B': 'dGVzdA=='}}
+        raw_record = {'dynamodb': {'NewImage': image}}
+        self.assertDictEqual(Record(raw_record).new_image, {'price': 1.1, 'blob': 'dGVzdA=='})
+        exact = Record(raw_record, deserializer=AttributeDeserializer(use_decimal=True, decode_binary=True))
+        self.assertEqual(exact.new_image['blob'], b'test')
+
+    def test_record_operation_does_not_deserialize(self):
+        deserializer = AttributeDeserializer()
+        record = Record(self.created_record, deserializer=deserializer)
+        with patch.object(deserializer, 'deserialize_image') as mock_deserialize:
+            self.assertEqual(record.operation, record.CREATED)
+        mock_deserialize.assert_not_called()
+
+    def test_record_changed_attributes(self):
+        record = Record(self.updated_record)
+        self.assertEqual(record.changed_attributes, frozenset({'active'}))
+        self.assertTrue(record.has_changed(['active', 'note']))
+        self.assertFalse(record.has_changed(['note']))
+
+    def test_record_changed_attributes_on_created(self):
+        record = Record(self.created_record)
+        self.assertEqual(record.changed_attributes, frozenset(record.new_image.keys()))
+
+    def test_record_diff_only_deserializes_changes(self):
+        record = Record(self.updated_record)
+        with patch('chilo_sls.dynamodb.record.AttributeDeserializer.deserialize_image') as mock_deserialize:
+            self.assertDictEqual(record.diff, {'active': {'old': False, 'new': True}})
+        mock_deserialize.assert_not_called()
@@ -1,10 +1,11 @@
 import unittest
+from unittest import mock
 
 from chilo_sls.common.records.exception import EventTimeOutException
 
 from tests.unit.mocks.generic import mock_event
 from tests.unit.mocks.generic.mock_class import MockDataClass
-from tests.unit.mocks.generic.mock_functions import mock_generic, mock_timeout, before_call, after_call, call_list, mock_generic_dc
+from tests.unit.mocks.generic.mock_functions import mock_generic, mock_timeout, before_call, after_call, call_list, mock_generic_dc, mock_generic_async, mock_context_deadline
 
 
 class GenericRequirementsTest(unittest.TestCase):
@@ -33,3 +34,13 @@ class GenericRequirementsTest(unittest.TestCase):
             self.assertTrue(False)
         except EventTimeOutException as error:
             self.assertTrue(isinstance(error, EventTimeOutException))
+
+    def test_decorator_with_context_deadline(self):
+        context = mock.Mock()
+        context.get_remaining_time_in_millis.return_value = 100
+        with self.assertRaises(EventTimeOutException):
+            mock_context_deadline(self.basic_event, context)
+
+    def test_generic_decorator_with_async_function(self):
+        result = mock_generic_async(self.basic_event, None)
+        self.assertDictEqual(result, {'generic_async': {'key': 'value'}})
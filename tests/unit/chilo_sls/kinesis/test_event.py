@@ -1,8 +1,9 @@
+import copy
 import unittest
 
 from chilo_sls.kinesis.event import Event
 from chilo_sls.kinesis.record import Record
-from chilo_sls.common.records.exception import RecordException
+from chilo_sls.common.records.exception import EventException, RecordException
 
 from tests.unit.mocks.kinesis import mock_event
 from tests.unit.mocks.kinesis.mock_data_class import MockKinesisDataClass
@@ -39,6 +40,23 @@ class FirehoseEventTest(unittest.TestCase):
         self.assertTrue(isinstance(event.records[0], MockKinesisDataClass))
         self.assertTrue(isinstance(event.records[0].record, Record))
 
+    def test_event_process_records_stops_at_first_failure(self):
+        event_data = copy.deepcopy(self.basic_event)
+        for index in range(2):
+            record = copy.deepcopy(self.basic_event['Records'][0])
+            record['kinesis']['sequenceNumber'] = f'{index}'
+            event_data['Records'].append(record)
+        processed = []
+
+        def handler(record):
+            processed.append(record.sequence_number)
+            if record.sequence_number == '0':
+                raise ValueError('poison record')
+
+        result = Event(event_data, batch_item_failures=True).process_records(handler)
+        self.assertListEqual(processed, [self.basic_event['Records'][0]['kinesis']['sequenceNumber'], '0'])
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': '0'}]})
+
     def test_event_validate_record_body_with_schema_file(self):
         event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-kinesis-body')
         self.assertDictEqual(event.records[0].body, self.expected_body)
@@ -131,6 +149,16 @@ class FirehoseEventTest(unittest.TestCase):
         event = Event(self.basic_event, openapi=self.schema_path, required_body=schema)
         self.assertEqual(len(event.records), 0)
 
+    def test_event_concurrency_requires_preserve_order(self):
+        event = Event(self.basic_event, concurrency=2, batch_item_failures=True)
+        with self.assertRaises(EventException) as context:
+            event.process_records(lambda record: record)
+        self.assertEqual('concurrency requires preserve_order for ordered stream sources (kinesis, dynamodb)', context.exception.message)
+
+    def test_event_concurrency_with_preserve_order_processes_records(self):
+        event = Event(self.basic_event, concurrency=2, preserve_order=True)
+        self.assertEqual(len(event.process_records(lambda record: record)), len(self.basic_event['Records']))
+
     def test_event_print(self):
         event = Event(self.basic_event)
         try:
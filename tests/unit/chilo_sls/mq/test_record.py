@@ -1,7 +1,9 @@
 import base64
 import json
 import unittest
+from unittest.mock import patch
 
+from chilo_sls.common.json_helper import JsonHelper
 from chilo_sls.mq.record import Record
 
 from tests.unit.mocks.mq import mock_event
@@ -38,3 +40,20 @@ class MQRecordTest(unittest.TestCase):
         except Exception as error:
             print(error)
             self.assertTrue(False)
+
+    def test_record_decodes_data_once(self):
+        record = Record(self.basic_record)
+        with patch('chilo_sls.base.record.JsonHelper.decode', wraps=JsonHelper.decode) as mock_decode:
+            first = record.data
+            self.assertIs(record.body, first)
+            print(record)
+        self.assertEqual(mock_decode.call_count, 1)
+
+    def test_record_exposes_raw_data(self):
+        record = Record(self.basic_record)
+        self.assertEqual(record.raw_data, base64.b64decode(self.basic_record['data']))
+        self.assertIsInstance(record.raw_data, bytes)
+
+    def test_record_uses_slots(self):
+        record = Record(self.basic_record)
+        self.assertFalse(hasattr(record, '__dict__'))
@@ -41,6 +41,37 @@ class MSKEventTest(unittest.TestCase):
         self.assertTrue(isinstance(event.records[0], MockMSKDataClass))
         self.assertTrue(isinstance(event.records[0].record, Record))
 
+    def test_event_iter_records_yields_records(self):
+        event = Event(self.basic_event)
+        records = event.iter_records()
+        first = next(records)
+        self.assertTrue(isinstance(first, Record))
+        self.assertEqual(1 + len(list(records)), len(event.records))
+
+    def test_event_stream_records_validates_each_record(self):
+        event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-msk-body', stream=True)
+        self.assertFalse(isinstance(event.records, list))
+        for record in event.records:
+            self.assertDictEqual(record.body, self.expected_body)
+
+    def test_event_stream_records_raises_lazily(self):
+        event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-msk-body-wrong', raise_body_error=True, stream=True)
+        records = event.records
+        with self.assertRaises(RecordException):
+            next(records)
+
+    def test_event_stream_returns_data_class(self):
+        event = Event(self.basic_event, stream=True)
+        event.data_class = MockMSKDataClass
+        self.assertTrue(isinstance(next(event.records), MockMSKDataClass))
+
+    def test_event_process_records_raises_without_item_identifier(self):
+        def handler(record):
+            raise ValueError('poison record')
+
+        with self.assertRaises(ValueError):
+            Event(self.basic_event).process_records(handler)
+
     def test_event_validate_record_body_with_schema_file(self):
         event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-msk-body')
         self.assertDictEqual(event.records[0].body, self.expected_body)
@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import patch
+
+from chilo_sls.s3.client_pool import S3ClientPool
+
+
+class S3ClientPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        S3ClientPool.clear()
+
+    def tearDown(self):
+        S3ClientPool.clear()
+
+    @patch('chilo_sls.s3.client_pool.boto3.client')
+    def test_get_client_reuses_client(self, mock_client):
+        first = S3ClientPool.get_client(region_name='us-east-2')
+        second = S3ClientPool.get_client(region_name='us-east-2')
+        self.assertIs(first, second)
+        mock_client.assert_called_once_with('s3', region_name='us-east-2')
+
+    @patch('chilo_sls.s3.client_pool.boto3.client', side_effect=lambda *args, **kwargs: object())
+    def test_get_client_pools_by_kwargs(self, _):
+        first = S3ClientPool.get_client(region_name='us-east-1')
+        second = S3ClientPool.get_client(region_name='us-east-2')
+        self.assertIsNot(first, second)
+
+    @patch('chilo_sls.s3.client_pool.boto3.client', side_effect=lambda *args, **kwargs: object())
+    def test_clear_drops_clients(self, _):
+        first = S3ClientPool.get_client()
+        S3ClientPool.clear()
+        self.assertIsNot(first, S3ClientPool.get_client())
@@ -1,8 +1,14 @@
+import copy
+import gzip
+import types
 import unittest
+from unittest.mock import patch
 from moto import mock_aws
 import boto3
+from concurrent.futures import ThreadPoolExecutor
 import jsonpickle
 
+from chilo_sls.s3.client_pool import S3ClientPool
 from chilo_sls.s3.event import Event
 from chilo_sls.s3.record import Record
 from chilo_sls.common.records.exception import RecordException
@@ -31,6 +37,7 @@ class S3EventTest(unittest.TestCase):
 
     def setUp(self):
         self.mock_aws.start()
+        S3ClientPool.clear()
         self.bucket_name = self.basic_event['Records'][0]['s3']['bucket']['name']
         self.s3_json_key = self.basic_event['Records'][0]['s3']['object']['key']
         self.s3_csv_key = self.csv_event['Records'][0]['s3']['object']['key']
@@ -73,6 +80,68 @@ class S3EventTest(unittest.TestCase):
         event = Event(self.csv_event, get_object=True, data_type='csv')
         self.assertCountEqual(event.records[0].body, self.expected_csv_data)
 
+    def test_event_fetches_objects_in_parallel(self):
+        event_data = copy.deepcopy(self.basic_event)
+        event_data['Records'].append(copy.deepcopy(self.csv_event['Records'][0]))
+        event_data['Records'].append(copy.deepcopy(self.basic_event['Records'][0]))
+        with patch('chilo_sls.s3.event.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            event = Event(event_data, get_object=True, max_workers=3)
+            records = event.records
+        mock_executor.assert_called_once_with(max_workers=3)
+        self.assertListEqual([record.key for record in records], [self.s3_json_key, self.s3_csv_key, self.s3_json_key])
+        self.assertEqual(records[1].body.read().decode('utf-8'), '\n'.join(self.starting_csv_string))
+
+    def test_event_fetches_objects_sequentially_with_single_worker(self):
+        event_data = copy.deepcopy(self.basic_event)
+        event_data['Records'].append(copy.deepcopy(self.basic_event['Records'][0]))
+        with patch('chilo_sls.s3.event.ThreadPoolExecutor') as mock_executor:
+            event = Event(event_data, get_object=True, data_type='json', max_workers=1)
+            self.assertDictEqual(event.records[1].body, self.expected_json_data)
+        mock_executor.assert_not_called()
+
+    def test_event_reuses_pooled_client(self):
+        first = Event(self.basic_event, get_object=True, data_type='json')
+        second = Event(self.basic_event, get_object=True, data_type='json')
+        with patch('chilo_sls.s3.client_pool.boto3.client', wraps=boto3.client) as mock_client:
+            print(first.records, second.records)
+        self.assertEqual(mock_client.call_count, 1)
+
+    def __put_object(self, key, body, **kwargs):
+        boto3.client('s3').put_object(Bucket=self.bucket_name, Key=key, Body=body, **kwargs)
+        event_data = copy.deepcopy(self.csv_event)
+        event_data['Records'][0]['s3']['object']['key'] = key
+        return event_data
+
+    def test_event_streams_csv_rows(self):
+        event = Event(self.csv_event, get_object=True, data_type='csv', stream_body=True)
+        rows = event.records[0].body
+        self.assertTrue(isinstance(rows, types.GeneratorType))
+        self.assertListEqual(list(rows), self.expected_csv_data)
+
+    def test_event_streams_gzip_json_lines_in_batches(self):
+        body = gzip.compress(b'{"id": 1}\n{"id": 2}\n{"id": 3}\n')
+        event_data = self.__put_object('rows.jsonl.gz', body)
+        event = Event(event_data, get_object=True, data_type='jsonl', stream_body=True, batch_size=2)
+        self.assertListEqual(list(event.records[0].body), [[{'id': 1}, {'id': 2}], [{'id': 3}]])
+
+    def test_event_streams_validated_rows(self):
+        event_data = self.__put_object('rows.jsonl', b'{"id": 1}\n{"id": "bad"}\n{"id": 3}\n')
+        schema = {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'integer'}}}
+        event = Event(event_data, get_object=True, data_type='jsonl', stream_body=True, required_body=schema)
+        self.assertListEqual(list(event.records[0].body), [{'id': 1}, {'id': 3}])
+
+    def test_event_streams_validated_rows_raise_error(self):
+        event_data = self.__put_object('rows.jsonl', b'{"id": "bad"}\n')
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+        event = Event(event_data, get_object=True, data_type='jsonl', stream_body=True, required_body=schema, raise_body_error=True)
+        with self.assertRaises(RecordException):
+            list(event.records[0].body)
+
+    def test_event_reads_gzip_csv_object(self):
+        event_data = self.__put_object('rows.csv', gzip.compress('\n'.join(self.starting_csv_string).encode('utf-8')), ContentEncoding='gzip')
+        event = Event(event_data, get_object=True, data_type='csv')
+        self.assertListEqual(event.records[0].body, self.expected_csv_data)
+
     def test_event_validate_record_body_with_schema_file(self):
         event = Event(
             self.basic_event,
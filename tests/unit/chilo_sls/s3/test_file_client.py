@@ -0,0 +1,90 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from botocore.exceptions import ClientError
+
+from chilo_sls.common.records.exception import EventException
+from chilo_sls.s3.event import Event
+from chilo_sls.s3.file_client import FileS3Client
+
+from tests.unit.mocks.s3 import mock_event
+
+
+class FileS3ClientTest(unittest.TestCase):
+    csv_string = 'Name,Job,Age\nAlice,Programmer,23\nBob,Executive,34\nCarl,Sales,45\n'
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.client = FileS3Client(self.directory.name)
+        self.__write('bucket', 'people.csv', self.csv_string.encode('utf-8'))
+        self.__write('bucket', 'people.csv.gz', gzip.compress(self.csv_string.encode('utf-8')))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __write(self, bucket, key, data):
+        os.makedirs(os.path.join(self.directory.name, bucket), exist_ok=True)
+        with open(os.path.join(self.directory.name, bucket, key), 'wb') as s3_file:
+            s3_file.write(data)
+
+    def __get_event(self, key):
+        event = mock_event.get_basic_csv()
+        event['Records'][0]['s3']['bucket']['name'] = 'bucket'
+        event['Records'][0]['s3']['object']['key'] = key
+        return event
+
+    def test_get_object_reads_file(self):
+        s3_object = self.client.get_object(Bucket='bucket', Key='people.csv')
+        self.assertEqual(s3_object['Body'].read().decode('utf-8'), self.csv_string)
+        self.assertEqual(s3_object['ContentLength'], len(self.csv_string))
+
+    def test_get_object_reads_range(self):
+        s3_object = self.client.get_object(Bucket='bucket', Key='people.csv', Range='bytes=0-3')
+        self.assertEqual(s3_object['Body'].read(), b'Name')
+        self.assertEqual(s3_object['ContentRange'], f'bytes 0-3/{len(self.csv_string)}')
+
+    def test_get_object_reads_suffix_range(self):
+        s3_object = self.client.get_object(Bucket='bucket', Key='people.csv', Range='bytes=-3')
+        self.assertEqual(s3_object['Body'].read(), b'45\n')
+
+    def test_get_object_marks_gzip(self):
+        s3_object = self.client.get_object(Bucket='bucket', Key='people.csv.gz')
+        self.assertEqual(s3_object['ContentEncoding'], 'gzip')
+
+    def test_get_object_raises_missing_key(self):
+        with self.assertRaises(ClientError):
+            self.client.get_object(Bucket='bucket', Key='missing.csv')
+
+    def test_event_reads_max_bytes(self):
+        event = Event(self.__get_event('people.csv'), get_object=True, data_type='csv', s3_client=self.client, max_bytes=40)
+        self.assertListEqual(event.records[0].body, [{'Name': 'Alice', 'Job': 'Programmer', 'Age': '23'}])
+
+    def test_event_reads_byte_range_with_fieldnames(self):
+        event = Event(
+            self.__get_event('people.csv'),
+            get_object=True,
+            data_type='csv',
+            s3_client=self.client,
+            byte_range=(20, None),
+            fieldnames=['Name', 'Job', 'Age']
+        )
+        self.assertListEqual([row['Name'] for row in event.records[0].body], ['Bob', 'Carl'])
+
+    def test_event_rejects_csv_byte_range_without_fieldnames(self):
+        with self.assertRaises(EventException):
+            Event(self.__get_event('people.csv'), get_object=True, data_type='csv', s3_client=self.client, byte_range='bytes=20-')
+
+    def test_event_rejects_byte_range_of_gzip(self):
+        event = Event(self.__get_event('people.csv.gz'), get_object=True, data_type='jsonl', s3_client=self.client, byte_range=(20, None))
+        with self.assertRaises(ValueError):
+            event.records
+
+    def test_event_projects_columns(self):
+        event = Event(self.__get_event('people.csv'), get_object=True, data_type='csv', s3_client=self.client, columns=['Name'])
+        self.assertListEqual(event.records[0].body, [{'Name': 'Alice'}, {'Name': 'Bob'}, {'Name': 'Carl'}])
+
+    def test_event_reads_max_bytes_of_gzip(self):
+        event = Event(self.__get_event('people.csv.gz'), get_object=True, data_type='csv', s3_client=self.client, max_bytes=40)
+        self.assertLessEqual(len(event.records[0].body), 3)
@@ -0,0 +1,85 @@
+import gzip
+import io
+import types
+import unittest
+
+from chilo_sls.s3.reader import ObjectReader
+
+
+class ObjectReaderTest(unittest.TestCase):
+    csv_string = 'Name,Job\nAlice,Programmer\nBob,Executive\n'
+    jsonl_string = '{"id": 1}\n{"id": 2}\n\n{"id": 3}\n'
+    expected_csv_rows = [{'Name': 'Alice', 'Job': 'Programmer'}, {'Name': 'Bob', 'Job': 'Executive'}]
+    expected_jsonl_rows = [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    def test_reader_reads_csv_rows_lazily(self):
+        rows = ObjectReader({'Body': io.BytesIO(self.csv_string.encode('utf-8'))}, data_type='csv').iter_rows()
+        self.assertTrue(isinstance(rows, types.GeneratorType))
+        self.assertListEqual(list(rows), self.expected_csv_rows)
+
+    def test_reader_reads_csv_with_quoted_newlines(self):
+        body = io.BytesIO('Name,Note\nAlice,"line one\nline two"\n'.encode('utf-8'))
+        rows = list(ObjectReader({'Body': body}, data_type='csv').iter_rows())
+        self.assertEqual(rows[0]['Note'], 'line one\nline two')
+
+    def test_reader_reads_json_lines(self):
+        rows = ObjectReader({'Body': io.BytesIO(self.jsonl_string.encode('utf-8'))}, data_type='jsonl').iter_rows()
+        self.assertListEqual(list(rows), self.expected_jsonl_rows)
+
+    def test_reader_reads_gzip_by_key(self):
+        body = io.BytesIO(gzip.compress(self.jsonl_string.encode('utf-8')))
+        reader = ObjectReader({'Body': body}, data_type='jsonl', key='data/file.jsonl.gz')
+        self.assertTrue(reader.is_compressed)
+        self.assertListEqual(list(reader.iter_rows()), self.expected_jsonl_rows)
+
+    def test_reader_reads_gzip_by_content_encoding(self):
+        body = io.BytesIO(gzip.compress(self.csv_string.encode('utf-8')))
+        reader = ObjectReader({'Body': body, 'ContentEncoding': 'gzip'}, data_type='csv')
+        self.assertListEqual(reader.read(), self.expected_csv_rows)
+
+    def test_reader_compression_option_overrides_detection(self):
+        reader = ObjectReader({'Body': io.BytesIO(b'{}')}, data_type='json', key='file.gz', compression=None)
+        self.assertTrue(reader.is_compressed)
+        reader = ObjectReader({'Body': io.BytesIO(b'{}')}, data_type='json', key='file.gz', compression='none')
+        self.assertFalse(reader.is_compressed)
+        self.assertDictEqual(reader.read(), {})
+
+    def test_reader_returns_raw_body_without_data_type(self):
+        body = io.BytesIO(gzip.compress(b'raw'))
+        reader = ObjectReader({'Body': body, 'ContentEncoding': 'gzip'}, key='file.gz')
+        self.assertIs(reader.read(), body)
+
+    def test_reader_decompresses_raw_body_with_explicit_compression(self):
+        reader = ObjectReader({'Body': io.BytesIO(gzip.compress(b'raw'))}, compression='gzip')
+        self.assertEqual(reader.read().read(), b'raw')
+
+    def test_reader_reads_json_document(self):
+        reader = ObjectReader({'Body': io.BytesIO(b'{"key": "value"}')}, data_type='json')
+        self.assertDictEqual(reader.read(), {'key': 'value'})
+
+    def test_reader_yields_raw_chunks(self):
+        reader = ObjectReader({'Body': io.BytesIO(b'abcdefgh')}, chunk_size=3)
+        self.assertListEqual(list(reader.iter_rows()), [b'abc', b'def', b'gh'])
+
+    def test_reader_iter_batches(self):
+        batches = ObjectReader.iter_batches(iter(range(5)), 2)
+        self.assertListEqual(list(batches), [[0, 1], [2, 3], [4]])
+
+    def test_reader_projects_json_columns(self):
+        body = io.BytesIO(b'[{"id": 1, "name": "a", "extra": true}, {"id": 2}]')
+        reader = ObjectReader({'Body': body}, data_type='json', columns=['id', 'name'])
+        self.assertListEqual(reader.read(), [{'id': 1, 'name': 'a'}, {'id': 2}])
+
+    def test_reader_drops_partial_lines(self):
+        body = io.BytesIO(b'd": 1}\n{"id": 2}\n{"id": 3}\n{"i')
+        reader = ObjectReader({'Body': body, 'ContentRange': 'bytes 10-45/100'}, data_type='jsonl')
+        self.assertTrue(reader.is_partial)
+        self.assertListEqual(list(reader.iter_rows()), [{'id': 2}, {'id': 3}])
+
+    def test_reader_rejects_partial_csv_without_fieldnames(self):
+        with self.assertRaises(ValueError):
+            ObjectReader({'Body': io.BytesIO(b'Alice,Programmer\n'), 'ContentRange': 'bytes 10-45/100'}, data_type='csv')
+
+    def test_reader_rejects_partial_gzip(self):
+        with self.assertRaises(ValueError):
+            ObjectReader({'Body': io.BytesIO(b''), 'ContentRange': 'bytes 10-45/100'}, data_type='jsonl', compression='gzip')
@@ -1,5 +1,15 @@
+import asyncio
+import copy
+import io
+import json
+import os
+import threading
+import time
 import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
 
+from chilo_sls.common.logger.common_logger import CommonLogger
 from chilo_sls.sqs.event import Event
 from chilo_sls.sqs.record import Record
 from chilo_sls.common.records.exception import RecordException
@@ -39,6 +49,171 @@ class SQSEventTest(unittest.TestCase):
         self.assertTrue(isinstance(event.records[0], MockSQSDataClass))
         self.assertTrue(isinstance(event.records[0].record, Record))
 
+    def test_event_caches_records(self):
+        event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-sqs-body')
+        with patch.object(Event, '_validate_body', wraps=event._validate_body) as mock_validate:
+            first = event.records
+            self.assertIs(event.records, first)
+            print(event)
+        self.assertEqual(mock_validate.call_count, len(self.basic_event['Records']))
+
+    def test_event_refresh_rebuilds_records(self):
+        event = Event(self.basic_event)
+        first = event.records
+        refreshed = event.refresh()
+        self.assertIsNot(refreshed, first)
+        self.assertIs(event.records, refreshed)
+        self.assertEqual(len(refreshed), len(self.basic_event['Records']))
+
+    def test_event_data_class_resets_cached_records(self):
+        event = Event(self.basic_event)
+        self.assertTrue(isinstance(event.records[0], Record))
+        event.data_class = MockSQSDataClass
+        self.assertTrue(isinstance(event.records[0], MockSQSDataClass))
+
+    def test_event_process_records_reports_failed_records(self):
+        event_data = copy.deepcopy(self.basic_event)
+        for index in range(3):
+            record = copy.deepcopy(self.basic_event['Records'][0])
+            record['messageId'] = f'message-{index}'
+            event_data['Records'].append(record)
+        processed = []
+
+        def handler(record):
+            if record.message_id in ('message-0', 'message-2'):
+                raise ValueError('poison message')
+            processed.append(record.message_id)
+
+        result = Event(event_data, batch_item_failures=True).process_records(handler)
+        self.assertListEqual(processed, [self.basic_event['Records'][0]['messageId'], 'message-1'])
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': 'message-0'}, {'itemIdentifier': 'message-2'}]})
+
+    def test_event_process_records_logs_batch_item_failures(self):
+        def handler(_):
+            raise ValueError('poison message')
+
+        with patch('chilo_sls.base.event.logger.log') as mock_log:
+            Event(self.basic_event, batch_item_failures=True).process_records(handler)
+        mock_log.assert_called_once()
+        self.assertEqual('ERROR', mock_log.call_args.kwargs['level'])
+        payload = mock_log.call_args.kwargs['log']()
+        self.assertEqual(self.basic_event['Records'][0]['messageId'], payload['item_identifier'])
+        self.assertIn('poison message', payload['error'])
+
+    @patch.dict(os.environ, {'LOG_FORMAT': 'JSON', 'LOG_LEVEL': 'INFO'})
+    def test_event_process_records_logs_failure_traceback(self):
+        CommonLogger.reset()
+        self.addCleanup(CommonLogger.reset)
+
+        def handler(_):
+            raise ValueError('poison message')
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            Event(self.basic_event, batch_item_failures=True).process_records(handler)
+        entry = json.loads(buffer.getvalue())
+        self.assertTrue(any('poison message' in line for line in entry['trace']))
+
+    def test_event_aiter_records_prefetches_with_bound(self):
+        event_data = {'Records': []}
+        for index in range(6):
+            record = copy.deepcopy(self.basic_event['Records'][0])
+            record['messageId'] = f'message-{index}'
+            event_data['Records'].append(record)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def prepare(_, __):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        async def collect(event):
+            return [record.message_id async for record in event.aiter_records(prefetch=3)]
+
+        with patch.object(Event, '_prepare_record', prepare):
+            result = asyncio.run(collect(Event(event_data)))
+        self.assertListEqual(result, [f'message-{index}' for index in range(6)])
+        self.assertGreater(peak[0], 1)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_event_process_records_reports_invalid_body_as_failure(self):
+        event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-sqs-body-wrong', raise_body_error=True, batch_item_failures=True)
+        result = event.process_records(lambda record: record)
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': self.basic_event['Records'][0]['messageId']}]})
+
+    def __get_group_event(self, group_ids):
+        event_data = {'Records': []}
+        for index, group_id in enumerate(group_ids):
+            record = copy.deepcopy(self.basic_event['Records'][0])
+            record['messageId'] = f'message-{index}'
+            record['attributes']['MessageGroupId'] = group_id
+            event_data['Records'].append(record)
+        return event_data
+
+    def test_event_process_records_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def handler(record):
+            barrier.wait()
+            return record.message_id
+
+        event = Event(self.__get_group_event(['a', 'b']), concurrency=2)
+        self.assertListEqual(event.process_records(handler), ['message-0', 'message-1'])
+
+    def test_event_process_records_concurrently_raises_without_batch_item_failures(self):
+        def handler(record):
+            raise ValueError('poison message')
+
+        with self.assertRaises(ValueError):
+            Event(self.__get_group_event(['a', 'b']), concurrency=2).process_records(handler)
+
+    def test_event_process_records_concurrently_preserves_group_order(self):
+        processed = []
+        lock = threading.Lock()
+
+        def handler(record):
+            with lock:
+                processed.append(record.message_id)
+            if record.message_id == 'message-0':
+                raise ValueError('poison message')
+
+        event = Event(self.__get_group_event(['a', 'b', 'a', 'b']), concurrency=4, preserve_order=True, batch_item_failures=True)
+        result = event.process_records(handler)
+        self.assertNotIn('message-2', processed)
+        self.assertLess(processed.index('message-1'), processed.index('message-3'))
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': 'message-0'}, {'itemIdentifier': 'message-2'}]})
+
+    def test_event_process_records_skips_fifo_group_after_failure(self):
+        processed = []
+
+        def handler(record):
+            processed.append(record.message_id)
+            if record.message_id == 'message-0':
+                raise ValueError('poison message')
+
+        event = Event(self.__get_group_event(['g', 'h', 'g', 'g']), batch_item_failures=True)
+        result = event.process_records(handler)
+        self.assertListEqual(processed, ['message-0', 'message-1'])
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': 'message-0'}, {'itemIdentifier': 'message-2'}, {'itemIdentifier': 'message-3'}]})
+
+    def test_event_aprocess_records_skips_fifo_group_after_failure(self):
+        processed = []
+
+        async def handler(record):
+            processed.append(record.message_id)
+            if record.message_id == 'message-0':
+                raise ValueError('poison message')
+
+        event = Event(self.__get_group_event(['g', 'h', 'g']), batch_item_failures=True)
+        result = asyncio.run(event.aprocess_records(handler))
+        self.assertListEqual(processed, ['message-0', 'message-1'])
+        self.assertDictEqual(result, {'batchItemFailures': [{'itemIdentifier': 'message-0'}, {'itemIdentifier': 'message-2'}]})
+
     def test_event_validate_record_body_with_schema_file(self):
         event = Event(self.basic_event, openapi=self.schema_path, required_body='v1-sqs-body')
         self.assertDictEqual(event.records[0].body, self.expected_body)
@@ -31,3 +31,16 @@ def mock_on_startup():
 
 def mock_on_shutdown():
     mock_on_shutdown.has_been_called = True
+
+
+async def mock_async_on_error(request, response, error):
+    mock_async_on_error.has_been_called = True
+    response.headers = ('x-async-on-error', 'called')
+
+
+async def mock_async_on_startup():
+    mock_async_on_startup.has_been_called = True
+
+
+async def mock_async_on_shutdown():
+    mock_async_on_shutdown.has_been_called = True
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from chilo_sls.apigateway.requirements import requirements
@@ -46,3 +47,27 @@ def patch(_, response):
     time.sleep(5)
     response.body = {'timeout_basic': 'timeout'}
     return response
+
+@requirements(timeout_ms=50)
+def put(_, response):
+    time.sleep(1)
+    response.body = {'timeout_basic': 'timeout'}
+    return response
+
+
+@requirements(timeout=1)
+def delete(request, response):
+    response.body = {'remaining_time_ms': request.remaining_time_ms}
+    return response
+
+
+async def async_before_call(request, response, reqs):
+    await asyncio.sleep(0)
+    response.headers = ('x-async-before', 'true')
+
+
+@requirements(before=async_before_call)
+async def async_post(request, response):
+    await asyncio.sleep(0)
+    response.body = {'requirements_async': True}
+    return response
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from chilo_sls.common.records.requirements import requirements
@@ -11,3 +12,24 @@ def mock_func_verbose(event):
 def mock_func_timeout(event):
     time.sleep(5)
     return event
+
+@requirements(stream=True)
+def mock_func_stream(event):
+    return event.records
+
+@requirements(batch_item_failures=True)
+def mock_func_batch_item_failures(record):
+    if record.body.get('fail'):
+        raise ValueError('poison message')
+
+mock_timeout_side_effects = []
+
+@requirements(batch_item_failures=True, timeout_ms=50)
+def mock_func_batch_timeout(record):
+    time.sleep(0.3)
+    mock_timeout_side_effects.append(record)
+
+@requirements(batch_item_failures=True, timeout_ms=50)
+async def mock_func_async_batch_timeout(record):
+    await asyncio.sleep(0.3)
+    mock_timeout_side_effects.append(record)
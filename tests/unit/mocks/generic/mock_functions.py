@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from chilo_sls.generic.requirements import requirements
@@ -38,3 +39,15 @@ def mock_generic_dc(data_class):
 def mock_timeout(event):
     time.sleep(5)
     return event
+
+
+@requirements()
+async def mock_generic_async(event):
+    await asyncio.sleep(0)
+    return {'generic_async': event.body}
+
+
+@requirements(use_context_deadline=True, deadline_buffer_ms=50)
+def mock_context_deadline(event):
+    time.sleep(1)
+    return event